@@ -18,7 +18,10 @@ class ArticleDict(TypedDict, total=False):
     title_ko: Optional[str]
     keywords: Optional[str]
     doi: Optional[str]
+    feed_url: Optional[str]  # RSS 항목의 피드 URL (처리 후 피드 수위 갱신용)
     category: Optional[str]  # 'News', 'News-KR', 'Journal', 'Academic'
+    settled: bool  # 저장됐거나 이미 저장돼 있음 (수집 실행 중 상태)
+    duplicates: List["ArticleDict"]  # 이번 실행에서 이 아이템과 겹쳐 건너뛴 아이템
 
 
 class SummaryResult(TypedDict):
@@ -47,11 +50,35 @@ class StageStats:
     skipped: int = 0
     duration_seconds: float = 0.0
     errors: List[Dict[str, Any]] = field(default_factory=list)
+    # 스트리밍 단계 지표 (backend.pipeline)
+    emitted: int = 0  # 다음 단계로 넘긴 건수
+    throughput_per_second: float = 0.0  # 처리 건수 / 단계 실행 시간
+    queue_capacity: int = 0  # 입력 큐 상한 (0 = 큐 없음)
+    max_queue_depth: int = 0  # 관측된 최대 입력 큐 길이
+    avg_queue_depth: float = 0.0  # 항목을 꺼낼 때마다 관측한 큐 길이 평균
 
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
 
 
+@dataclass
+class FeedFetchStats:
+    """RSS 조건부 요청 통계"""
+
+    feeds_requested: int = 0
+    feeds_not_modified: int = 0  # 304 응답
+    feeds_unchanged: int = 0  # 200이지만 본문 해시가 이전과 동일
+    bytes_downloaded: int = 0
+    bytes_saved: int = 0  # 304 응답으로 받지 않은 본문 크기 (이전 크기 기준 추정)
+
+    @property
+    def feeds_skipped(self) -> int:
+        return self.feeds_not_modified + self.feeds_unchanged
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "feeds_skipped": self.feeds_skipped}
+
+
 @dataclass
 class PipelineReport:
     """파이프라인 실행 리포트"""
@@ -59,8 +86,11 @@ class PipelineReport:
     started_at: datetime = field(default_factory=datetime.now)
     ended_at: Optional[datetime] = None
     collection: Dict[str, StageStats] = field(default_factory=dict)
+    stages: Dict[str, StageStats] = field(default_factory=dict)  # dedup/balance/summarize/save
+    rss_fetch: FeedFetchStats = field(default_factory=FeedFetchStats)
     summarization: Optional[StageStats] = None
     saving: Optional[StageStats] = None
+    rate_limits: Dict[str, Dict[str, float]] = field(default_factory=dict)  # upstream별 버킷 통계
 
     @property
     def duration_seconds(self) -> float:
@@ -82,8 +112,11 @@ class PipelineReport:
             "ended_at": self.ended_at.isoformat() if self.ended_at else None,
             "duration_seconds": self.duration_seconds,
             "collection": {k: v.to_dict() for k, v in self.collection.items()},
+            "stages": {k: v.to_dict() for k, v in self.stages.items()},
+            "rss_fetch": self.rss_fetch.to_dict(),
             "summarization": self.summarization.to_dict() if self.summarization else None,
             "saving": self.saving.to_dict() if self.saving else None,
+            "rate_limits": self.rate_limits,
             "summary": {
                 "total_collected": self.total_collected,
                 "total_saved": self.total_saved,
@@ -1,10 +1,10 @@
 import sys
 import os
 import logging
-import time
 import json
-from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError
+import heapq
+import threading
+from datetime import datetime, timezone
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -15,22 +15,24 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 from backend.config import settings
-from backend.database import SessionLocal, engine, Base
-from backend.collector.rss_collector import RSSCollector
-from backend.collector.pubmed_collector import PubMedCollector
-from backend.collector.scholar_collector import GoogleScholarCollector
-from backend.processor.summarizer import Summarizer
-from backend.processor.relevance_filter import MedicalRelevanceFilter
+from backend.database import ReadSessionLocal, SessionLocal, init_db
 from backend.article_types import PipelineReport, StageStats, ArticleDict
 from backend import crud, models
+from backend.data_version import bump_data_version
+from backend.pipeline import Pipeline, Producer, Stage
+from backend.url_index import get_url_index
+from backend.utils.canonical import identity_keys
 from typing import List
 
-# Creates tables if they don't exist
-Base.metadata.create_all(bind=engine)
+# 수집기/프로세서(openai, feedparser, pymed, scholarly)는 무거우므로 사용하는
+# 함수 안에서 임포트한다. 스케줄러를 등록하는 API 서버 시작이 느려지지 않도록.
+# 스키마 생성은 import 시점이 아니라 명시적 마이그레이션(backend.migrate)에서 수행한다.
 
 MAX_SUMMARY_WORKERS = settings.MAX_SUMMARY_WORKERS
 SCHOLAR_COLLECTION_TIMEOUT = settings.SCHOLAR_TIMEOUT
 COLLECTION_TIMEOUT = 120  # RSS/PubMed 수집 타임아웃
+QUEUE_SIZE = settings.PIPELINE_QUEUE_SIZE  # 단계 간 큐 상한 (backpressure)
+DEDUP_BATCH_SIZE = 50  # 중복 제거 시 한 번에 DB와 대조할 최대 아이템 수
 
 # 뉴스 소스 정의
 NEWS_SOURCES = {
@@ -74,53 +76,91 @@ def categorize_source(source_name: str, source_type: str = None) -> tuple[str, s
     return "paper", source_type
 
 
-def _collect_rss(relevance_filter=None):
-    """RSS 피드 수집"""
+def _categorize(items, source_type):
+    """수집 결과에 category/source_type 재분류 (PubMed/Scholar는 original_abstract도 설정)"""
+    for item in items:
+        if source_type != 'RSS':
+            item['original_abstract'] = item.get('summary', '')
+        category, item['source_type'] = categorize_source(item.get('source', ''), source_type)
+        item['category'] = category
+    return items
+
+
+def _iter_rss(relevance_filter=None, feed_states=None, fetch_stats=None, run_state=None):
+    """RSS 피드 수집 (피드 단위로 yield)
+
+    feed_states는 조건부 요청에 사용되고 수집 후 새 상태로 갱신된다 (저장은 호출자).
+    이미 저장된 링크는 관련성 필터 전에 건너뛴다. 수집기는 run_state['collector']에
+    남겨, 호출자가 처리 완료된 항목을 settle()하고 finalize()로 수위를 기록한다.
+    """
+    from backend.collector.rss_collector import RSSCollector
+
     logger.info("RSS 수집 시작...")
-    collector = RSSCollector(relevance_filter=relevance_filter)
-    results = collector.fetch_feeds()
+    collector = RSSCollector(
+        relevance_filter=relevance_filter, feed_states=feed_states, fetch_stats=fetch_stats,
+        known_links=_existing_links,
+    )
+    if run_state is not None:
+        run_state['collector'] = collector
+    for results in collector.iter_feeds():
+        yield _categorize(results, 'RSS')
+    logger.info("RSS 수집 완료")
 
-    # RSS 결과에 category/source_type 재분류
-    for item in results:
-        source_name = item.get('source', '')
-        category, source_type = categorize_source(source_name, 'RSS')
-        item['category'] = category
-        item['source_type'] = source_type
 
-    logger.info(f"RSS 수집 완료: {len(results)}건")
-    return results
+def _existing_links(links):
+    """이미 저장된 링크 (수집 스레드 전용 세션으로 조회)
+
+    URL 인덱스(Bloom 필터)에 없는 링크는 확실히 새 것이므로 나머지만 DB에서 확인한다.
+    """
+    candidates = get_url_index().maybe_seen(links)
+    if not candidates:
+        return set()
+    db = ReadSessionLocal()
+    try:
+        return crud.get_existing_urls(db, candidates)
+    finally:
+        db.close()
+
 
+def _rate_limit_stats():
+    """수집기가 사용한 upstream별 요청 버킷 통계
 
-def _collect_pubmed(max_results=5):
-    """PubMed 수집"""
-    logger.info("PubMed 수집 시작...")
+    수집기는 backend/를 sys.path에 넣고 최상위 utils.rate_limit으로 버킷을 만든다.
+    backend.utils.rate_limit은 레지스트리가 다른 별개 모듈이므로 수집기와 같은
+    모듈 객체에서 읽는다 (수집기를 하나도 불러오지 않았으면 빈 dict).
+    """
+    rate_limit = sys.modules.get('utils.rate_limit')
+    return rate_limit.rate_limiter_stats() if rate_limit is not None else {}
+
+
+def _iter_pubmed(max_results=5, since=None, run_state=None):
+    """PubMed 수집 (묶음 단위로 yield)
+
+    since가 주어지면 그 날짜 이후 등록된 논문만 검색한다. 모든 쿼리가 성공하면
+    run_state['complete']를 True로 설정한다 (다음 실행의 기준 시각 갱신 여부).
+    """
+    from backend.collector.pubmed_collector import PubMedCollector
+
+    logger.info(f"PubMed 수집 시작... (since={since.date() if since else '전체'})")
     collector = PubMedCollector()
-    results = collector.search_articles(max_results=max_results)
-    # PubMed 결과에 original_abstract 및 category/source_type 설정
-    for item in results:
-        item['original_abstract'] = item.get('summary', '')
-        source_name = item.get('source', '')
-        category, source_type = categorize_source(source_name, 'PubMed')
-        item['category'] = category
-        item['source_type'] = source_type
-    logger.info(f"PubMed 수집 완료: {len(results)}건")
-    return results
+    for results in collector.iter_articles(
+        max_results=max_results, exclude_links=_existing_links, since=since
+    ):
+        yield _categorize(results, 'PubMed')
+    if run_state is not None:
+        run_state['complete'] = collector.complete
+    logger.info("PubMed 수집 완료")
 
 
-def _collect_scholar(max_results=4):
-    """Google Scholar 수집"""
+def _iter_scholar(max_results=4):
+    """Google Scholar 수집 (키워드 단위로 yield)"""
+    from backend.collector.scholar_collector import GoogleScholarCollector
+
     logger.info("Google Scholar 수집 시작...")
     collector = GoogleScholarCollector()
-    results = collector.search_articles(max_results=max_results)
-    # Scholar 결과에 original_abstract 및 category/source_type 설정
-    for item in results:
-        item['original_abstract'] = item.get('summary', '')
-        source_name = item.get('source', '')
-        category, source_type = categorize_source(source_name, 'Scholar')
-        item['category'] = category
-        item['source_type'] = source_type
-    logger.info(f"Google Scholar 수집 완료: {len(results)}건")
-    return results
+    for results in collector.iter_articles(max_results=max_results):
+        yield _categorize(results, 'Scholar')
+    logger.info("Google Scholar 수집 완료")
 
 
 def _summarize_item(summarizer, item):
@@ -144,78 +184,116 @@ def _summarize_item(summarizer, item):
     return item
 
 
-def _filter_new_items(db, items, source_name):
-    """중복 제거 후 새 아이템만 반환 (배치 조회 최적화)"""
-    if not items:
-        return []
-
-    # 한 번의 쿼리로 기존 URL 조회
-    urls = [item['link'] for item in items]
-    existing_urls = crud.get_existing_urls(db, urls)
-
-    # 수집된 아이템 내 중복도 제거
-    seen = set()
-    new_items = []
-
-    for item in items:
-        url = item['link']
-        if url in existing_urls:
-            continue
-        if url in seen:
-            continue
-        seen.add(url)
-        logger.info(f"새 {source_name} 아티클: {item['title'][:50]}")
-        new_items.append(item)
-
-    return new_items
+_SOURCE_KEYS = {'RSS': 'rss', 'PubMed': 'pubmed', 'Scholar': 'scholar'}
 
 
-def _balance_by_ratio(items: List[ArticleDict], config: dict) -> List[ArticleDict]:
-    """뉴스:학술 비율을 60:40으로 조정
-
-    Args:
-        items: 수집된 아티클 리스트
-        config: collection_config 딕셔너리
+class _Deduplicator:
+    """중복 제거 단계: 도착한 아이템 묶음을 한 번의 쿼리로 DB와 대조
 
-    Returns:
-        균형 조정된 아티클 리스트
+    URL뿐 아니라 아이템의 모든 식별자(DOI / PMID / 정규화 URL, utils.canonical)를
+    저장된 아티클의 식별자 전체(article_identities)와 비교해 PubMed·Scholar·RSS가
+    각자 다른 링크로 가져온 같은 논문을 요약 전에 거른다.
+    이번 실행에서 이미 통과시킨 URL과 식별자도 기억해 소스 간 중복을 제거하고,
+    건너뛴 수는 소스별 수집 통계(skipped)에 기록한다.
+    DB에 이미 있는 아이템은 on_stored(item)로, 이번 실행에서 먼저 통과한 아이템과
+    겹치는 아이템은 on_duplicate(item, original)로 알린다 (수집기 상태 갱신용).
     """
-    target_news_ratio = config.get('target_news_ratio', 0.60)
-    target_academic_ratio = config.get('target_academic_ratio', 0.40)
-
-    # 카테고리별 분리 ('news' and 'paper' 사용)
-    news_items = [item for item in items
-                  if item.get('category') == 'news']
-    academic_items = [item for item in items
-                      if item.get('category') == 'paper']
-
-    logger.info(f"균형 조정 전: News={len(news_items)}, Paper={len(academic_items)}")
 
-    # 학술 논문은 모두 유지 (수집이 어려우므로)
-    target_academic = len(academic_items)
+    def __init__(self, db, collection_stats: dict, on_stored=None, on_duplicate=None):
+        self.db = db
+        self.collection_stats = collection_stats
+        self.on_stored = on_stored
+        self.on_duplicate = on_duplicate
+        self.seen = {}  # URL → 먼저 통과한 아이템
+        self.seen_ids = {}  # 식별자 → 먼저 통과한 아이템
+
+    def __call__(self, items: List[ArticleDict]) -> List[ArticleDict]:
+        keys = [identity_keys(item['link'], item.get('doi')) for item in items]
+        # URL 인덱스에 있는(저장됐을 수 있는) 링크만 DB와 대조
+        candidates = get_url_index().maybe_seen(item['link'] for item in items)
+        existing_urls = crud.get_existing_urls(self.db, candidates)
+        existing_ids = crud.get_existing_identity_keys(
+            self.db, sorted({key for item_keys in keys for key in item_keys})
+        )
 
-    if target_academic > 0:
-        # 학술 논문 개수를 기준으로 필요한 뉴스 개수 계산
-        target_news = int(target_academic * (target_news_ratio / target_academic_ratio))
-    else:
-        # 학술 논문이 없으면 뉴스만 반환
-        logger.warning("학술 논문이 0개입니다. 비율 조정 없이 뉴스만 반환합니다.")
-        return news_items
-
-    # 뉴스가 많으면 최신순으로 샘플링
-    if len(news_items) > target_news:
-        news_items.sort(key=lambda x: x.get('published') or datetime.min, reverse=True)
-        news_items = news_items[:target_news]
-        logger.info(f"뉴스 아티클 {target_news}개로 샘플링")
-
-    final_count = len(news_items) + len(academic_items)
-    if final_count > 0:
-        actual_news_ratio = len(news_items) / final_count
-        actual_academic_ratio = len(academic_items) / final_count
-        logger.info(f"균형 조정 완료: News={len(news_items)} ({actual_news_ratio:.1%}), "
-                   f"Paper={len(academic_items)} ({actual_academic_ratio:.1%})")
+        new_items = []
+        for item, item_keys in zip(items, keys):
+            url = item['link']
+            stored = url in existing_urls or any(key in existing_ids for key in item_keys)
+            original = self.seen.get(url) or next(
+                (self.seen_ids[key] for key in item_keys if key in self.seen_ids), None
+            )
+            if stored and self.on_stored is not None:
+                self.on_stored(item)
+            elif original is not None and self.on_duplicate is not None:
+                self.on_duplicate(item, original)
+            if stored or original is not None:
+                stats = self.collection_stats.get(_SOURCE_KEYS.get(item.get('source_type')))
+                if stats is not None:
+                    stats.skipped += 1
+                continue
+            self.seen[url] = item
+            self.seen_ids.update((key, item) for key in item_keys)
+            logger.info(f"새 {item.get('source_type')} 아티클: {item['title'][:50]}")
+            new_items.append(item)
+        return new_items
+
+
+class _RatioBalancer:
+    """뉴스:학술 비율 조정 (스트리밍)
+
+    학술 논문은 수집이 어려우므로 모두 통과시키고, 뉴스는 지금까지 통과한
+    논문 수로 정한 한도(논문 수 × news/academic 비율) 안에서만 내보낸다.
+    한도를 넘는 뉴스는 최신순 힙에 보관했다가 논문이 더 들어와 한도가
+    늘어나면 최신 것부터 내보낸다. 입력이 끝났는데 논문이 하나도 없으면
+    보관한 뉴스를 모두 내보낸다 (기존 일괄 조정과 같은 규칙).
+    """
 
-    return news_items + academic_items
+    def __init__(self, config: dict):
+        target_news_ratio = config.get('target_news_ratio', 0.60)
+        target_academic_ratio = config.get('target_academic_ratio', 0.40)
+        self.news_per_paper = target_news_ratio / target_academic_ratio
+        self.news_released = 0
+        self.papers = 0
+        self.held = []  # (-published timestamp, 순번, item)
+        self._seq = 0
+        self.stats = None  # Stage 생성 후 연결 (보관 후 버린 뉴스 수 기록)
+
+    def _quota(self) -> int:
+        return int(self.papers * self.news_per_paper)
+
+    def _release(self, limit: int) -> List[ArticleDict]:
+        released = []
+        while self.held and self.news_released < limit:
+            released.append(heapq.heappop(self.held)[2])
+            self.news_released += 1
+        return released
+
+    def add(self, item: ArticleDict) -> List[ArticleDict]:
+        if item.get('category') == 'news':
+            published = item.get('published')
+            key = published.timestamp() if isinstance(published, datetime) else float('-inf')
+            heapq.heappush(self.held, (-key, self._seq, item))
+            self._seq += 1
+            return self._release(self._quota())
+
+        self.papers += 1
+        return [item] + self._release(self._quota())
+
+    def finish(self) -> List[ArticleDict]:
+        if self.papers == 0:
+            logger.warning("학술 논문이 0개입니다. 비율 조정 없이 뉴스만 반환합니다.")
+            return self._release(len(self.held) + self.news_released)
+
+        if self.held:
+            logger.info(f"뉴스 아티클 {self.news_released}개로 샘플링 ({len(self.held)}개 제외)")
+            if self.stats is not None:
+                self.stats.skipped = len(self.held)
+        total = self.news_released + self.papers
+        logger.info(f"균형 조정 완료: News={self.news_released} ({self.news_released / total:.1%}), "
+                    f"Paper={self.papers} ({self.papers / total:.1%})")
+        self.held = []
+        return []
 
 
 def run_collection() -> PipelineReport:
@@ -224,11 +302,13 @@ def run_collection() -> PipelineReport:
     Returns:
         PipelineReport: 실행 결과 리포트
     """
+    from backend.processor.relevance_filter import MedicalRelevanceFilter
+    from backend.processor.summarizer import Summarizer
+
     # 필수 환경 변수 검증
     settings.validate_for_collection()
 
     report = PipelineReport()
-    db = SessionLocal()
     summarizer = Summarizer()
 
     # ── 0단계: relevance_filter 초기화 ────────────────────
@@ -250,118 +330,163 @@ def run_collection() -> PipelineReport:
     except Exception as e:
         logger.warning(f"Relevance filter 초기화 실패: {e}")
 
-    try:
-        # ── 1단계: 병렬 수집 ──────────────────────────────────
-        logger.info("=== 병렬 수집 시작 ===")
-        t0 = time.time()
-
-        all_results = {'rss': [], 'pubmed': [], 'scholar': []}
+    saved_articles = []
+    url_index = get_url_index()
+
+    def summarize(item):
+        return [_summarize_item(summarizer, item)]
+
+    rss_run = {}
+    pubmed_run = {'complete': False, 'settled': 0}
+    settle_lock = threading.Lock()  # 중복 제거 스레드와 저장 스레드가 함께 호출
+
+    def _settle(item):
+        item['settled'] = True
+        rss_collector = rss_run.get('collector')
+        if rss_collector is not None and item.get('feed_url'):
+            rss_collector.settle(item['feed_url'], item['link'])
+        if item.get('source_type') == 'PubMed':
+            pubmed_run['settled'] += 1
+        for duplicate in item.pop('duplicates', []):
+            _settle(duplicate)
+
+    def settle(item):
+        """처리 완료된 항목 (저장됨 / 이미 저장돼 있음)을 수집기 상태에 반영"""
+        with settle_lock:
+            _settle(item)
+
+    def follow(item, original):
+        """이번 실행에서 먼저 통과한 같은 아티클이 처리되면 item도 처리된 것으로 본다"""
+        with settle_lock:
+            if original.get('settled'):
+                _settle(item)
+            else:
+                original.setdefault('duplicates', []).append(item)
+
+    def save(item):
+        article = crud.create_article(writer, item)  # None: 이미 저장된 URL
+        if article is not None:
+            saved_articles.append(article)
+            url_index.add(article.url, article.id)
+        settle(item)
+        return []
 
+    reader = ReadSessionLocal()
+    writer = SessionLocal()
+    try:
         # PubMed/Scholar 수집 개수 설정
         pubmed_limit = collection_config.get('pubmed_per_query', 5)
         scholar_limit = collection_config.get('scholar_per_query', 4)
 
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            futures = {
-                executor.submit(_collect_rss, relevance_filter): 'rss',
-                executor.submit(_collect_pubmed, pubmed_limit): 'pubmed',
-                executor.submit(_collect_scholar, scholar_limit): 'scholar',
-            }
-
-            for future in as_completed(futures):
-                source = futures[future]
-                timeout = SCHOLAR_COLLECTION_TIMEOUT if source == 'scholar' else COLLECTION_TIMEOUT
-                stats = StageStats(name=source)
-
-                try:
-                    results = future.result(timeout=timeout)
-                    all_results[source] = results
-                    stats.total = len(results)
-                    stats.success = len(results)
-                except TimeoutError:
-                    logger.warning(f"{source} 수집 타임아웃 ({timeout}초)")
-                    stats.failed = 1
-                    stats.errors.append({"type": "TimeoutError", "message": f"{timeout}초 타임아웃"})
-                except Exception as e:
-                    logger.error(f"{source} 수집 실패: {type(e).__name__}")
-                    stats.failed = 1
-                    stats.errors.append({"type": type(e).__name__, "message": str(e)})
-
-                report.collection[source] = stats
-
-        elapsed = time.time() - t0
-        for stats in report.collection.values():
-            stats.duration_seconds = elapsed / 3  # 대략적인 분배
-        logger.info(f"병렬 수집 완료: {elapsed:.1f}초 소요")
-
-        # ── 2단계: 중복 필터링 ────────────────────────────────
-        new_items = []
-        for source, source_name in [('rss', 'RSS'), ('pubmed', 'PubMed'), ('scholar', 'Scholar')]:
-            filtered = _filter_new_items(db, all_results[source], source_name)
-            skipped = len(all_results[source]) - len(filtered)
-            report.collection[source].skipped = skipped
-            new_items.extend(filtered)
-
-        logger.info(f"중복 제거 후: 신규 아티클 {len(new_items)}건")
-
-        # ── 3단계: 비율 균형 조정 ─────────────────────────────
-        if collection_config.get('target_news_ratio') and len(new_items) > 0:
-            new_items = _balance_by_ratio(new_items, collection_config)
-
-        logger.info(f"균형 조정 완료. {len(new_items)}건 요약 시작...")
-
-        # ── 4단계: 병렬 요약 ─────────────────────────────────
-        t0 = time.time()
-        summarize_stats = StageStats(name="summarize", total=len(new_items))
-
-        with ThreadPoolExecutor(max_workers=MAX_SUMMARY_WORKERS) as executor:
-            futures = {
-                executor.submit(_summarize_item, summarizer, item): item
-                for item in new_items
-            }
-            summarized_items = []
-            for future in as_completed(futures):
-                try:
-                    summarized_items.append(future.result())
-                    summarize_stats.success += 1
-                except Exception as e:
-                    failed_item = futures[future]
-                    logger.error(f"요약 작업 예외 ({failed_item['title'][:30]}): {e}")
-                    summarized_items.append(failed_item)
-                    summarize_stats.failed += 1
-                    summarize_stats.errors.append({
-                        "title": failed_item['title'][:50],
-                        "error": type(e).__name__,
-                    })
-
-        summarize_stats.duration_seconds = time.time() - t0
-        report.summarization = summarize_stats
-        logger.info(f"요약 완료: {len(summarized_items)}건, {summarize_stats.duration_seconds:.1f}초 소요")
-
-        # ── 5단계: 순차 DB 저장 ──────────────────────────────
-        t0 = time.time()
-        save_stats = StageStats(name="save", total=len(summarized_items))
-
-        for item in summarized_items:
-            try:
-                crud.create_article(db, item)
-                save_stats.success += 1
-            except Exception as e:
-                logger.error(f"DB 저장 실패 ({item['title'][:30]}): {e}")
-                save_stats.failed += 1
-                save_stats.errors.append({
-                    "title": item['title'][:50],
-                    "error": type(e).__name__,
-                })
-
-        save_stats.duration_seconds = time.time() - t0
-        report.saving = save_stats
-        logger.info(f"저장 완료: {save_stats.success}/{save_stats.total}건")
+        # RSS 피드별 ETag/Last-Modified/본문 해시 (변경 없는 피드는 파싱부터 건너뜀)
+        feed_states = crud.get_feed_states(reader)
+        # PubMed 증분 수집: 마지막 성공 실행 이후 등록된 논문만 검색
+        pubmed_since = crud.get_checkpoint(reader, 'pubmed') if settings.PUBMED_INCREMENTAL else None
+        run_started_at = datetime.now(timezone.utc)
+
+        # 수집기가 DB 조회 전에 사용하는 URL 인덱스 (실패하면 모든 링크를 DB로 확인)
+        try:
+            url_index.sync(reader)
+        except Exception as e:
+            logger.warning(f"URL 인덱스 동기화 실패: {e}")
+
+        # 수집 → 중복 제거 → 비율 조정 → 요약 → 저장 (단계마다 크기 제한 큐)
+        save_stage = Stage("save", save, maxsize=QUEUE_SIZE)
+        summarize_stage = Stage(
+            "summarize", summarize, workers=MAX_SUMMARY_WORKERS, maxsize=QUEUE_SIZE,
+            downstream=save_stage, passthrough_on_error=True,
+        )
+        if collection_config.get('target_news_ratio'):
+            balancer = _RatioBalancer(collection_config)
+            balance_stage = Stage(
+                "balance", balancer.add, maxsize=QUEUE_SIZE,
+                downstream=summarize_stage, finish=balancer.finish,
+            )
+            balancer.stats = balance_stage.stats
+        else:
+            balance_stage = Stage("balance", lambda item: [item], maxsize=QUEUE_SIZE,
+                                  downstream=summarize_stage)
+        dedup_stage = Stage(
+            "dedup", _Deduplicator(reader, report.collection, on_stored=settle, on_duplicate=follow), maxsize=QUEUE_SIZE,
+            downstream=balance_stage, batch_size=DEDUP_BATCH_SIZE,
+        )
+
+        rss_producer = Producer(
+            'rss', lambda: _iter_rss(relevance_filter, feed_states, report.rss_fetch, rss_run),
+            dedup_stage, COLLECTION_TIMEOUT,
+        )
+        pubmed_producer = Producer(
+            'pubmed', lambda: _iter_pubmed(pubmed_limit, pubmed_since, pubmed_run),
+            dedup_stage, COLLECTION_TIMEOUT,
+        )
+        producers = [
+            rss_producer,
+            pubmed_producer,
+            Producer('scholar', lambda: _iter_scholar(scholar_limit), dedup_stage,
+                     SCHOLAR_COLLECTION_TIMEOUT),
+        ]
+        for producer in producers:
+            report.collection[producer.name] = producer.stats
+        stages = [dedup_stage, balance_stage, summarize_stage, save_stage]
+        for stage in stages:
+            report.stages[stage.name] = stage.stats
+        report.summarization = summarize_stage.stats
+        report.saving = save_stage.stats
+
+        logger.info("=== 스트리밍 수집 파이프라인 시작 ===")
+        Pipeline(producers, stages).run()
+        logger.info(f"저장 완료: {save_stage.stats.success}/{save_stage.stats.total}건")
+
+        # 피드 상태는 모든 단계가 끝난 뒤 저장 (중간에 실패하면 다음 실행에서 다시 받음).
+        # 수위/최근 링크에는 저장되거나 이미 있던 항목만 반영된다 (비율 조정에서 빠지거나
+        # 저장에 실패한 항목은 다음 실행에서 다시 수집).
+        # RSS 수집이 타임아웃되면 수집 스레드가 아직 상태를 갱신 중일 수 있으므로 저장하지 않는다.
+        if not rss_producer.timed_out:
+            if rss_run.get('collector') is not None:
+                rss_run['collector'].finalize()
+            crud.save_feed_states(writer, feed_states)
+        # PubMed는 모든 쿼리가 창을 끝까지 확인했고, 가져온 논문이 모두 저장되거나
+        # 이미 저장돼 있던 경우에만 다음 증분 수집 기준 시각을 갱신
+        # (요약/저장 단계에서 잃은 논문은 같은 창을 다시 검색해 가져온다)
+        pubmed_fetched = pubmed_producer.stats.success
+        if pubmed_run['complete'] and not pubmed_producer.timed_out:
+            if pubmed_run['settled'] == pubmed_fetched:
+                crud.set_checkpoint(writer, 'pubmed', run_started_at)
+            else:
+                logger.warning(f"PubMed 기준 시각 유지: {pubmed_fetched}건 중 "
+                               f"{pubmed_run['settled']}건만 처리됨")
+
+        try:
+            url_index.save()
+        except OSError as e:
+            logger.warning(f"URL 인덱스 저장 실패: {e}")
+
+        fetch = report.rss_fetch
+        logger.info(f"RSS 조건부 요청: {fetch.feeds_skipped}/{fetch.feeds_requested}개 피드 건너뜀, "
+                    f"{fetch.bytes_saved:,}바이트 절약")
+
+        # 관련 아티클 인덱스 증분 갱신 (세대 갱신 전에 반영해 새 캐시가 새 인덱스를 사용)
+        if saved_articles:
+            from backend.similarity import index_saved_articles
+
+            indexed = index_saved_articles(saved_articles)
+            logger.info(f"유사도 인덱스 추가: {indexed}건")
 
     except Exception as e:
         logger.error(f"수집 중 오류 발생: {e}", exc_info=True)
     finally:
-        db.close()
+        # 새 아티클이 저장되면 세대 번호 증가 (API의 ETag/캐시 무효화 기준).
+        # 저장 단계 성공 수는 이미 있던 URL도 포함하므로 실제 저장된 아티클로 판단한다.
+        # 저장 이후 단계(피드 상태, 인덱스 등)가 실패해도 저장된 아티클은 보이도록 항상 수행
+        if saved_articles:
+            try:
+                writer.rollback()  # 앞 단계 실패로 남은 트랜잭션 정리
+                bump_data_version(writer)
+            except Exception as e:
+                logger.error(f"데이터 세대 갱신 실패: {e}", exc_info=True)
+        reader.close()
+        writer.close()
+        report.rate_limits = _rate_limit_stats()
         report.ended_at = datetime.now()
 
     # 리포트 출력
@@ -372,4 +497,6 @@ def run_collection() -> PipelineReport:
 
 
 if __name__ == "__main__":
+    # 단독 실행 시에는 수집 전에 스키마를 준비 (backend.migrate와 동일)
+    init_db()
     run_collection()
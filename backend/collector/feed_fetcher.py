@@ -0,0 +1,269 @@
+"""비동기 RSS 피드 요청 엔진 (httpx)
+
+피드를 하나씩 requests.get + sleep(1.0)으로 받으면 전체 시간이 피드 수에
+비례한다. FeedFetcher는 연결 풀 하나를 공유하며 모든 피드를 동시에 요청하고,
+끝나는 순서대로 결과를 돌려준다. 전체 시간은 대략 가장 느린 피드 하나의 시간이다.
+
+- 전체 동시 요청 수 제한 (RSS_MAX_CONCURRENCY)
+- 호스트별 동시 요청 수 + 토큰 버킷 속도 제한 (RSS_PER_HOST_LIMIT / RSS_HOST_RATE_LIMIT)
+  — 같은 서버의 피드 여러 개를 한꺼번에 두드리지 않도록 (버킷 이름: "rss:<host>")
+- 피드별 마감 시간 (RSS_FEED_DEADLINE): 첫 요청을 보낸 시점부터 재고, 일시적 오류는
+  마감 전까지 지수 백오프로 재시도 (슬롯/속도 제한 대기는 마감에 넣지 않음)
+- 조건부 요청: 이전 ETag / Last-Modified를 If-None-Match / If-Modified-Since로 전송
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Iterator, List, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from utils.rate_limit import TokenBucket, get_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+# 재시도할 HTTP 상태 코드 (그 외 4xx는 즉시 실패)
+RETRY_STATUS = {408, 429, 500, 502, 503, 504}
+RETRY_BACKOFF_MIN = 1.0
+RETRY_BACKOFF_MAX = 8.0
+
+
+@dataclass
+class FeedResponse:
+    """피드 하나의 요청 결과 (content 또는 error 중 하나가 설정됨)"""
+
+    url: str
+    content: Optional[bytes] = None
+    status_code: Optional[int] = None
+    error: Optional[str] = None
+    attempts: int = 0
+    elapsed: float = 0.0
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status_code == 304
+
+
+def _conditional_headers(validator: Optional[dict]) -> Dict[str, str]:
+    headers = {}
+    if validator:
+        if validator.get("etag"):
+            headers["If-None-Match"] = validator["etag"]
+        if validator.get("last_modified"):
+            headers["If-Modified-Since"] = validator["last_modified"]
+    return headers
+
+
+class _HostGate:
+    """호스트 하나에 대한 동시 요청 수와 요청 속도 제한"""
+
+    def __init__(self, limit: int, limiter: TokenBucket):
+        self._semaphore = asyncio.Semaphore(max(limit, 1))
+        self._limiter = limiter
+
+    async def __aenter__(self):
+        await self._semaphore.acquire()
+        try:
+            await self._limiter.acquire_async()
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+    async def __aexit__(self, *exc_info):
+        self._semaphore.release()
+
+
+class FeedFetcher:
+    """공유 연결 풀 기반 동시 피드 요청기
+
+    Args:
+        headers: 모든 요청에 붙일 헤더
+        max_concurrency: 전체 동시 요청 수
+        per_host_limit: 호스트별 동시 요청 수
+        per_host_rate: 호스트별 초당 요청 수 (프로세스 공유 토큰 버킷)
+        request_timeout: 요청 1회 타임아웃 (초)
+        feed_deadline: 피드당 재시도를 포함한 총 시간 (초)
+    """
+
+    def __init__(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        max_concurrency: int = 20,
+        per_host_limit: int = 2,
+        per_host_rate: float = 1.0,
+        request_timeout: float = 10.0,
+        feed_deadline: float = 30.0,
+    ):
+        self.headers = headers or {}
+        self.max_concurrency = max(max_concurrency, 1)
+        self.per_host_limit = per_host_limit
+        self.per_host_rate = per_host_rate
+        self.request_timeout = request_timeout
+        self.feed_deadline = feed_deadline
+
+    async def fetch_all(
+        self, urls: List[str], validators: Optional[Dict[str, dict]] = None
+    ) -> AsyncIterator[FeedResponse]:
+        """모든 URL을 동시에 요청하고 끝나는 순서대로 결과를 yield
+
+        Args:
+            urls: 요청할 피드 URL 목록
+            validators: {url: {"etag": ..., "last_modified": ...}} 이전 응답의 검증자
+        """
+        validators = validators or {}
+        if not urls:
+            return
+
+        limits = httpx.Limits(
+            max_connections=self.max_concurrency,
+            max_keepalive_connections=self.max_concurrency,
+        )
+        async with httpx.AsyncClient(
+            headers=self.headers,
+            timeout=httpx.Timeout(self.request_timeout),
+            limits=limits,
+            follow_redirects=True,
+        ) as client:
+            concurrency = asyncio.Semaphore(self.max_concurrency)
+            gates: Dict[str, _HostGate] = {}
+            tasks = [
+                asyncio.ensure_future(
+                    self._fetch(
+                        client, url, _conditional_headers(validators.get(url)), concurrency, gates
+                    )
+                )
+                for url in urls
+            ]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    yield await next_done
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+    async def _fetch(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        headers: Dict[str, str],
+        concurrency: asyncio.Semaphore,
+        gates: Dict[str, _HostGate],
+    ) -> FeedResponse:
+        result = FeedResponse(url=url)
+        host = urlsplit(url).netloc.lower()
+        gate = gates.get(host)
+        if gate is None:
+            limiter = get_rate_limiter(f"rss:{host}", self.per_host_rate)
+            gate = gates[host] = _HostGate(self.per_host_limit, limiter)
+
+        started = time.monotonic()
+        try:
+            await self._fetch_until_done(client, url, headers, concurrency, gate, result)
+        except asyncio.TimeoutError:
+            result.error = f"마감 시간 초과 ({self.feed_deadline:g}초, {result.attempts}회 시도)"
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
+        result.elapsed = time.monotonic() - started
+        return result
+
+    async def _fetch_until_done(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        headers: Dict[str, str],
+        concurrency: asyncio.Semaphore,
+        gate: _HostGate,
+        result: FeedResponse,
+    ) -> None:
+        """성공하거나 재시도할 수 없는 오류가 날 때까지 요청
+
+        호스트 제한을 먼저 통과한 뒤 전체 슬롯을 잡으므로, 호스트 속도 제한을
+        기다리는 동안 다른 호스트의 피드가 쓸 슬롯을 붙잡지 않는다.
+        마감(feed_deadline)은 첫 요청을 보내는 시점부터 재며, 넘으면
+        asyncio.TimeoutError를 던진다.
+        """
+        loop = asyncio.get_running_loop()
+        deadline: Optional[float] = None
+
+        async def attempt() -> httpx.Response:
+            nonlocal deadline
+            async with gate:
+                async with concurrency:
+                    if deadline is None:
+                        deadline = loop.time() + self.feed_deadline
+                        return await asyncio.wait_for(client.get(url, headers=headers), self.feed_deadline)
+                    return await client.get(url, headers=headers)
+
+        backoff = RETRY_BACKOFF_MIN
+        while True:
+            result.attempts += 1
+            try:
+                if deadline is None:
+                    response = await attempt()
+                else:  # 재시도는 대기 시간까지 남은 마감 안에서
+                    response = await asyncio.wait_for(attempt(), max(deadline - loop.time(), 0))
+                result.status_code = response.status_code
+                if response.status_code not in RETRY_STATUS:
+                    if response.status_code != 304:  # 304: 변경 없음 (본문 없음)
+                        response.raise_for_status()
+                    result.content = response.content
+                    result.etag = response.headers.get("etag")
+                    result.last_modified = response.headers.get("last-modified")
+                    return
+                reason = f"HTTP {response.status_code}"
+            except httpx.TransportError as e:
+                reason = type(e).__name__
+
+            if deadline is not None and loop.time() + backoff >= deadline:
+                raise asyncio.TimeoutError
+            logger.debug(f"피드 재시도 {url} ({reason}), {backoff:g}초 후")
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, RETRY_BACKOFF_MAX)
+
+    def iter_completed(
+        self, urls: List[str], validators: Optional[Dict[str, dict]] = None
+    ) -> Iterator[FeedResponse]:
+        """동기 코드용: 전용 스레드의 이벤트 루프에서 요청하고 끝나는 순서대로 yield
+
+        소비 측(파싱, 관련성 필터)이 느려도 요청은 계속 진행되므로
+        피드별 마감 시간이 소비 속도의 영향을 받지 않는다.
+        """
+        results: queue.Queue = queue.Queue()
+        done = object()
+        stop = threading.Event()
+
+        async def produce():
+            async for response in self.fetch_all(urls, validators):
+                results.put(response)
+                if stop.is_set():
+                    break
+
+        def run():
+            try:
+                asyncio.run(produce())
+            except Exception as e:
+                logger.error(f"피드 요청 루프 오류: {type(e).__name__}: {e}")
+            finally:
+                results.put(done)
+
+        thread = threading.Thread(target=run, name="feed-fetcher", daemon=True)
+        thread.start()
+        try:
+            while True:
+                response = results.get()
+                if response is done:
+                    break
+                yield response
+        finally:
+            stop.set()
@@ -1,10 +1,8 @@
-from pymed import PubMed
 import json
 import os
-import time
 import logging
 import sys
-from typing import List, Dict
+from typing import Callable, Iterable, Iterator, List, Dict, Optional
 import datetime
 from tenacity import retry, stop_after_attempt, wait_exponential, before_sleep_log
 
@@ -12,17 +10,50 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import settings
 from article_types import ArticleDict
+from collector.pubmed_eutils import EUtilsClient, PubMedRecord, pubmed_link
+from utils.rate_limit import get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
+# E-utilities 결과를 파이프라인으로 넘기는 묶음 크기
+YIELD_BATCH_SIZE = 50
+
+
+def _record_to_article(record: PubMedRecord) -> ArticleDict:
+    """E-utilities 결과를 pymed 경로와 같은 아티클 형식으로 변환"""
+    return {
+        "title": record.title,
+        "link": pubmed_link(record.pmid),
+        "summary": record.abstract,
+        "published": record.published,
+        "source": f"PubMed | {record.journal or 'Unknown Journal'}",
+        "source_type": "API",
+        "doi": record.doi,
+        "keywords": record.queries[0] if record.queries else "",
+    }
+
 
 class PubMedCollector:
-    def __init__(self, email: str = None, sources_file: str = "sources.json"):
+    """PubMed 수집기
+
+    기본은 E-utilities 직접 호출(collector.pubmed_eutils)이며,
+    PUBMED_USE_EUTILS=false면 pymed로 쿼리별 수집한다.
+    """
+
+    def __init__(self, email: str = None, sources_file: str = "sources.json", use_eutils: bool = None):
         email = email or settings.PUBMED_EMAIL
         if not email or email == "your_email@example.com":
             logger.warning("PUBMED_EMAIL 환경 변수를 설정해주세요. 기본값을 사용합니다.")
             email = "dermainsight@example.com"
-        self.pubmed = PubMed(tool="DermaInsight", email=email)
+        self.email = email
+        self.use_eutils = settings.PUBMED_USE_EUTILS if use_eutils is None else use_eutils
+        self.pubmed = None
+        if not self.use_eutils:
+            from pymed import PubMed
+
+            self.pubmed = PubMed(tool="DermaInsight", email=email)
+        self.limiter = get_rate_limiter("ncbi", settings.NCBI_RATE_LIMIT)
+        self.complete = False  # 마지막 iter_articles가 모든 쿼리를 오류 없이 끝냈는지
         self.queries = []
         self._load_sources(sources_file)
 
@@ -68,18 +99,73 @@ class PubMedCollector:
             })
         return results
 
+    def _iter_eutils(
+        self,
+        max_results: int,
+        exclude_links: Optional[Callable[[List[str]], Iterable[str]]],
+        since: Optional[datetime.datetime],
+    ) -> Iterator[List[ArticleDict]]:
+        exclude = None
+        if exclude_links is not None:
+            def exclude(pmids: List[str]) -> List[str]:
+                link_to_pmid = {pubmed_link(pmid): pmid for pmid in pmids}
+                return [link_to_pmid[link] for link in exclude_links(list(link_to_pmid))]
+
+        client = EUtilsClient(email=self.email, api_key=settings.NCBI_API_KEY, limiter=self.limiter)
+        try:
+            batch = []
+            records = client.search_new(
+                self.queries, max_results, exclude=exclude, since=since
+            )
+            for record in records:
+                batch.append(_record_to_article(record))
+                if len(batch) >= YIELD_BATCH_SIZE:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+            # 실패했거나 since 창을 다 보지 못한 쿼리가 있으면 증분 기준 시각을 유지
+            self.complete = not client.failed_queries and not client.truncated_queries
+        finally:
+            client.close()
+
     def search_articles(self, max_results: int = 5) -> List[ArticleDict]:
         all_results = []
+        for results in self.iter_articles(max_results):
+            all_results.extend(results)
+        return all_results
+
+    def iter_articles(
+        self,
+        max_results: int = 5,
+        exclude_links: Optional[Callable[[List[str]], Iterable[str]]] = None,
+        since: Optional[datetime.datetime] = None,
+    ) -> Iterator[List[ArticleDict]]:
+        """수집 결과를 묶음 단위로 yield (스트리밍 파이프라인용)
+
+        Args:
+            max_results: 쿼리당 최대 결과 수
+            exclude_links: 이미 저장된 링크를 돌려주는 함수 (E-utilities 경로에서
+                efetch 전에 기존 PMID를 제외하는 데 사용)
+            since: 이 날짜 이후 등록된 논문만 검색 (E-utilities 경로만 지원)
+        """
+        self.complete = False
+        if self.use_eutils:
+            yield from self._iter_eutils(max_results, exclude_links, since)
+            return
+
+        failed = False
         for query in self.queries:
+            # pymed 쿼리 하나 = esearch + efetch 2회 요청
+            self.limiter.acquire(2)
             try:
                 results = self._query_single(query, max_results)
-                all_results.extend(results)
+                if results:
+                    yield results
             except Exception as e:
                 logger.error(f"PubMed 검색 실패 (쿼리: '{query}'): {type(e).__name__}")
-
-            time.sleep(1.0)
-
-        return all_results
+                failed = True
+        self.complete = not failed
 
 
 if __name__ == "__main__":
@@ -0,0 +1,370 @@
+"""PubMed E-utilities 클라이언트 (esearch + 배치 efetch)
+
+pymed는 쿼리마다 esearch + efetch를 따로 실행하므로, 겹치는 쿼리가 같은
+PMID를 반환하면 같은 논문을 여러 번 받아 파싱한다. 이 클라이언트는
+
+1. 모든 쿼리에 대해 esearch만 실행해 PMID를 모으고
+2. 쿼리 간 중복과 이미 DB에 있는 PMID를 제거한 뒤
+3. 새 PMID만 efetch POST 한 번(EFETCH_BATCH_SIZE개 단위)으로 받는다.
+
+esearch는 NCBI 허용 속도(토큰 버킷 "ncbi")까지 동시에 실행하고, since가
+주어지면 그 날짜 이후 등록된(Entrez date) 논문만 검색한다. 그 창(window)에
+retmax건보다 많은 PMID가 있으면 retstart로 이어지는 페이지를 읽어 새 PMID를
+쿼리당 retmax건까지 채우고, 창을 끝까지 보지 못한 쿼리는 truncated_queries에
+남긴다 (호출자는 증분 기준 시각을 옮기지 않아야 한다).
+
+429/5xx 응답과 전송 오류는 같은 버킷 안에서 지수 백오프로 재시도한다.
+
+efetch XML은 XMLPullParser로 응답 스트림을 받는 대로 파싱하고
+PubmedArticle 요소를 처리할 때마다 비워 메모리를 일정하게 유지한다.
+"""
+
+import logging
+import math
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import IO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import httpx
+
+from utils.rate_limit import TokenBucket, get_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+EUTILS_BASE_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
+EFETCH_BATCH_SIZE = 200  # efetch 한 번에 요청할 최대 PMID 수
+NCBI_RATE = 3.0  # API 키 없이 초당 3회 (키가 있으면 10회)
+MAX_SEARCH_WORKERS = 10
+REQUEST_TIMEOUT = 30.0
+# 재시도할 HTTP 상태 코드 (그 외 4xx는 즉시 실패)
+RETRY_STATUS = {429, 500, 502, 503, 504}
+MAX_ATTEMPTS = 4
+RETRY_BACKOFF_MIN = 1.0
+RETRY_BACKOFF_MAX = 8.0
+MAX_DATE = "3000/12/31"  # mindate에는 maxdate가 함께 필요
+WINDOW_PAGE_SIZE = 500  # since 창의 이어지는 페이지 크기 (PMID만 받으므로 크게)
+MAX_WINDOW_PAGES = 20  # 실행당 쿼리별 최대 추가 페이지 수
+
+_MONTHS = {
+    name: index
+    for index, name in enumerate(
+        ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], 1
+    )
+}
+
+
+@dataclass
+class PubMedRecord:
+    """efetch PubmedArticle 하나의 파싱 결과"""
+
+    pmid: str
+    title: str = ""
+    abstract: str = ""
+    journal: str = ""
+    doi: str = ""
+    published: Optional[datetime] = None
+    queries: List[str] = field(default_factory=list)  # 이 PMID를 반환한 쿼리 (esearch 순서)
+
+
+def pubmed_link(pmid: str) -> str:
+    return f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/"
+
+
+# ── XML 파싱 ──────────────────────────────────────────────
+
+
+def _text(element: Optional[ET.Element]) -> str:
+    """하위 태그(<i>, <sup> 등)를 포함한 전체 텍스트"""
+    if element is None:
+        return ""
+    return "".join(element.itertext()).strip()
+
+
+def _int(value: Optional[str], default: Optional[int] = None) -> Optional[int]:
+    if not value:
+        return default
+    value = value.strip()
+    if value.isdigit():
+        return int(value)
+    return _MONTHS.get(value[:3].lower(), default)
+
+
+def _date(element: ET.Element) -> Optional[datetime]:
+    """Year/Month/Day 하위 요소로 날짜 생성 (월/일이 없으면 1)"""
+    year = _int(element.findtext("Year"))
+    if not year:
+        return None
+    try:
+        return datetime(year, _int(element.findtext("Month"), 1), _int(element.findtext("Day"), 1))
+    except ValueError:
+        return datetime(year, 1, 1)
+
+
+def _publication_date(article: ET.Element) -> Optional[datetime]:
+    """PubMed 등록일(PubStatus=pubmed) 우선, 없으면 저널 발행일 (pymed와 같은 기준)"""
+    for date in article.iterfind("PubmedData/History/PubMedPubDate"):
+        if date.get("PubStatus") == "pubmed":
+            published = _date(date)
+            if published:
+                return published
+
+    pub_date = article.find("MedlineCitation/Article/Journal/JournalIssue/PubDate")
+    return _date(pub_date) if pub_date is not None else None
+
+
+def _parse_article(article: ET.Element) -> Optional[PubMedRecord]:
+    citation = article.find("MedlineCitation")
+    if citation is None:
+        return None
+    pmid = (citation.findtext("PMID") or "").strip()
+    if not pmid:
+        return None
+
+    doi = ""
+    for article_id in article.iterfind("PubmedData/ArticleIdList/ArticleId"):
+        if article_id.get("IdType") == "doi":
+            doi = (article_id.text or "").strip()
+            break
+
+    return PubMedRecord(
+        pmid=pmid,
+        title=_text(citation.find("Article/ArticleTitle")),
+        abstract="\n".join(
+            _text(part) for part in citation.iterfind("Article/Abstract/AbstractText")
+        ),
+        journal=_text(citation.find("Article/Journal/Title")),
+        doi=doi,
+        published=_publication_date(article),
+    )
+
+
+def _iter_records(events: Iterable) -> Iterator[PubMedRecord]:
+    """(event, element) 스트림에서 PubmedArticle을 꺼내 파싱하고 요소를 비운다"""
+    for _, element in events:
+        if element.tag != "PubmedArticle":
+            continue
+        record = _parse_article(element)
+        element.clear()
+        if record is not None:
+            yield record
+
+
+def parse_efetch_xml(source: IO[bytes]) -> Iterator[PubMedRecord]:
+    """efetch XML 파일 객체를 iterparse로 순회 (PubmedArticle 단위)"""
+    return _iter_records(ET.iterparse(source, events=("end",)))
+
+
+def _iter_stream_records(chunks: Iterable[bytes]) -> Iterator[PubMedRecord]:
+    """응답 바이트 청크를 도착하는 대로 파싱"""
+    parser = ET.XMLPullParser(events=("end",))
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from _iter_records(parser.read_events())
+    parser.close()
+    yield from _iter_records(parser.read_events())
+
+
+# ── 클라이언트 ────────────────────────────────────────────
+
+
+class EUtilsClient:
+    """esearch / efetch 요청기
+
+    Args:
+        tool / email: NCBI가 요청자 식별에 사용하는 파라미터
+        api_key: NCBI API 키
+        client: 주입할 httpx.Client (테스트용 MockTransport 등). 없으면 생성.
+        limiter: 요청 속도 제한 버킷 (기본: 프로세스 공유 "ncbi" 버킷, 초당 NCBI_RATE회)
+    """
+
+    def __init__(
+        self,
+        tool: str = "DermaInsight",
+        email: str = "",
+        api_key: str = "",
+        client: Optional[httpx.Client] = None,
+        limiter: Optional[TokenBucket] = None,
+    ):
+        self.params = {"tool": tool, "email": email}
+        if api_key:
+            self.params["api_key"] = api_key
+        self.client = client or httpx.Client(timeout=REQUEST_TIMEOUT)
+        self.limiter = limiter or get_rate_limiter("ncbi", NCBI_RATE)
+        self.failed_queries: List[str] = []
+        self.truncated_queries: List[str] = []
+
+    def esearch(
+        self, term: str, retmax: int, since: Optional[datetime] = None, retstart: int = 0
+    ) -> Tuple[List[str], int]:
+        """검색어에 해당하는 (PMID 목록, 전체 건수) (PubMed 기본 정렬 순서)
+
+        since가 주어지면 그 날짜(포함) 이후 PubMed에 등록된 논문만 (datetype=edat)
+        """
+        params = {
+            **self.params, "db": "pubmed", "term": term,
+            "retmax": retmax, "retstart": retstart, "retmode": "json",
+        }
+        if since is not None:
+            params.update(datetype="edat", mindate=since.strftime("%Y/%m/%d"), maxdate=MAX_DATE)
+
+        response = self._send("GET", f"{EUTILS_BASE_URL}/esearch.fcgi", params=params)
+        try:
+            response.read()
+            response.raise_for_status()
+            result = response.json().get("esearchresult", {})
+        finally:
+            response.close()
+        pmids = list(result.get("idlist", []))
+        return pmids, int(result.get("count") or len(pmids))
+
+    def efetch(self, pmids: List[str]) -> Iterator[PubMedRecord]:
+        """PMID 목록의 상세 정보 (POST, EFETCH_BATCH_SIZE개 단위, 스트리밍 파싱)"""
+        for start in range(0, len(pmids), EFETCH_BATCH_SIZE):
+            batch = pmids[start:start + EFETCH_BATCH_SIZE]
+            response = self._send(
+                "POST",
+                f"{EUTILS_BASE_URL}/efetch.fcgi",
+                data={**self.params, "db": "pubmed", "id": ",".join(batch), "retmode": "xml"},
+            )
+            try:
+                response.raise_for_status()
+                yield from _iter_stream_records(response.iter_bytes())
+            finally:
+                response.close()
+
+    def _send(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """요청을 보내고 응답 헤더까지 받음 (본문은 스트리밍, 호출자가 close)
+
+        429/5xx 응답과 전송 오류는 매 시도마다 ncbi 버킷 토큰을 받아 지수 백오프로
+        MAX_ATTEMPTS회까지 재시도한다. 마지막 시도의 응답/예외는 그대로 돌려준다.
+        """
+        request = self.client.build_request(method, url, **kwargs)
+        backoff = RETRY_BACKOFF_MIN
+        for attempt in range(1, MAX_ATTEMPTS):
+            self.limiter.acquire()
+            try:
+                response = self.client.send(request, stream=True)
+            except httpx.TransportError as e:
+                reason = type(e).__name__
+            else:
+                if response.status_code not in RETRY_STATUS:
+                    return response
+                response.close()
+                reason = f"HTTP {response.status_code}"
+
+            logger.warning(f"NCBI 요청 재시도 ({reason}, {attempt}/{MAX_ATTEMPTS}), {backoff:g}초 후")
+            time.sleep(backoff)
+            backoff = min(backoff * 2, RETRY_BACKOFF_MAX)
+
+        self.limiter.acquire()
+        return self.client.send(request, stream=True)
+
+    def search_new(
+        self,
+        queries: List[str],
+        retmax: int,
+        exclude: Optional[Callable[[List[str]], Iterable[str]]] = None,
+        since: Optional[datetime] = None,
+    ) -> Iterator[PubMedRecord]:
+        """모든 쿼리를 esearch한 뒤, 중복과 exclude(pmids)가 돌려준 PMID를 빼고 efetch
+
+        esearch는 허용 속도만큼 동시에 실행한다 (실패한 쿼리는 failed_queries에 기록).
+        since 창에 retmax건보다 많으면 이어지는 페이지에서 새 PMID를 채운다 (_page_window).
+
+        Args:
+            queries: 검색어 목록
+            retmax: 쿼리당 최대 PMID 수
+            exclude: 이미 수집한 PMID를 돌려주는 함수 (DB 조회)
+            since: 이 날짜 이후 등록된 논문만 검색 (증분 수집)
+        """
+        self.failed_queries = []
+        self.truncated_queries = []
+
+        def search(query: str) -> Tuple[List[str], int]:
+            try:
+                return self.esearch(query, retmax, since)
+            except (httpx.HTTPError, ValueError) as e:
+                logger.error(f"PubMed esearch 실패 (쿼리: '{query}'): {type(e).__name__}")
+                self.failed_queries.append(query)
+                return [], 0
+
+        workers = min(len(queries), MAX_SEARCH_WORKERS, max(1, math.ceil(self.limiter.burst)))
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+            results = list(executor.map(search, queries))  # 쿼리 순서 유지
+
+        queries_by_pmid: Dict[str, List[str]] = {}
+        total = 0
+        for query, (pmids, _) in zip(queries, results):
+            total += len(pmids)
+            for pmid in pmids:
+                queries_by_pmid.setdefault(pmid, []).append(query)
+
+        known = set(exclude(list(queries_by_pmid))) if exclude and queries_by_pmid else set()
+        if since is not None:
+            for query, (pmids, count) in zip(queries, results):
+                if count > len(pmids):
+                    self._page_window(query, pmids, count, retmax, since, exclude, known, queries_by_pmid)
+        new_pmids = [pmid for pmid in queries_by_pmid if pmid not in known]
+        logger.info(
+            f"PubMed esearch: 쿼리 {len(queries)}개, PMID {total}건 → 고유 {len(queries_by_pmid)}건, "
+            f"신규 {len(new_pmids)}건"
+        )
+
+        for record in self.efetch(new_pmids):
+            record.queries = queries_by_pmid.get(record.pmid, [])
+            yield record
+
+    def _page_window(
+        self,
+        query: str,
+        first_page: List[str],
+        count: int,
+        retmax: int,
+        since: datetime,
+        exclude: Optional[Callable[[List[str]], Iterable[str]]],
+        known: set,
+        queries_by_pmid: Dict[str, List[str]],
+    ) -> None:
+        """since 창의 다음 페이지들에서 새 PMID를 쿼리당 retmax건까지 채움
+
+        앞쪽 PMID가 이미 저장돼 있어도 창 안의 나머지에 도달할 수 있도록
+        retstart로 이어 읽는다. 창을 끝까지 보지 못하면 truncated_queries에 기록한다.
+        """
+        new = sum(1 for pmid in first_page if pmid not in known)
+        retstart = len(first_page)
+        for _ in range(MAX_WINDOW_PAGES):
+            if new >= retmax or retstart >= count:
+                break
+            try:
+                pmids, count = self.esearch(query, WINDOW_PAGE_SIZE, since, retstart)
+            except (httpx.HTTPError, ValueError) as e:
+                logger.error(f"PubMed esearch 실패 (쿼리: '{query}', retstart={retstart}): {type(e).__name__}")
+                self.failed_queries.append(query)
+                return
+            if not pmids:
+                break
+            retstart += len(pmids)
+
+            unchecked = [pmid for pmid in pmids if pmid not in known and pmid not in queries_by_pmid]
+            if exclude and unchecked:
+                known.update(exclude(unchecked))
+            for position, pmid in enumerate(pmids):
+                if pmid in known:
+                    continue
+                if new >= retmax:
+                    retstart -= len(pmids) - position  # 나머지는 다음 실행에서
+                    break
+                matched = queries_by_pmid.setdefault(pmid, [])
+                if query not in matched:
+                    matched.append(query)
+                new += 1
+
+        if retstart < count:
+            logger.info(f"PubMed 쿼리 '{query}': 창 {count}건 중 {retstart}건까지 확인 (다음 실행에서 계속)")
+            self.truncated_queries.append(query)
+
+    def close(self) -> None:
+        self.client.close()
@@ -1,5 +1,5 @@
 import feedparser
-import requests
+import hashlib
 import json
 import os
 import re
@@ -7,17 +7,27 @@ import html
 import time
 import logging
 import sys
+import threading
 from datetime import datetime, timezone
-from typing import List, Dict
-from tenacity import retry, stop_after_attempt, wait_exponential
+from typing import Callable, Iterable, Iterator, List, Dict, Optional
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import settings
-from article_types import ArticleDict
+from article_types import ArticleDict, FeedFetchStats
+from collector.feed_fetcher import FeedFetcher
 
 logger = logging.getLogger(__name__)
 
+# 연속으로 이미 본 항목이 이만큼 나오면 피드 순회 중단 (고정 글 등 순서 예외 허용)
+KNOWN_STOP_AFTER = 3
+# 피드별로 기억할 최근 링크 수 하한 (max_items * 4와 큰 쪽)
+SEEN_LINKS_MIN = 200
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+}
+
 
 def _fix_escaped_cdata(raw_xml: bytes) -> bytes:
     """이스케이프된 CDATA(&lt;![CDATA[...]]&gt;)를 정상 CDATA로 변환."""
@@ -36,26 +46,96 @@ def _clean_text(text: str) -> str:
     return text.strip()
 
 
-def _parse_datetime_safe(parsed_tuple):
+def _parse_datetime(parsed_tuple) -> Optional[datetime]:
     try:
         if parsed_tuple:
             return datetime(*parsed_tuple[:6], tzinfo=timezone.utc)
     except (TypeError, ValueError):
         pass
-    return datetime.now(timezone.utc)
+    return None
+
+
+class _HighWaterMark:
+    """피드별 수위(high-water mark): 지금까지 본 가장 최근 발행 시각 + 최근 링크 집합
+
+    피드는 최신순이므로 이미 본 항목(링크가 집합에 있거나 발행 시각이 수위보다
+    이전)이 연속으로 나오면 그 뒤는 모두 처리한 영역으로 보고 순회를 멈춘다.
 
+    처리가 끝난 링크만 기록한다: 관련성 필터에서 탈락했거나, 이미 저장돼 있거나,
+    파이프라인에서 저장된 항목 (settle). 비율 조정에서 빠지거나 저장에 실패한
+    항목은 기록하지 않으며, 수위도 그런 항목의 발행 시각을 넘지 않는다
+    (다음 실행에서 다시 수집).
+    """
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
-def _fetch_with_retry(url: str, headers: dict) -> requests.Response:
-    response = requests.get(url, headers=headers, timeout=10)
-    response.raise_for_status()
-    return response
+    def __init__(self, published: Optional[datetime], links: Optional[List[str]], capacity: int):
+        if published is not None and published.tzinfo is None:
+            # SQLite는 타임존을 저장하지 않으므로 naive 값은 UTC로 간주
+            published = published.replace(tzinfo=timezone.utc)
+        self.published = published
+        self._baseline = published  # 이전 실행까지의 수위 (이번 실행 중에는 고정)
+        self.capacity = capacity
+        self._previous = list(links or [])
+        self._known = set(self._previous)
+        self._new: List[str] = []
+
+    def is_known(self, link: str, published: Optional[datetime]) -> bool:
+        if link in self._known:
+            return True
+        return published is not None and self._baseline is not None and published < self._baseline
+
+    def record(self, link: str, published: Optional[datetime]) -> None:
+        if link not in self._known:
+            self._known.add(link)
+            self._new.append(link)
+        if published is not None and (self.published is None or published > self.published):
+            self.published = published
+
+    def capped(self, pending: Iterable[Optional[datetime]]) -> Optional[datetime]:
+        """미처리 항목보다 최근으로 올라가지 않은 수위 (is_known은 수위보다 이전만 건너뜀)"""
+        dates = [published for published in pending if published is not None]
+        if not dates or self.published is None:
+            return self.published
+        return min(self.published, min(dates))
+
+    @property
+    def links(self) -> List[str]:
+        """최근 본 링크 (새 링크 먼저, 최대 capacity개)"""
+        return (self._new + self._previous)[:self.capacity]
 
 
 class RSSCollector:
-    def __init__(self, sources_file: str = "sources.json", relevance_filter=None):
+    """RSS 피드 수집기
+
+    Args:
+        sources_file: 피드 목록 파일 (rss_feeds)
+        relevance_filter: 의료 관련성 필터 (filter_relevance 피드에만 적용)
+        feed_states: {url: 요청 상태} (crud.get_feed_states 형식). 조건부 요청에 사용하고,
+            수집 후 새 상태로 갱신된다. 저장은 호출자 책임 (파이프라인 완료 후).
+        fetch_stats: 조건부 요청 통계를 기록할 객체
+        known_links: 링크 목록 중 이미 저장된 링크를 돌려주는 함수. 피드마다 한 번
+            호출해, 저장된 항목은 관련성 필터 전에 건너뛴다.
+
+    내보낸 항목은 feed_url을 가지며, 저장(또는 DB 중복 확인)된 뒤 settle()로
+    알려야 피드 수위에 반영된다. finalize()가 수위/최근 링크를 feed_states에 쓴다.
+    """
+
+    def __init__(
+        self,
+        sources_file: str = "sources.json",
+        relevance_filter=None,
+        feed_states: Optional[Dict[str, dict]] = None,
+        fetch_stats: Optional[FeedFetchStats] = None,
+        known_links: Optional[Callable[[List[str]], Iterable[str]]] = None,
+    ):
         self.sources = []
         self.relevance_filter = relevance_filter
+        self.feed_states = feed_states if feed_states is not None else {}
+        self.fetch_stats = fetch_stats or FeedFetchStats()
+        self.known_links = known_links
+        self._marks: Dict[str, _HighWaterMark] = {}
+        # 피드별로 내보냈지만 아직 처리되지 않은 항목 {feed_url: {link: 발행 시각}}
+        self._pending: Dict[str, Dict[str, Optional[datetime]]] = {}
+        self._lock = threading.Lock()
         self._load_sources(sources_file)
 
     def _load_sources(self, filename: str):
@@ -72,72 +152,199 @@ class RSSCollector:
 
     def fetch_feeds(self) -> List[ArticleDict]:
         results = []
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        }
+        for feed_results in self.iter_feeds():
+            results.extend(feed_results)
+        return results
+
+    def iter_feeds(self) -> Iterator[List[ArticleDict]]:
+        """모든 피드를 동시에 요청하고, 응답이 도착하는 순서대로 파싱 결과를 yield"""
+        configs_by_url: Dict[str, List[dict]] = {}
         for source_config in self.sources:
-            url = source_config['url']
-            source_name = source_config['name']
-            max_items = source_config.get('max_items', 50)
-            should_filter = source_config.get('filter_relevance', False)
-            category = source_config.get('category', 'News')
-
-            try:
-                response = _fetch_with_retry(url, headers)
-                feed = feedparser.parse(_fix_escaped_cdata(response.content))
-
-                if feed.bozo:
-                    logger.warning(f"피드 파싱 오류 {url}: {feed.bozo_exception}")
-                    continue
+            configs_by_url.setdefault(source_config['url'], []).append(source_config)
+
+        started = time.time()
+        fetcher = FeedFetcher(
+            headers=HEADERS,
+            max_concurrency=settings.RSS_MAX_CONCURRENCY,
+            per_host_limit=settings.RSS_PER_HOST_LIMIT,
+            per_host_rate=settings.RSS_HOST_RATE_LIMIT,
+            request_timeout=settings.RSS_FETCH_TIMEOUT,
+            feed_deadline=settings.RSS_FEED_DEADLINE,
+        )
+        stats = self.fetch_stats
+        stats.feeds_requested += len(configs_by_url)
+        for response in fetcher.iter_completed(list(configs_by_url), self.feed_states):
+            url = response.url
+            if not response.ok:
+                logger.error(f"피드 수집 실패 {url}: {response.error}")
+                continue
+
+            previous = self.feed_states.get(url) or {}
+            now = datetime.now(timezone.utc)
+            if response.not_modified:
+                stats.feeds_not_modified += 1
+                stats.bytes_saved += previous.get("content_length") or 0
+                self.feed_states[url] = {**previous, "last_run_at": now}
+                logger.info(f"RSS 변경 없음 (304): {url}")
+                continue
+
+            body_hash = hashlib.sha256(response.content).hexdigest()
+            stats.bytes_downloaded += len(response.content)
+            state = {
+                "etag": response.etag,
+                "last_modified": response.last_modified,
+                "body_hash": body_hash,
+                "content_length": len(response.content),
+                "last_run_at": now,
+            }
+            if body_hash == previous.get("body_hash"):
+                stats.feeds_unchanged += 1
+                self.feed_states[url] = state
+                logger.info(f"RSS 변경 없음 (본문 동일): {url}")
+                continue
+
+            parsed = True
+            mark = _HighWaterMark(
+                previous.get("high_water_published"),
+                previous.get("seen_links"),
+                capacity=max(
+                    [SEEN_LINKS_MIN] + [c.get('max_items', 50) * 4 for c in configs_by_url[url]]
+                ),
+            )
+            for source_config in configs_by_url[url]:
+                try:
+                    results = self._parse_feed(source_config, response.content, mark)
+                except Exception as e:
+                    logger.error(f"피드 처리 실패 {url}: {e}")
+                    results = None
+                if results is None:
+                    parsed = False
+                elif results:
+                    yield results
 
-                collected_count = 0
-                for entry in feed.entries:
-                    # 1. max_items 체크
-                    if collected_count >= max_items:
+            # 파싱에 실패한 피드는 다음 실행에서 다시 처리하도록 상태를 남기지 않음
+            # (수위/최근 링크는 항목 처리 결과가 나온 뒤 finalize에서 기록)
+            if parsed:
+                self.feed_states[url] = state
+                self._marks[url] = mark
+
+        logger.info(f"RSS 피드 {len(configs_by_url)}개 요청 완료: {time.time() - started:.1f}초")
+
+    def settle(self, feed_url: str, link: str) -> None:
+        """내보낸 항목의 처리 완료 (저장됨 / 이미 저장돼 있음) — 스레드 안전"""
+        with self._lock:
+            pending = self._pending.get(feed_url)
+            if pending is None or link not in pending:
+                return
+            published = pending.pop(link)
+            self._marks[feed_url].record(link, published)
+
+    def finalize(self) -> None:
+        """처리 결과를 반영한 수위/최근 링크를 feed_states에 기록
+
+        처리되지 않은 항목이 남은 피드는 검증자(ETag/Last-Modified/본문 해시)를 지워
+        다음 실행에서 304/본문 동일로 건너뛰지 않고 다시 파싱하게 한다.
+        """
+        with self._lock:
+            for url, mark in self._marks.items():
+                pending = self._pending.get(url) or {}
+                state = self.feed_states.setdefault(url, {})
+                state["high_water_published"] = mark.capped(pending.values())
+                state["seen_links"] = mark.links
+                if pending:
+                    state.update(etag=None, last_modified=None, body_hash=None)
+                    logger.info(f"RSS 미처리 항목 {len(pending)}개, 다음 실행에서 재수집: {url}")
+
+    def _parse_feed(
+        self, source_config: dict, content: bytes, mark: Optional[_HighWaterMark] = None
+    ) -> Optional[List[ArticleDict]]:
+        """피드 본문을 아티클 목록으로 변환 (파싱 오류면 None)
+
+        mark가 주어지면 이미 본 항목은 관련성 필터 전에 건너뛰고 (이미 저장된
+        항목도 건너뜀), 연속 KNOWN_STOP_AFTER개가 이미 본 항목이면 순회를 멈춘다.
+        관련성 필터 탈락/이미 저장된 항목은 mark에 바로 기록하고, 반환하는 항목은
+        settle() 전까지 미처리로 남긴다.
+        """
+        url = source_config['url']
+        source_name = source_config['name']
+        max_items = source_config.get('max_items', 50)
+        should_filter = source_config.get('filter_relevance', False)
+        category = source_config.get('category', 'News')
+
+        feed = feedparser.parse(_fix_escaped_cdata(content))
+        if feed.bozo:
+            logger.warning(f"피드 파싱 오류 {url}: {feed.bozo_exception}")
+            return None
+
+        stored = set()
+        if self.known_links is not None:
+            links = [getattr(entry, 'link', '') for entry in feed.entries]
+            stored = set(self.known_links([link for link in links if link]))
+
+        results = []
+        known_run = 0
+        for entry in feed.entries:
+            # 1. max_items 체크
+            if len(results) >= max_items:
+                break
+
+            entry_date = _parse_datetime(
+                getattr(entry, 'published_parsed', None)
+                or getattr(entry, 'updated_parsed', None)
+            )
+            published = entry_date or datetime.now(timezone.utc)
+
+            title = _clean_text(getattr(entry, 'title', ''))[:settings.TITLE_MAX_LENGTH]
+            link = getattr(entry, 'link', '')
+            summary = _clean_text(getattr(entry, 'summary', ''))[:settings.SUMMARY_MAX_LENGTH]
+            source = feed.feed.get('title', source_name)[:settings.SOURCE_MAX_LENGTH]
+
+            if not link:
+                continue
+
+            # 2. 이미 본 영역이면 건너뛰고, 연속으로 나오면 중단 (피드는 최신순)
+            if mark is not None:
+                if mark.is_known(link, entry_date):
+                    known_run += 1
+                    if known_run >= KNOWN_STOP_AFTER:
                         break
+                    continue
+                known_run = 0
+            if link in stored:
+                if mark is not None:
+                    mark.record(link, entry_date)
+                continue
+
+            # 3. 관련성 필터 적용
+            if should_filter and self.relevance_filter:
+                is_relevant, meta = self.relevance_filter.is_medically_relevant(
+                    title, summary, source_name
+                )
+                if not is_relevant:
+                    logger.info(f"필터링됨 [{source_name}]: {title[:50]}...")
+                    if mark is not None:
+                        mark.record(link, entry_date)
+                    continue
+
+            if mark is not None:
+                with self._lock:
+                    self._pending.setdefault(url, {})[link] = entry_date
 
-                    published = _parse_datetime_safe(
-                        getattr(entry, 'published_parsed', None)
-                        or getattr(entry, 'updated_parsed', None)
-                    )
-
-                    title = _clean_text(getattr(entry, 'title', ''))[:settings.TITLE_MAX_LENGTH]
-                    link = getattr(entry, 'link', '')
-                    summary = _clean_text(getattr(entry, 'summary', ''))[:settings.SUMMARY_MAX_LENGTH]
-                    source = feed.feed.get('title', source_name)[:settings.SOURCE_MAX_LENGTH]
-
-                    if not link:
-                        continue
-
-                    # 2. 관련성 필터 적용
-                    if should_filter and self.relevance_filter:
-                        is_relevant, meta = self.relevance_filter.is_medically_relevant(
-                            title, summary, source_name
-                        )
-                        if not is_relevant:
-                            logger.info(f"필터링됨 [{source_name}]: {title[:50]}...")
-                            continue
-
-                    # 3. category 필드는 collect_data.py의 categorize_source에서 결정됨
-                    # 여기서는 sources.json의 category를 임시로 저장
-                    results.append({
-                        "title": title,
-                        "link": link,
-                        "summary": summary,
-                        "published": published,
-                        "source": source,
-                        "source_type": "RSS",
-                        "category": category  # 임시 카테고리 (나중에 categorize_source로 재분류됨)
-                    })
-                    collected_count += 1
-
-                logger.info(f"RSS 수집 완료 [{source_name}]: {collected_count}개")
-
-            except Exception as e:
-                logger.error(f"피드 수집 실패 {url}: {e}")
-
-            time.sleep(1.0)
+            # 4. category 필드는 collect_data.py의 categorize_source에서 결정됨
+            # 여기서는 sources.json의 category를 임시로 저장
+            results.append({
+                "title": title,
+                "link": link,
+                "summary": summary,
+                "published": published,
+                "source": source,
+                "source_type": "RSS",
+                "doi": getattr(entry, 'prism_doi', '') or '',  # 저널 피드의 <prism:doi>
+                "feed_url": url,  # 처리 후 settle()에 사용
+                "category": category  # 임시 카테고리 (나중에 categorize_source로 재분류됨)
+            })
 
+        logger.info(f"RSS 수집 완료 [{source_name}]: {len(results)}개")
         return results
 
 
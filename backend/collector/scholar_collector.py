@@ -1,42 +1,212 @@
+"""Google Scholar 수집기
+
+scholarly는 요청을 끊을 방법이 없고, CAPTCHA에 걸리면 응답 없이 멈춘다.
+스레드로 타임아웃을 걸면 포기한 스레드가 소켓과 메모리를 쥔 채 API 프로세스
+(스케줄러)에 남으므로, 검색은 spawn한 워커 프로세스에서 실행하고
+마감(SCHOLAR_KEYWORD_TIMEOUT)을 넘기면 워커를 종료한다.
+
+성공한 키워드 결과는 SQLite 캐시(SCHOLAR_CACHE_PATH)에 SCHOLAR_CACHE_TTL 동안
+보관해, 최근에 검색한 키워드는 Scholar에 다시 묻지 않는다.
+"""
+
 import json
+import multiprocessing
 import os
-import time
+import sys
 import logging
-import threading
-from typing import List, Dict
+from multiprocessing.connection import Connection
+from typing import Callable, Iterator, List, Dict, Optional
 from datetime import datetime
 from scholarly import scholarly
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import BACKEND_DIR, settings
+from utils.cache_backends import SQLiteCache
+from utils.rate_limit import get_rate_limiter
+
 logger = logging.getLogger(__name__)
 
-KEYWORD_TIMEOUT = 15  # seconds per keyword search
+WORKER_START_TIMEOUT = 30  # 워커 프로세스 시작(import) 대기 (초)
+WORKER_STOP_TIMEOUT = 5  # 종료 요청 후 대기 (초), 넘으면 kill
+CACHE_MAX_ENTRIES = 4096
+
+
+def _search_keyword(keyword: str, max_results: int) -> List[Dict]:
+    """Search a single keyword and return article dicts."""
+    results = []
+    search_query = scholarly.search_pubs(keyword)
+    for _ in range(max_results):
+        try:
+            pub = next(search_query)
+        except StopIteration:
+            break
+
+        bib = pub.get('bib', {})
+        title = bib.get('title', '')
+        abstract = bib.get('abstract', '')
+        pub_year = bib.get('pub_year', '')
+
+        # Parse publication date (scholarly only provides year)
+        if pub_year:
+            try:
+                published = datetime(int(pub_year), 1, 1)
+            except (ValueError, TypeError):
+                published = datetime.now()
+        else:
+            published = datetime.now()
 
+        # Determine URL: prefer pub_url, fall back to eprint (PDF link)
+        link = (pub.get('pub_url')
+                or pub.get('eprint_url')
+                or bib.get('url', ''))
 
-def _run_with_timeout(func, args=(), timeout=KEYWORD_TIMEOUT):
-    """Run *func* in a daemon thread; return (result, None) or (None, TimeoutError)."""
-    result = [None]
-    error = [None]
+        if not link:
+            continue
 
-    def target():
+        results.append({
+            "title": title,
+            "link": link,
+            "summary": abstract,
+            "published": published,
+            "source": "Google Scholar",
+            "source_type": "Scholar",
+            "keywords": keyword,
+        })
+
+    return results
+
+
+def _worker_main(conn: Connection, search: Callable[[str, int], List[Dict]] = _search_keyword) -> None:
+    """워커 프로세스: (keyword, max_results)를 받아 ("ok", 결과) / ("error", 메시지) 응답"""
+    conn.send(("ready", None))
+    while True:
         try:
-            result[0] = func(*args)
+            task = conn.recv()
+        except EOFError:
+            break
+        if task is None:
+            break
+        keyword, max_results = task
+        try:
+            conn.send(("ok", search(keyword, max_results)))
         except Exception as e:
-            error[0] = e
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+    conn.close()
+
+
+class ScholarProcessExecutor:
+    """scholarly 검색을 별도 프로세스에서 실행하고 마감을 넘기면 프로세스를 종료
 
-    t = threading.Thread(target=target, daemon=True)
-    t.start()
-    t.join(timeout=timeout)
+    워커 하나를 키워드 사이에 재사용하고(시작 비용: scholarly import),
+    종료된 뒤 다음 검색에서 새로 띄운다. spawn 방식이라 부모의 스레드/소켓
+    상태를 물려받지 않는다.
+
+    search_fn은 워커 프로세스에서 실행할 검색 함수로, spawn 시 이름으로
+    전달되므로 모듈 최상위 함수여야 한다.
+    """
+
+    def __init__(
+        self,
+        start_timeout: float = WORKER_START_TIMEOUT,
+        search_fn: Callable[[str, int], List[Dict]] = _search_keyword,
+    ):
+        self.start_timeout = start_timeout
+        self.search_fn = search_fn
+        self._context = multiprocessing.get_context("spawn")
+        self._process: Optional[multiprocessing.process.BaseProcess] = None
+        self._conn: Optional[Connection] = None
+        self.killed = 0
+
+    def _start(self) -> None:
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main, args=(child_conn, self.search_fn), name="scholar-worker", daemon=True
+        )
+        process.start()
+        child_conn.close()
+        self._process, self._conn = process, parent_conn
+
+        if not parent_conn.poll(self.start_timeout):
+            self._kill()
+            raise RuntimeError(f"Scholar 워커 시작 실패 ({self.start_timeout:g}초 초과)")
+        try:
+            parent_conn.recv()
+        except EOFError:
+            self._kill()
+            raise RuntimeError("Scholar 워커 시작 중 종료됨")
 
-    if t.is_alive():
-        return None, TimeoutError(f"{func.__name__} timed out after {timeout}s")
-    if error[0] is not None:
-        return None, error[0]
-    return result[0], None
+    def _kill(self) -> None:
+        process, conn = self._process, self._conn
+        self._process = self._conn = None
+        if conn is not None:
+            conn.close()
+        if process is None:
+            return
+        if process.is_alive():
+            process.terminate()
+            process.join(WORKER_STOP_TIMEOUT)
+            if process.is_alive():
+                process.kill()
+                process.join()
+            self.killed += 1
+        process.close()
+
+    def search(self, keyword: str, max_results: int, timeout: float) -> List[Dict]:
+        """키워드 검색. 마감을 넘기면 워커를 종료하고 TimeoutError."""
+        if self._process is None or not self._process.is_alive():
+            self._kill()
+            self._start()
+
+        try:
+            self._conn.send((keyword, max_results))
+            if not self._conn.poll(timeout):
+                self._kill()
+                raise TimeoutError(f"'{keyword}' 검색이 {timeout:g}초 안에 끝나지 않음")
+            status, payload = self._conn.recv()
+        except (EOFError, BrokenPipeError, ConnectionResetError) as e:
+            self._kill()
+            raise RuntimeError(f"Scholar 워커 비정상 종료 ({type(e).__name__})") from e
+
+        if status != "ok":
+            raise RuntimeError(payload)
+        return payload
+
+    def close(self) -> None:
+        """워커에 종료를 요청하고, 응답이 없으면 kill"""
+        if self._conn is not None and self._process is not None and self._process.is_alive():
+            try:
+                self._conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            self._process.join(WORKER_STOP_TIMEOUT)
+        self._kill()
+
+    def __enter__(self) -> "ScholarProcessExecutor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _open_cache() -> Optional[SQLiteCache]:
+    """키워드 결과 캐시 (TTL 0이면 None)"""
+    if settings.SCHOLAR_CACHE_TTL <= 0:
+        return None
+    path = settings.SCHOLAR_CACHE_PATH or str(BACKEND_DIR / "scholar_cache.db")
+    try:
+        return SQLiteCache(
+            path, default_ttl=settings.SCHOLAR_CACHE_TTL, max_entries=CACHE_MAX_ENTRIES
+        )
+    except Exception as e:
+        logger.warning(f"Scholar 캐시 열기 실패 ({path}): {e} — 캐시 없이 진행")
+        return None
 
 
 class GoogleScholarCollector:
     def __init__(self, sources_file: str = "sources.json"):
         self.keywords = []
+        self.cache_hits = 0
         self._load_sources(sources_file)
 
     def _load_sources(self, filename: str):
@@ -51,74 +221,56 @@ class GoogleScholarCollector:
             logger.error(f"소스 파일 로드 실패 ({filename}): {e}")
 
     def _search_keyword(self, keyword: str, max_results: int) -> List[Dict]:
-        """Search a single keyword and return article dicts."""
-        results = []
-        search_query = scholarly.search_pubs(keyword)
-        for _ in range(max_results):
-            try:
-                pub = next(search_query)
-            except StopIteration:
-                break
+        """Search a single keyword in this process (no timeout)."""
+        return _search_keyword(keyword, max_results)
 
-            bib = pub.get('bib', {})
-            title = bib.get('title', '')
-            abstract = bib.get('abstract', '')
-            pub_year = bib.get('pub_year', '')
-
-            # Parse publication date (scholarly only provides year)
-            if pub_year:
-                try:
-                    published = datetime(int(pub_year), 1, 1)
-                except (ValueError, TypeError):
-                    published = datetime.now()
-            else:
-                published = datetime.now()
-
-            # Determine URL: prefer pub_url, fall back to eprint (PDF link)
-            link = (pub.get('pub_url')
-                    or pub.get('eprint_url')
-                    or bib.get('url', ''))
+    def search_articles(self, max_results: int = 3) -> List[Dict]:
+        all_results = []
+        for results in self.iter_articles(max_results):
+            all_results.extend(results)
+        return all_results
 
-            if not link:
-                continue
+    def iter_articles(self, max_results: int = 3) -> Iterator[List[Dict]]:
+        """키워드 하나를 검색할 때마다 그 결과를 yield (스트리밍 파이프라인용)
 
-            results.append({
-                "title": title,
-                "link": link,
-                "summary": abstract,
-                "published": published,
-                "source": "Google Scholar",
-                "source_type": "Scholar",
-                "keywords": keyword,
-            })
+        캐시에 있는 키워드는 검색하지 않고 캐시된 결과를 사용한다.
+        """
+        # 차단을 피하기 위한 키워드 검색 간격 (프로세스 공유 "scholar" 버킷)
+        limiter = get_rate_limiter("scholar", settings.SCHOLAR_RATE_LIMIT)
+        timeout = settings.SCHOLAR_KEYWORD_TIMEOUT
+        cache = _open_cache()
+        self.cache_hits = 0
 
-        return results
+        with ScholarProcessExecutor() as executor:
+            for keyword in self.keywords:
+                key = f"scholar:{keyword}:{max_results}"
+                result = cache.get(key) if cache is not None else None
+                if result is not None:
+                    self.cache_hits += 1
+                    if result:
+                        yield result
+                    continue
 
-    def search_articles(self, max_results: int = 3) -> List[Dict]:
-        all_results = []
-        for keyword in self.keywords:
-            result, err = _run_with_timeout(
-                self._search_keyword, args=(keyword, max_results), timeout=KEYWORD_TIMEOUT
-            )
-
-            if isinstance(err, TimeoutError):
-                logger.warning(
-                    f"Google Scholar 키워드 '{keyword}' 타임아웃 ({KEYWORD_TIMEOUT}초) — "
-                    f"CAPTCHA 가능성. 나머지 키워드 건너뜀."
-                )
-                break
-            elif err is not None:
-                logger.error(f"Google Scholar 검색 실패 (키워드: '{keyword}'): {err}")
-                continue
-
-            if result:
-                all_results.extend(result)
-
-            # Delay between keyword searches to avoid being blocked
-            time.sleep(2)
+                limiter.acquire()
+                try:
+                    result = executor.search(keyword, max_results, timeout)
+                except TimeoutError:
+                    logger.warning(
+                        f"Google Scholar 키워드 '{keyword}' 타임아웃 ({timeout}초) — "
+                        f"CAPTCHA 가능성. 워커 종료, 나머지 키워드 건너뜀."
+                    )
+                    break
+                except Exception as e:
+                    logger.error(f"Google Scholar 검색 실패 (키워드: '{keyword}'): {e}")
+                    continue
 
-        return all_results
+                if cache is not None:
+                    cache.set(key, result)  # 결과 없음도 캐시 (TTL 동안 재검색 안 함)
+                if result:
+                    yield result
 
+        if self.cache_hits:
+            logger.info(f"Google Scholar 캐시 적중: 키워드 {self.cache_hits}/{len(self.keywords)}개")
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
@@ -49,6 +49,27 @@ class Settings:
         # 기본값: SQLite (backend 디렉토리의 mdinfo.db)
         return f"sqlite:///{BACKEND_DIR}/mdinfo.db"
 
+    # 앱 시작 시 스키마 마이그레이션 실행 여부 (운영에서는 python -m backend.migrate로 분리)
+    DB_AUTO_MIGRATE: bool = os.getenv("DB_AUTO_MIGRATE", "false").lower() == "true"
+
+    # SQLite 성능 프로파일 (DATABASE_URL이 SQLite일 때만 적용)
+    # WAL: 쓰기 중에도 읽기가 막히지 않음 (수집 중 API 지연 방지)
+    SQLITE_WAL: bool = os.getenv("SQLITE_WAL", "true").lower() == "true"
+    SQLITE_SYNCHRONOUS: str = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    SQLITE_MMAP_SIZE: int = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+    # 페이지 캐시 크기 (KiB, 커넥션별)
+    SQLITE_CACHE_SIZE_KB: int = int(os.getenv("SQLITE_CACHE_SIZE_KB", "65536"))
+    SQLITE_BUSY_TIMEOUT_MS: int = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    # API용 읽기 전용 풀과 파이프라인용 단일 쓰기 커넥션 분리
+    SQLITE_SPLIT_READ_WRITE: bool = (
+        os.getenv("SQLITE_SPLIT_READ_WRITE", "true").lower() == "true"
+    )
+    SQLITE_READ_POOL_SIZE: int = int(os.getenv("SQLITE_READ_POOL_SIZE", "5"))
+
+    # 비동기 DB (API 읽기 경로): aiosqlite / asyncpg
+    ASYNC_DB_ENABLED: bool = os.getenv("ASYNC_DB_ENABLED", "true").lower() == "true"
+    ASYNC_DB_POOL_SIZE: int = int(os.getenv("ASYNC_DB_POOL_SIZE", "10"))
+
     # API Server
     ALLOWED_ORIGINS: List[str] = os.getenv(
         "ALLOWED_ORIGINS", "http://localhost:3000"
@@ -64,6 +85,39 @@ class Settings:
     ).split(",")
     CORS_MAX_AGE: int = int(os.getenv("CORS_MAX_AGE", "600"))
 
+    # HTTP 캐시 (ETag / Cache-Control)
+    HTTP_CACHE_MAX_AGE: int = int(os.getenv("HTTP_CACHE_MAX_AGE", "60"))
+    HTTP_CACHE_STALE_WHILE_REVALIDATE: int = int(
+        os.getenv("HTTP_CACHE_STALE_WHILE_REVALIDATE", "300")
+    )
+    # 응답 캐시 TTL (초). 캐시 키에 데이터 세대가 포함되므로 길게 잡아도 안전
+    ARTICLES_CACHE_TTL: int = int(os.getenv("ARTICLES_CACHE_TTL", "3600"))
+    # TTL이 지난 뒤에도 이 시간(초) 동안은 이전 본문을 응답하고 백그라운드에서 갱신
+    # (stale-while-revalidate, 0이면 비활성)
+    ARTICLES_CACHE_STALE_SECONDS: int = int(os.getenv("ARTICLES_CACHE_STALE_SECONDS", "300"))
+    # 응답 캐시 백엔드: memory (워커별) | sqlite (호스트 내 워커 공유) | redis
+    CACHE_BACKEND: str = os.getenv("CACHE_BACKEND", "memory")
+    # sqlite: 캐시 파일 경로, redis: redis://host:6379/0
+    CACHE_URL: str = os.getenv("CACHE_URL", "")
+    CACHE_MAX_ENTRIES: int = int(os.getenv("CACHE_MAX_ENTRIES", "1024"))
+    CACHE_MAX_BYTES: int = int(os.getenv("CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+    CACHE_SWEEP_INTERVAL: int = int(os.getenv("CACHE_SWEEP_INTERVAL", "60"))
+    # 다른 프로세스(수집기)가 올린 데이터 세대를 확인하는 주기 (초)
+    DATA_VERSION_CHECK_SECONDS: float = float(os.getenv("DATA_VERSION_CHECK_SECONDS", "5"))
+
+    # 관련 아티클 유사도 인덱스 (TF-IDF, 기본: backend/similarity_index)
+    SIMILARITY_INDEX_DIR: str = os.getenv("SIMILARITY_INDEX_DIR", "")
+    # API 프로세스가 수집기가 갱신한 인덱스 파일을 다시 확인하는 주기 (초)
+    SIMILARITY_RELOAD_SECONDS: float = float(os.getenv("SIMILARITY_RELOAD_SECONDS", "30"))
+    # delta 세그먼트가 base의 이 비율을 넘으면 병합
+    SIMILARITY_COMPACT_RATIO: float = float(os.getenv("SIMILARITY_COMPACT_RATIO", "0.1"))
+    # 관련 아티클 질의 시간 예산 (python -m backend.similarity_benchmark, p95 ms)
+    SIMILARITY_QUERY_BUDGET_MS: float = float(os.getenv("SIMILARITY_QUERY_BUDGET_MS", "10"))
+
+    # 수집한 URL의 Bloom 필터 (기본: backend/url_index.bloom). 수집기가 DB 조회 전에 사용
+    URL_INDEX_PATH: str = os.getenv("URL_INDEX_PATH", "")
+    URL_INDEX_FP_RATE: float = float(os.getenv("URL_INDEX_FP_RATE", "0.001"))  # 목표 오탐률
+
     # OpenAI
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
     OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "gpt-4o")
@@ -72,8 +126,18 @@ class Settings:
 
     # Collection
     MAX_SUMMARY_WORKERS: int = int(os.getenv("MAX_SUMMARY_WORKERS", "5"))
+    PIPELINE_QUEUE_SIZE: int = int(os.getenv("PIPELINE_QUEUE_SIZE", "50"))  # 수집 단계 간 큐 상한
     SCHOLAR_TIMEOUT: int = int(os.getenv("SCHOLAR_TIMEOUT", "60"))
-    RSS_FETCH_TIMEOUT: int = int(os.getenv("RSS_FETCH_TIMEOUT", "10"))
+    SCHOLAR_RATE_LIMIT: float = float(os.getenv("SCHOLAR_RATE_LIMIT", "0.5"))  # 초당 키워드 검색 수
+    SCHOLAR_KEYWORD_TIMEOUT: int = int(os.getenv("SCHOLAR_KEYWORD_TIMEOUT", "15"))  # 키워드당 마감 (초)
+    # 키워드별 검색 결과 캐시 (SQLite 파일, 기본: backend/scholar_cache.db). TTL 0이면 사용 안 함
+    SCHOLAR_CACHE_PATH: str = os.getenv("SCHOLAR_CACHE_PATH", "")
+    SCHOLAR_CACHE_TTL: int = int(os.getenv("SCHOLAR_CACHE_TTL", str(7 * 24 * 3600)))
+    RSS_FETCH_TIMEOUT: int = int(os.getenv("RSS_FETCH_TIMEOUT", "10"))  # 요청 1회 타임아웃 (초)
+    RSS_FEED_DEADLINE: float = float(os.getenv("RSS_FEED_DEADLINE", "30"))  # 피드당 재시도 포함 총 시간 (초)
+    RSS_MAX_CONCURRENCY: int = int(os.getenv("RSS_MAX_CONCURRENCY", "20"))  # 동시 요청 수 (전체)
+    RSS_PER_HOST_LIMIT: int = int(os.getenv("RSS_PER_HOST_LIMIT", "2"))  # 같은 호스트 동시 요청 수
+    RSS_HOST_RATE_LIMIT: float = float(os.getenv("RSS_HOST_RATE_LIMIT", "1.0"))  # 호스트별 초당 요청 수
 
     # Limits
     TITLE_MAX_LENGTH: int = int(os.getenv("TITLE_MAX_LENGTH", "500"))
@@ -82,6 +146,16 @@ class Settings:
 
     # PubMed
     PUBMED_EMAIL: str = os.getenv("PUBMED_EMAIL", "")
+    # E-utilities 직접 호출 (esearch 전체 → 신규 PMID만 배치 efetch). false면 pymed로 쿼리별 수집
+    PUBMED_USE_EUTILS: bool = os.getenv("PUBMED_USE_EUTILS", "true").lower() == "true"
+    # NCBI API 키가 있으면 초당 10회, 없으면 3회까지 허용
+    NCBI_API_KEY: str = os.getenv("NCBI_API_KEY", "")
+    NCBI_RATE_LIMIT: float = float(os.getenv("NCBI_RATE_LIMIT", "10" if NCBI_API_KEY else "3"))
+    # 마지막 성공 실행 이후 등록된 논문만 검색 (esearch mindate)
+    PUBMED_INCREMENTAL: bool = os.getenv("PUBMED_INCREMENTAL", "true").lower() == "true"
+
+    # API 시작 시간 예산 (python -m backend.startup_benchmark, import backend.main 기준 ms)
+    STARTUP_IMPORT_BUDGET_MS: int = int(os.getenv("STARTUP_IMPORT_BUDGET_MS", "1500"))
 
     # Scheduler
     SCHEDULER_ENABLED: bool = os.getenv("SCHEDULER_ENABLED", "false").lower() == "true"
@@ -1,33 +1,104 @@
+import base64
+import json
 import logging
-from typing import Optional, List
-from sqlalchemy.orm import Session
+from typing import Any, Callable, Dict, Iterator, Optional, List
+
+import anyio
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, load_only
 from sqlalchemy.exc import IntegrityError
-from . import models
-from datetime import datetime
+from . import models, search_index
+from .utils.canonical import identity_keys
+from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
 
+# 검색어 필터 개수 추정 시 세는 최대 행 수
+SEARCH_COUNT_CAP = 1000
+
+
+def get_article(db: Session, article_id: int) -> Optional[models.Article]:
+    """ID로 아티클 조회"""
+    return db.get(models.Article, article_id)
+
+
+def get_articles_by_ids(
+    db: Session, article_ids: List[int], fields: Optional[List[str]] = None
+) -> List[models.Article]:
+    """ID 목록으로 아티클 조회 (입력 순서 유지, 없는 ID는 제외)"""
+    if not article_ids:
+        return []
+    query = _project(db.query(models.Article), fields)
+    by_id = {a.id: a for a in query.filter(models.Article.id.in_(article_ids))}
+    return [by_id[i] for i in article_ids if i in by_id]
+
 
 def get_article_by_url(db: Session, url: str) -> Optional[models.Article]:
     """URL로 아티클 조회"""
     return db.query(models.Article).filter(models.Article.url == url).first()
 
+def get_or_create_source(
+    db: Session,
+    name: str,
+    category: Optional[str] = None,
+    source_type: Optional[str] = None,
+) -> models.Source:
+    """이름으로 소스 조회, 없으면 생성해 커밋
+
+    Args:
+        name: 아티클의 source 문자열
+        category / source_type: categorize_source 분류 결과 (신규 생성 시 저장)
+    """
+    source = db.query(models.Source).filter(models.Source.name == name).first()
+    if source is not None:
+        return source
+
+    try:
+        source = models.Source(name=name, category=category, source_type=source_type)
+        db.add(source)
+        db.commit()
+        return source
+    except IntegrityError:
+        # 다른 프로세스가 먼저 생성한 경우
+        db.rollback()
+        return db.query(models.Source).filter(models.Source.name == name).one()
+
+
 def create_article(db: Session, article_data: dict) -> Optional[models.Article]:
     try:
+        source_id = None
+        if article_data.get("source"):
+            source_id = get_or_create_source(
+                db,
+                article_data["source"],
+                category=article_data.get("category", "paper"),
+                source_type=article_data.get("source_type", "RSS"),
+            ).id
+
+        keys = identity_keys(article_data.get("link"), article_data.get("doi"))
         db_article = models.Article(
             title=article_data.get("title"),
             title_ko=article_data.get("title_ko"),
             url=article_data.get("link"),
+            canonical_id=keys[0] if keys else None,
+            doi=article_data.get("doi") or None,
             source=article_data.get("source"),
+            source_id=source_id,
             category=article_data.get("category", "paper"),
             source_type=article_data.get("source_type", "RSS"),
             published_date=article_data.get("published"),
             summary=article_data.get("summary"),
             original_abstract=article_data.get("original_abstract", ""),
             keywords=article_data.get("keywords", ""),
-            created_at=datetime.now()
+            created_at=datetime.now(timezone.utc)
         )
         db.add(db_article)
+        db.flush()  # 중복이면 여기서 IntegrityError → 카운터 갱신 전에 롤백
+        _add_identities(db, db_article.id, keys)
+        _increment_article_count(db, db_article.category, db_article.source)
         db.commit()
         db.refresh(db_article)
         return db_article
@@ -46,8 +117,138 @@ def get_articles(db: Session, skip: int = 0, limit: int = 100) -> List[models.Ar
 
 
 def get_articles_count(db: Session) -> int:
-    """전체 아티클 개수 반환"""
-    return db.query(models.Article).count()
+    """전체 아티클 개수 반환 (카운터 테이블 기준)"""
+    return count_articles(db)[0]
+
+
+# INSERT ... ON CONFLICT DO UPDATE를 지원하는 방언별 insert
+_UPSERT_INSERTS = {"sqlite": sqlite_insert, "postgresql": postgresql_insert}
+
+
+def _increment_article_count(db: Session, category: Optional[str], source: Optional[str]) -> None:
+    """(category, source) 카운터 1 증가. 커밋은 호출자가 아티클과 함께 수행.
+
+    INSERT ... ON CONFLICT DO UPDATE 한 문장으로 증가시키므로, 같은 키의 첫
+    아티클을 동시에 저장해도 카운터 INSERT가 충돌해 아티클이 롤백되지 않는다.
+    """
+    key = {"category": category or "", "source": source or ""}
+    insert = _UPSERT_INSERTS.get(db.get_bind().dialect.name)
+    if insert is not None:
+        table = models.ArticleCount.__table__
+        db.execute(
+            insert(table)
+            .values(count=1, **key)
+            .on_conflict_do_update(
+                index_elements=[table.c.category, table.c.source],
+                set_={"count": table.c.count + 1},
+            )
+        )
+        return
+
+    # 그 외 방언: 갱신 후 없으면 추가
+    updated = (
+        db.query(models.ArticleCount)
+        .filter_by(**key)
+        .update({models.ArticleCount.count: models.ArticleCount.count + 1})
+    )
+    if not updated:
+        db.add(models.ArticleCount(count=1, **key))
+
+
+def rebuild_article_counts(db: Session) -> int:
+    """articles 테이블로부터 카운터 전체 재계산, 카운터 행 수 반환"""
+    rows = (
+        db.query(models.Article.category, models.Article.source, func.count(models.Article.id))
+        .group_by(models.Article.category, models.Article.source)
+        .all()
+    )
+    db.query(models.ArticleCount).delete()
+    counts: dict[tuple[str, str], int] = {}
+    for category, source, count in rows:
+        key = (category or "", source or "")
+        counts[key] = counts.get(key, 0) + count
+    db.add_all(
+        models.ArticleCount(category=category, source=source, count=count)
+        for (category, source), count in counts.items()
+    )
+    db.commit()
+    return len(counts)
+
+
+def rebuild_sources(db: Session) -> int:
+    """articles.source로 sources 테이블을 채우고 source_id 역채움, 갱신된 아티클 수 반환"""
+    existing = {name for (name,) in db.query(models.Source.name)}
+    rows = (
+        db.query(models.Article.source, models.Article.category, models.Article.source_type)
+        .filter(models.Article.source.isnot(None))
+        .distinct()
+        .all()
+    )
+    for name, category, source_type in rows:
+        if name not in existing:
+            db.add(models.Source(name=name, category=category, source_type=source_type))
+            existing.add(name)
+    db.flush()
+
+    source_id = (
+        select(models.Source.id)
+        .where(models.Source.name == models.Article.source)
+        .scalar_subquery()
+    )
+    updated = (
+        db.query(models.Article)
+        .filter(models.Article.source_id.is_(None), models.Article.source.isnot(None))
+        .update({models.Article.source_id: source_id}, synchronize_session=False)
+    )
+    db.commit()
+    return updated
+
+
+def list_sources(db: Session) -> List[dict]:
+    """소스 목록과 소스별 아티클 개수 (카운터 테이블 합계)"""
+    rows = (
+        db.query(
+            models.Source,
+            func.coalesce(func.sum(models.ArticleCount.count), 0),
+        )
+        .outerjoin(models.ArticleCount, models.ArticleCount.source == models.Source.name)
+        .group_by(models.Source.id)
+        .order_by(models.Source.name)
+        .all()
+    )
+    return [
+        {
+            "id": source.id,
+            "name": source.name,
+            "category": source.category,
+            "source_type": source.source_type,
+            "article_count": int(count),
+        }
+        for source, count in rows
+    ]
+
+
+def _estimate_row_count(db: Session, query) -> tuple[int, bool]:
+    """검색 쿼리 결과 개수 추정 → (개수, 추정치 여부)
+
+    PostgreSQL은 플래너 추정치를, 그 외는 SEARCH_COUNT_CAP까지만 센다.
+    """
+    bind = db.get_bind()
+    if bind.dialect.name == "postgresql":
+        compiled = query.statement.compile(dialect=bind.dialect)
+        params = compiled.params
+        if compiled.positional:  # asyncpg 등 위치 기반 파라미터 드라이버
+            params = tuple(params[name] for name in compiled.positiontup)
+        plan = db.connection().exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {compiled}", params
+        ).scalar()
+        return int(plan[0]["Plan"]["Plan Rows"]), True
+
+    capped = query.with_entities(models.Article.id).limit(SEARCH_COUNT_CAP + 1).subquery()
+    count = db.query(func.count()).select_from(capped).scalar()
+    if count > SEARCH_COUNT_CAP:
+        return SEARCH_COUNT_CAP, True
+    return count, False
 
 
 def get_existing_urls(db: Session, urls: List[str]) -> set:
@@ -69,6 +270,246 @@ def get_existing_urls(db: Session, urls: List[str]) -> set:
     return {row[0] for row in existing}
 
 
+def _add_identities(db: Session, article_id: int, keys: List[str]) -> None:
+    """아티클의 식별자 저장 (다른 아티클이 이미 가진 식별자는 건너뜀). 커밋은 호출자가 수행."""
+    if not keys:
+        return
+    table = models.ArticleIdentity.__table__
+    rows = [{"key": key, "article_id": article_id} for key in keys]
+    insert = _UPSERT_INSERTS.get(db.get_bind().dialect.name)
+    if insert is not None:
+        db.execute(insert(table).values(rows).on_conflict_do_nothing(index_elements=[table.c.key]))
+        return
+
+    existing = get_existing_identity_keys(db, keys)
+    db.add_all(models.ArticleIdentity(**row) for row in rows if row["key"] not in existing)
+
+
+def get_existing_identity_keys(db: Session, keys: List[str]) -> set:
+    """식별자 목록 중 이미 저장된 아티클이 가진 식별자 집합 반환 (배치 조회)"""
+    if not keys:
+        return set()
+
+    existing = db.query(models.ArticleIdentity.key).filter(
+        models.ArticleIdentity.key.in_(keys)
+    ).all()
+    return {row[0] for row in existing}
+
+
+def backfill_article_identities(db: Session, batch_size: int = 1000) -> int:
+    """식별자가 저장되지 않은 아티클의 식별자(URL + DOI)와 canonical_id 채우기
+
+    Returns:
+        처리한 아티클 수
+    """
+    has_identity = (
+        select(models.ArticleIdentity.article_id)
+        .where(models.ArticleIdentity.article_id == models.Article.id)
+        .exists()
+    )
+    processed = 0
+    after_id = 0
+    while True:
+        rows = (
+            db.query(models.Article.id, models.Article.url, models.Article.doi,
+                     models.Article.canonical_id)
+            .filter(models.Article.id > after_id, ~has_identity)
+            .order_by(models.Article.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            break
+        updates = []
+        for article_id, url, doi, current in rows:
+            keys = identity_keys(url, doi)
+            _add_identities(db, article_id, keys)
+            if current is None:
+                # URL이 없으면 다시 조회되지 않도록 빈 문자열
+                updates.append({"id": article_id, "canonical_id": keys[0] if keys else ""})
+        if updates:
+            db.bulk_update_mappings(models.Article, updates)
+        db.commit()
+        processed += len(rows)
+        after_id = rows[-1][0]
+    return processed
+
+
+def get_feed_states(db: Session) -> Dict[str, dict]:
+    """RSS 피드별 요청 상태
+
+    Returns:
+        {url: {etag, last_modified, body_hash, content_length, last_run_at,
+               high_water_published, seen_links(list)}}
+    """
+    return {
+        state.url: {
+            "etag": state.etag,
+            "last_modified": state.last_modified,
+            "body_hash": state.body_hash,
+            "content_length": state.content_length,
+            "last_run_at": state.last_run_at,
+            "high_water_published": state.high_water_published,
+            "seen_links": json.loads(state.seen_links) if state.seen_links else [],
+        }
+        for state in db.query(models.FeedState).all()
+    }
+
+
+def save_feed_states(db: Session, states: Dict[str, dict]) -> None:
+    """RSS 피드별 요청 상태 저장 (url 기준 upsert, 주어진 키만 갱신)"""
+    for url, values in states.items():
+        state = db.get(models.FeedState, url) or models.FeedState(url=url)
+        for key, value in values.items():
+            if key == "seen_links":
+                value = json.dumps(value, ensure_ascii=False)
+            setattr(state, key, value)
+        db.add(state)
+    db.commit()
+
+
+def get_checkpoint(db: Session, name: str) -> Optional[datetime]:
+    """수집기의 마지막 성공 실행 시각 (없으면 None)"""
+    checkpoint = db.get(models.CollectorCheckpoint, name)
+    if checkpoint is None:
+        return None
+    value = checkpoint.last_success_at
+    # SQLite는 타임존을 저장하지 않으므로 naive 값은 UTC로 간주
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def set_checkpoint(db: Session, name: str, succeeded_at: datetime) -> None:
+    """수집기의 마지막 성공 실행 시각 기록"""
+    checkpoint = db.get(models.CollectorCheckpoint, name) or models.CollectorCheckpoint(name=name)
+    checkpoint.last_success_at = succeeded_at
+    db.add(checkpoint)
+    db.commit()
+
+
+def encode_cursor(article: models.Article) -> str:
+    """아티클의 (published_date, id)로 불투명 커서 문자열 생성"""
+    published = article.published_date.isoformat() if article.published_date else ""
+    raw = f"{published}|{article.id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[Optional[datetime], int]:
+    """커서 문자열을 (published_date, id)로 복원
+
+    Raises:
+        ValueError: 잘못된 형식의 커서
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        published, article_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return (datetime.fromisoformat(published) if published else None), int(article_id)
+    except Exception as e:
+        raise ValueError(f"잘못된 커서: {cursor}") from e
+
+
+def _keyset_page(query, cursor: Optional[str], count: int) -> List[models.Article]:
+    """정렬 순서(published_date DESC NULLS LAST, id DESC)상 커서 이후 count건
+
+    날짜 있는 구간과 날짜 없는 꼬리를 각각 키셋으로 조회한다. 날짜 구간은
+    (published_date, id) < (:p, :id) 행 값 비교라 (필터, published_date, id)
+    인덱스를 역순 범위 스캔하며 정렬 없이 count건에서 멈춘다.
+    날짜 구간이 모자랄 때만 꼬리(published_date IS NULL, id DESC)를 이어 읽는다.
+
+    Raises:
+        ValueError: 잘못된 형식의 커서
+    """
+    published, article_id = decode_cursor(cursor) if cursor else (None, None)
+    published_col = models.Article.published_date
+    id_col = models.Article.id
+
+    articles = []
+    if cursor is None or published is not None:
+        dated = query.filter(published_col.isnot(None))
+        if cursor is not None:
+            dated = dated.filter(tuple_(published_col, id_col) < tuple_(published, article_id))
+        articles = dated.order_by(published_col.desc(), id_col.desc()).limit(count).all()
+
+    if len(articles) < count:
+        undated = query.filter(published_col.is_(None))
+        if cursor is not None and published is None:
+            undated = undated.filter(id_col < article_id)
+        articles += undated.order_by(id_col.desc()).limit(count - len(articles)).all()
+    return articles
+
+
+def _project(query, fields: Optional[List[str]]):
+    """지정한 컬럼만 로드 (id, published_date는 커서 생성을 위해 항상 포함)"""
+    if not fields:
+        return query
+    columns = {"id", "published_date", *fields}
+    return query.options(load_only(*(getattr(models.Article, name) for name in sorted(columns))))
+
+
+def _filtered_query(
+    db: Session,
+    category: Optional[str] = None,
+    source: Optional[str] = None,
+    search: Optional[str] = None,
+    source_id: Optional[int] = None,
+    q: Optional[str] = None,
+):
+    query = db.query(models.Article)
+
+    # 카테고리 필터링
+    if category and category in ('news', 'paper'):
+        query = query.filter(models.Article.category == category)
+
+    # 소스 필터링 (source_id는 정확 일치 → 인덱스 범위 스캔, source는 부분 일치)
+    if source_id is not None:
+        query = query.filter(models.Article.source_id == source_id)
+    if source:
+        query = query.filter(models.Article.source.ilike(f"%{source}%"))
+
+    # 검색어 필터링 (제목, 한글 제목, 요약 부분 일치 - 단어 중간 일치 포함)
+    if search:
+        query = query.filter(search_index.like_clause(search))
+
+    # 전문 검색 (/articles/search, 토큰 접두사 일치)
+    if q:
+        query = query.filter(search_index.match_clause(db, q))
+
+    return query
+
+
+def count_articles(
+    db: Session,
+    category: Optional[str] = None,
+    source: Optional[str] = None,
+    search: Optional[str] = None,
+    source_id: Optional[int] = None,
+    q: Optional[str] = None,
+) -> tuple[int, bool]:
+    """필터에 해당하는 아티클 개수 반환 (articles 테이블 COUNT(*) 없음)
+
+    category/source 필터는 카운터 테이블 합계로 정확히 계산하고,
+    검색어(search: 부분 일치, q: 전문 검색)가 있으면 추정치를 반환한다.
+
+    Returns:
+        (개수, 추정치 여부) 튜플
+    """
+    if search or q:
+        return _estimate_row_count(
+            db, _filtered_query(db, category, source, search, source_id=source_id, q=q)
+        )
+
+    query = db.query(func.coalesce(func.sum(models.ArticleCount.count), 0))
+    if category and category in ('news', 'paper'):
+        query = query.filter(models.ArticleCount.category == category)
+    if source_id is not None:
+        source_name = (
+            select(models.Source.name).where(models.Source.id == source_id).scalar_subquery()
+        )
+        query = query.filter(models.ArticleCount.source == source_name)
+    if source:
+        query = query.filter(models.ArticleCount.source.ilike(f"%{source}%"))
+    return int(query.scalar()), False
+
+
 def get_articles_filtered(
     db: Session,
     skip: int = 0,
@@ -76,48 +517,218 @@ def get_articles_filtered(
     category: Optional[str] = None,
     source: Optional[str] = None,
     search: Optional[str] = None,
-) -> tuple[int, List[models.Article]]:
+    cursor: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    source_id: Optional[int] = None,
+) -> tuple[List[models.Article], Optional[str]]:
     """필터링/검색을 지원하는 아티클 목록 조회
 
+    전체 개수는 포함하지 않는다. 필요하면 count_articles를 사용한다.
+    cursor가 주어지면(또는 skip이 0이면) 키셋 페이지네이션을 사용한다.
+    (필터, published_date, id) 인덱스 범위 스캔으로 시작하므로 깊은 페이지도
+    첫 페이지와 같은 비용이 든다 (_keyset_page).
+
     Args:
         db: DB 세션
-        skip: 건너뛸 항목 수
+        skip: 건너뛸 항목 수 (cursor가 있으면 무시)
         limit: 반환할 최대 항목 수
         category: 카테고리 필터링 ('news', 'paper', 'all' 또는 None)
         source: 소스별 필터링 (부분 일치)
-        search: 제목/요약 검색어
+        search: 제목/요약 검색어 (부분 일치)
+        cursor: 이전 응답의 next_cursor
+        fields: 로드할 컬럼 목록 (None이면 전체). 지정하지 않은 컬럼은 지연 로드된다.
+        source_id: 소스 ID 정확 일치 필터 (/sources의 id)
 
     Returns:
-        (전체 개수, 아티클 목록) 튜플
+        (아티클 목록, 다음 페이지 커서) 튜플.
+        다음 페이지가 없으면 커서는 None.
+
+    Raises:
+        ValueError: 잘못된 형식의 커서
     """
-    query = db.query(models.Article)
+    query = _filtered_query(
+        db, category=category, source=source, search=search, source_id=source_id
+    )
+    query = _project(query, fields)
+
+    # 정렬 및 페이지네이션 (다음 페이지 존재 여부 확인을 위해 1건 더 조회)
+    if cursor or not skip:
+        articles = _keyset_page(query, cursor or None, limit + 1)
+    else:
+        articles = (
+            query.order_by(
+                models.Article.published_date.desc().nulls_last(),
+                models.Article.id.desc(),
+            )
+            .offset(skip)
+            .limit(limit + 1)
+            .all()
+        )
+
+    next_cursor = None
+    if len(articles) > limit:
+        articles = articles[:limit]
+        next_cursor = encode_cursor(articles[-1])
+
+    return articles, next_cursor
+
+
+def search_articles(
+    db: Session,
+    q: str,
+    skip: int = 0,
+    limit: int = 20,
+    category: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+) -> tuple[List[models.Article], bool]:
+    """전문 검색 인덱스를 이용한 관련도순 아티클 검색
+
+    전체 개수는 포함하지 않는다. 필요하면 count_articles(q=q)를 사용한다.
+
+    Args:
+        db: DB 세션
+        q: 검색어 (한국어/영어, 공백 구분 토큰은 AND 조건)
+        skip: 건너뛸 항목 수
+        limit: 반환할 최대 항목 수
+        category: 카테고리 필터링 ('news', 'paper', 'all' 또는 None)
+        fields: 로드할 컬럼 목록 (None이면 전체)
+
+    Returns:
+        (아티클 목록, 다음 페이지 존재 여부) 튜플
+    """
+    query = _project(search_index.ranked_query(db, q), fields)
 
-    # 카테고리 필터링
     if category and category in ('news', 'paper'):
         query = query.filter(models.Article.category == category)
 
-    # 소스 필터링
-    if source:
-        query = query.filter(models.Article.source.ilike(f"%{source}%"))
+    articles = query.offset(skip).limit(limit + 1).all()
 
-    # 검색어 필터링 (제목, 한글 제목, 요약에서 검색)
-    if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            (models.Article.title.ilike(search_term))
-            | (models.Article.title_ko.ilike(search_term))
-            | (models.Article.summary.ilike(search_term))
-        )
+    has_more = len(articles) > limit
+    return articles[:limit], has_more
 
-    # 전체 개수 (필터 적용 후)
-    total = query.count()
 
-    # 정렬 및 페이지네이션
-    articles = (
-        query.order_by(models.Article.published_date.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
+# 내보내기 시 DB 커서에서 한 번에 가져오는 행 수
+EXPORT_BATCH_SIZE = 1000
+
+
+def iter_articles_for_export(
+    db: Session,
+    columns: List[str],
+    category: Optional[str] = None,
+    source: Optional[str] = None,
+    search: Optional[str] = None,
+    since: Optional[datetime] = None,
+    batch_size: int = EXPORT_BATCH_SIZE,
+    source_id: Optional[int] = None,
+) -> Iterator[List[tuple]]:
+    """필터링된 아티클 전체를 배치 단위로 스트리밍 조회
+
+    ORM 객체 대신 컬럼 튜플을 yield_per로 가져온다. PostgreSQL에서는 서버 측
+    커서(stream_results)를, SQLite에서는 커서 순회를 사용하므로 결과 크기와
+    관계없이 메모리 사용량이 batch_size 수준으로 유지된다. COUNT와 OFFSET이
+    없어 전체 덤프 비용은 행 수에 비례한다.
+
+    Args:
+        db: DB 세션 (순회가 끝날 때까지 열려 있어야 함)
+        columns: 내보낼 Article 컬럼 이름 목록
+        category: 카테고리 필터링 ('news', 'paper', 'all' 또는 None)
+        source: 소스별 필터링 (부분 일치)
+        search: 제목/요약 검색어 (부분 일치)
+        since: 이 시각 이후에 수집된(created_at) 아티클만
+        batch_size: 한 번에 가져올 행 수
+        source_id: 소스 ID 정확 일치 필터
+
+    Yields:
+        행 튜플 목록 (columns 순서)
+    """
+    query = _filtered_query(
+        db, category=category, source=source, search=search, source_id=source_id
+    )
+
+    if since is not None:
+        if since.tzinfo is not None and db.get_bind().dialect.name == "sqlite":
+            # SQLite는 타임존 없이 저장하므로 created_at은 naive UTC
+            # (create_article과 server_default(CURRENT_TIMESTAMP) 모두 UTC로 기록)
+            since = since.astimezone(timezone.utc).replace(tzinfo=None)
+        query = query.filter(models.Article.created_at >= since)
+
+    statement = (
+        query.with_entities(*(getattr(models.Article, name) for name in columns))
+        .order_by(models.Article.id)
+        .statement.execution_options(yield_per=batch_size)
     )
 
-    return total, articles
+    for partition in db.execute(statement).partitions():
+        yield [tuple(row) for row in partition]
+
+
+def iter_article_urls(
+    db: Session, after_id: int = 0, batch_size: int = EXPORT_BATCH_SIZE
+) -> Iterator[List[tuple]]:
+    """after_id보다 큰 ID의 (id, url)을 ID 순서로 배치 단위 스트리밍 (URL 인덱스 생성/동기화용)"""
+    statement = (
+        select(models.Article.id, models.Article.url)
+        .where(models.Article.id > after_id)
+        .order_by(models.Article.id)
+        .execution_options(yield_per=batch_size)
+    )
+    for partition in db.execute(statement).partitions():
+        yield [tuple(row) for row in partition]
+
+
+def get_max_article_id(db: Session) -> int:
+    """가장 큰 아티클 ID (없으면 0)"""
+    return db.execute(select(func.max(models.Article.id))).scalar() or 0
+
+
+# ── 비동기 읽기 함수 ──────────────────────────────────────────
+# 조회 로직은 위 동기 함수를 그대로 사용한다. AsyncSession이면 run_sync로
+# 이벤트 루프 위(greenlet)에서 실행하므로 스레드풀을 점유하지 않는다.
+
+
+async def run_read(db: Any, fn: Callable, *args, **kwargs):
+    """동기 조회 함수를 비동기로 실행
+
+    Args:
+        db: AsyncSession 또는 (비동기 드라이버 미설치 시) 동기 Session
+        fn: 첫 인자로 동기 Session을 받는 조회 함수
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args, **kwargs)
+    return await anyio.to_thread.run_sync(lambda: fn(db, *args, **kwargs))
+
+
+async def get_article_async(db: Any, article_id: int) -> Optional[models.Article]:
+    """ID로 아티클 조회 (비동기)"""
+    return await run_read(db, get_article, article_id)
+
+
+async def get_articles_filtered_async(
+    db: Any, **kwargs
+) -> tuple[List[models.Article], Optional[str]]:
+    """get_articles_filtered의 비동기 버전 (인자 동일)"""
+    return await run_read(db, get_articles_filtered, **kwargs)
+
+
+async def count_articles_async(db: Any, **kwargs) -> tuple[int, bool]:
+    """count_articles의 비동기 버전 (인자 동일)"""
+    return await run_read(db, count_articles, **kwargs)
+
+
+async def get_articles_by_ids_async(
+    db: Any, article_ids: List[int], fields: Optional[List[str]] = None
+) -> List[models.Article]:
+    """get_articles_by_ids의 비동기 버전"""
+    return await run_read(db, get_articles_by_ids, article_ids, fields)
+
+
+async def list_sources_async(db: Any) -> List[dict]:
+    """list_sources의 비동기 버전"""
+    return await run_read(db, list_sources)
+
+
+async def search_articles_async(
+    db: Any, q: str, **kwargs
+) -> tuple[List[models.Article], bool]:
+    """search_articles의 비동기 버전 (인자 동일)"""
+    return await run_read(db, search_articles, q, **kwargs)
@@ -0,0 +1,111 @@
+"""데이터 세대(generation) 관리 모듈
+
+아티클 데이터는 수집 파이프라인이 저장할 때만 바뀌므로, 저장 단계가 끝날 때
+세대 번호를 올리고 API는 이 번호로 변경 여부를 판단한다.
+
+세대 번호는 DB(data_version 테이블)에 있어 API와 수집기가 다른 프로세스여도
+공유된다. API 요청마다 DB를 읽지 않도록 DATA_VERSION_CHECK_SECONDS 동안
+프로세스 내에 보관한다. 비동기 엔드포인트는 이벤트 루프를 막지 않도록
+get_data_version_async()로 요청의 비동기 세션을 통해 읽는다.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from . import crud, models
+from .config import settings
+from .database import ReadSessionLocal
+
+logger = logging.getLogger(__name__)
+
+_VERSION_ID = 1
+
+_lock = threading.Lock()
+_current: Optional[Tuple[int, datetime]] = None
+_checked_at = 0.0
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite는 타임존을 저장하지 않으므로 naive 값은 UTC로 간주
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def ensure_data_version(db: Session) -> None:
+    """세대 행이 없으면 생성"""
+    if db.get(models.DataVersion, _VERSION_ID) is None:
+        db.add(
+            models.DataVersion(
+                id=_VERSION_ID, generation=1, updated_at=datetime.now(timezone.utc)
+            )
+        )
+        db.commit()
+
+
+def _load(db: Session) -> Tuple[int, datetime]:
+    row = db.get(models.DataVersion, _VERSION_ID, populate_existing=True)
+    if row is None:
+        return 0, datetime.fromtimestamp(0, timezone.utc)
+    return row.generation, _as_utc(row.updated_at)
+
+
+def get_data_version() -> Tuple[int, datetime]:
+    """현재 (세대 번호, 변경 시각) 반환. 최근 확인값이 유효하면 DB를 읽지 않는다."""
+    global _current, _checked_at
+
+    with _lock:
+        if _current is not None and time.monotonic() - _checked_at < settings.DATA_VERSION_CHECK_SECONDS:
+            return _current
+
+        db = ReadSessionLocal()
+        try:
+            _current = _load(db)
+        finally:
+            db.close()
+        _checked_at = time.monotonic()
+        return _current
+
+
+async def get_data_version_async(db: Any) -> Tuple[int, datetime]:
+    """get_data_version의 비동기 버전 (db: 요청의 AsyncSession 또는 동기 Session)
+
+    최근 확인값이 유효하면 잠금 없이 바로 반환하고, 만료됐으면 crud.run_read로
+    읽는다. 이벤트 루프에서 _lock(스레드 잠금)을 기다리지 않는다.
+    """
+    global _current, _checked_at
+
+    current, checked_at = _current, _checked_at
+    if current is not None and time.monotonic() - checked_at < settings.DATA_VERSION_CHECK_SECONDS:
+        return current
+
+    version = await crud.run_read(db, _load)
+    _current, _checked_at = version, time.monotonic()
+    return version
+
+
+def bump_data_version(db: Session) -> int:
+    """세대 번호를 원자적으로 1 증가시키고 새 번호 반환"""
+    global _current, _checked_at
+
+    ensure_data_version(db)
+    db.query(models.DataVersion).filter(models.DataVersion.id == _VERSION_ID).update(
+        {
+            models.DataVersion.generation: models.DataVersion.generation + 1,
+            models.DataVersion.updated_at: datetime.now(timezone.utc),
+        }
+    )
+    db.commit()
+
+    version = _load(db)
+    with _lock:
+        _current = version
+        _checked_at = time.monotonic()
+
+    logger.info(f"데이터 세대 갱신: {version[0]}")
+    return version[0]
@@ -1,32 +1,246 @@
-from sqlalchemy import create_engine
+import logging
+from contextlib import asynccontextmanager
+
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 from .config import Settings
 
+logger = logging.getLogger(__name__)
+
 SQLALCHEMY_DATABASE_URL = Settings.get_database_url()
 
+IS_SQLITE = SQLALCHEMY_DATABASE_URL.startswith("sqlite")
+
+# 인메모리 DB는 커넥션마다 별개의 DB이므로 읽기/쓰기 분리 불가
+_SQLITE_IN_MEMORY = IS_SQLITE and (
+    ":memory:" in SQLALCHEMY_DATABASE_URL
+    or SQLALCHEMY_DATABASE_URL.rstrip("/") in ("sqlite:", "sqlite+pysqlite:")
+)
+SPLIT_READ_WRITE = IS_SQLITE and Settings.SQLITE_SPLIT_READ_WRITE and not _SQLITE_IN_MEMORY
+
+
+def _sqlite_pragmas(read_only: bool = False) -> list:
+    """커넥션마다 적용할 SQLite PRAGMA 목록"""
+    pragmas = [
+        f"PRAGMA busy_timeout = {Settings.SQLITE_BUSY_TIMEOUT_MS}",
+        f"PRAGMA synchronous = {Settings.SQLITE_SYNCHRONOUS}",
+        f"PRAGMA mmap_size = {Settings.SQLITE_MMAP_SIZE}",
+        f"PRAGMA cache_size = -{Settings.SQLITE_CACHE_SIZE_KB}",
+        "PRAGMA temp_store = MEMORY",
+    ]
+    if read_only:
+        pragmas.append("PRAGMA query_only = ON")
+    elif Settings.SQLITE_WAL and not _SQLITE_IN_MEMORY:
+        # journal_mode는 DB 파일에 영구 저장되므로 쓰기 커넥션에서만 설정
+        pragmas.insert(0, "PRAGMA journal_mode = WAL")
+    return pragmas
+
+
+def _apply_sqlite_pragmas(engine, read_only: bool = False) -> None:
+    pragmas = _sqlite_pragmas(read_only)
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
 # SQLite는 check_same_thread=False 필요, PostgreSQL은 불필요
-if SQLALCHEMY_DATABASE_URL.startswith("sqlite"):
-    engine = create_engine(
-        SQLALCHEMY_DATABASE_URL,
-        connect_args={"check_same_thread": False},
-    )
+if IS_SQLITE:
+    if SPLIT_READ_WRITE:
+        # 쓰기는 커넥션 하나로 직렬화 (SQLite는 동시에 한 명만 쓸 수 있음)
+        engine = create_engine(
+            SQLALCHEMY_DATABASE_URL,
+            connect_args={"check_same_thread": False},
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=60,
+        )
+        # API 읽기 전용 풀 (WAL에서는 쓰기 중에도 마지막 커밋 스냅샷을 읽음)
+        read_engine = create_engine(
+            SQLALCHEMY_DATABASE_URL,
+            connect_args={"check_same_thread": False},
+            pool_size=Settings.SQLITE_READ_POOL_SIZE,
+            max_overflow=0,
+        )
+        _apply_sqlite_pragmas(engine)
+        _apply_sqlite_pragmas(read_engine, read_only=True)
+    else:
+        engine = create_engine(
+            SQLALCHEMY_DATABASE_URL,
+            connect_args={"check_same_thread": False},
+        )
+        read_engine = engine
+        _apply_sqlite_pragmas(engine)
 else:
-    # PostgreSQL, MySQL 등
+    # PostgreSQL, MySQL 등 (MVCC로 읽기/쓰기가 서로 막지 않으므로 엔진 공유)
     engine = create_engine(
         SQLALCHEMY_DATABASE_URL,
         pool_size=5,
         max_overflow=10,
         pool_pre_ping=True,
     )
+    read_engine = engine
 
+# 쓰기 세션 (수집 파이프라인, 스키마 생성)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# 읽기 세션 (API 조회). 읽기/쓰기 분리가 없으면 SessionLocal과 같은 엔진 사용
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
 
 Base = declarative_base()
 
+
+def _async_database_url(url: str):
+    """동기 URL → 비동기 드라이버 URL (지원하지 않는 DB면 None)"""
+    scheme, sep, rest = url.partition("://")
+    if scheme in ("sqlite", "sqlite+pysqlite"):
+        return f"sqlite+aiosqlite{sep}{rest}"
+    if scheme in ("postgresql", "postgresql+psycopg2", "postgres"):
+        return f"postgresql+asyncpg{sep}{rest}"
+    return None
+
+
+# 비동기 엔진 (API 읽기 경로 전용, 수집 파이프라인은 동기 엔진 사용)
+# 드라이버(aiosqlite / asyncpg) 미설치 시 None → 동기 세션으로 폴백
+async_engine = None
+AsyncSessionLocal = None
+
+_async_url = _async_database_url(SQLALCHEMY_DATABASE_URL) if Settings.ASYNC_DB_ENABLED else None
+if _async_url:
+    try:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        if _async_url.startswith("sqlite"):
+            if SPLIT_READ_WRITE:
+                async_engine = create_async_engine(
+                    _async_url, pool_size=Settings.SQLITE_READ_POOL_SIZE, max_overflow=0
+                )
+            else:
+                async_engine = create_async_engine(_async_url)
+            _apply_sqlite_pragmas(async_engine.sync_engine, read_only=SPLIT_READ_WRITE)
+        else:
+            async_engine = create_async_engine(
+                _async_url,
+                pool_size=Settings.ASYNC_DB_POOL_SIZE,
+                max_overflow=10,
+                pool_pre_ping=True,
+            )
+        AsyncSessionLocal = async_sessionmaker(
+            async_engine, autoflush=False, expire_on_commit=False
+        )
+    except ImportError as e:
+        logger.warning(f"비동기 DB 드라이버가 없어 동기 세션을 사용합니다: {e}")
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+def get_read_db():
+    """읽기 전용 세션 의존성"""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@asynccontextmanager
+async def async_read_session():
+    """비동기 읽기 세션 (비동기 드라이버가 없으면 동기 읽기 세션으로 폴백)
+
+    crud의 *_async 함수는 두 경우 모두 처리한다.
+    """
+    if AsyncSessionLocal is None:
+        db = ReadSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+        return
+
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_async_db():
+    """비동기 세션 의존성"""
+    async with async_read_session() as db:
+        yield db
+
+
+def _add_missing_columns() -> None:
+    """기존 테이블에 모델에 새로 추가된 (nullable) 컬럼 추가
+
+    create_all은 이미 존재하는 테이블을 변경하지 않는다.
+    """
+    inspector = inspect(engine)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing or not column.nullable:
+                continue
+            column_type = column.type.compile(engine.dialect)
+            ddl = f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"
+            for fk in column.foreign_keys:
+                ddl += f" REFERENCES {fk.column.table.name}({fk.column.name})"
+            with engine.begin() as conn:
+                conn.execute(text(ddl))
+            logger.info(f"컬럼 추가: {table.name}.{column.name}")
+
+
+# id가 빠져 키셋 페이지네이션에 쓰이지 않는 이전 인덱스 (*_published_id로 대체)
+_OBSOLETE_INDEXES = ("idx_category_published", "idx_source_published")
+
+
+def init_db() -> None:
+    """테이블 및 인덱스 생성
+
+    create_all은 이미 존재하는 테이블의 신규 인덱스를 만들지 않으므로,
+    모델에 추가된 인덱스는 checkfirst로 개별 생성한다.
+    모델에 추가된 nullable 컬럼은 ALTER TABLE로 추가한다.
+    전문 검색 인덱스(FTS5 / tsvector), 아티클 개수 카운터, 소스 테이블,
+    데이터 세대 행도 함께 준비한다.
+    """
+    from . import models
+    from .crud import backfill_article_identities, rebuild_article_counts, rebuild_sources
+    from .data_version import ensure_data_version
+    from .search_index import setup_search_index
+
+    Base.metadata.create_all(bind=engine)
+    _add_missing_columns()
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+    with engine.begin() as conn:
+        for name in _OBSOLETE_INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+    setup_search_index(engine)
+
+    # 카운터 테이블이 새로 생긴 경우 기존 아티클로 채우기
+    db = SessionLocal()
+    try:
+        if db.query(models.ArticleCount).first() is None and db.query(models.Article).first():
+            rebuild_article_counts(db)
+        # source_id 컬럼이 새로 생긴 경우 소스 테이블 채우기
+        unlinked = db.query(models.Article.id).filter(
+            models.Article.source_id.is_(None), models.Article.source.isnot(None)
+        )
+        if unlinked.first() is not None:
+            rebuild_sources(db)
+        # 식별자 테이블이 새로 생긴 경우 기존 아티클의 URL(+ DOI)로 채우기
+        if db.query(models.ArticleIdentity.key).first() is None and db.query(models.Article.id).first():
+            logger.info(f"아티클 식별자 채움: {backfill_article_identities(db)}건")
+        ensure_data_version(db)
+    finally:
+        db.close()
@@ -0,0 +1,86 @@
+"""아티클 대량 내보내기 (NDJSON / CSV 스트리밍)
+
+분석 작업이 /articles/를 100건씩 페이지로 넘기면 매 요청마다 COUNT와
+OFFSET 스캔이 반복되어 전체 덤프 비용이 제곱으로 늘어난다.
+/articles/export는 결과 전체를 한 번의 커서 순회로 스트리밍한다.
+
+응답 본문은 DB 배치 단위로 직렬화해 내보내므로 메모리 사용량은
+테이블 크기와 관계없이 배치 하나 수준으로 유지된다.
+"""
+
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Iterator, List, Optional
+
+from . import crud
+from .database import ReadSessionLocal
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"JSON으로 직렬화할 수 없는 값: {type(value).__name__}")
+
+
+def _format_ndjson(columns: List[str], rows: List[tuple]) -> str:
+    return "".join(
+        json.dumps(dict(zip(columns, row)), ensure_ascii=False, default=_json_default) + "\n"
+        for row in rows
+    )
+
+
+def _format_csv(rows: List[tuple]) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows(
+        [value.isoformat() if isinstance(value, datetime) else value for value in row]
+        for row in rows
+    )
+    return buffer.getvalue()
+
+
+def stream_articles(
+    fmt: str,
+    columns: List[str],
+    category: Optional[str] = None,
+    source: Optional[str] = None,
+    search: Optional[str] = None,
+    since: Optional[datetime] = None,
+    source_id: Optional[int] = None,
+) -> Iterator[bytes]:
+    """내보내기 본문 청크 생성기
+
+    StreamingResponse가 응답을 모두 보낼 때까지 순회하므로 요청 의존성의
+    세션 대신 전용 세션을 열고, 순회가 끝나거나 클라이언트가 연결을 끊으면 닫는다.
+
+    Args:
+        fmt: 'ndjson' 또는 'csv'
+        columns: 내보낼 Article 컬럼 이름 목록
+        category / source / search / since / source_id: crud.iter_articles_for_export 참고
+    """
+    db = ReadSessionLocal()
+    try:
+        if fmt == "csv":
+            # 엑셀에서 한글이 깨지지 않도록 BOM 포함
+            yield ("\ufeff" + _format_csv([tuple(columns)])).encode()
+
+        for rows in crud.iter_articles_for_export(
+            db,
+            columns,
+            category=category,
+            source=source,
+            search=search,
+            since=since,
+            source_id=source_id,
+        ):
+            chunk = _format_csv(rows) if fmt == "csv" else _format_ndjson(columns, rows)
+            yield chunk.encode()
+    finally:
+        db.close()
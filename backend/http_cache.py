@@ -0,0 +1,121 @@
+"""HTTP 조건부 요청(ETag / Last-Modified / 304) 처리
+
+ETag는 데이터 세대와 요청 경로/쿼리로 만든 강한 검증자다. 같은 세대의 같은
+요청은 항상 같은 본문을 반환하므로, 클라이언트나 CDN이 보낸 검증자가 일치하면
+DB나 응답 캐시를 거치지 않고 304로 응답한다.
+"""
+
+import hashlib
+from datetime import datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional, Tuple
+
+from fastapi import Request, Response
+
+from .config import settings
+from .data_version import get_data_version
+
+
+def _make_etag(request: Request, generation: int, variant: str = "") -> str:
+    target = f"{request.url.path}?{request.url.query}"
+    digest = hashlib.md5(target.encode()).hexdigest()[:16]
+    suffix = f"-{variant}" if variant else ""
+    return f'"{generation}-{digest}{suffix}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    # If-None-Match는 약한 비교 (W/ 접두사 무시)
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def _not_modified_since(if_modified_since: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    # HTTP 날짜는 초 단위
+    return last_modified.replace(microsecond=0) <= since
+
+
+def accepts_gzip(request: Request) -> bool:
+    """클라이언트가 gzip 응답을 받을 수 있는지 여부"""
+    accept_encoding = request.headers.get("accept-encoding", "")
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.strip().partition(";")
+        if name.strip().lower() == "gzip":
+            return params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+def cache_headers(etag: str, last_modified: datetime) -> dict:
+    """검증자 및 Cache-Control 헤더"""
+    return {
+        "ETag": etag,
+        "Last-Modified": format_datetime(last_modified, usegmt=True),
+        "Cache-Control": (
+            f"public, max-age={settings.HTTP_CACHE_MAX_AGE}, "
+            f"stale-while-revalidate={settings.HTTP_CACHE_STALE_WHILE_REVALIDATE}"
+        ),
+        "Vary": "Accept-Encoding",
+    }
+
+
+def evaluate_conditional(
+    request: Request,
+    version: Tuple[int, datetime],
+    variant: str = "",
+) -> Tuple[dict, bool]:
+    """조건부 요청 평가 → (응답 헤더, 304 가능 여부)
+
+    Args:
+        version: get_data_version() 결과
+        variant: 표현 변형 (예: 'gzip'). 인코딩별로 다른 강한 ETag를 만든다.
+    """
+    generation, last_modified = version
+    headers = cache_headers(_make_etag(request, generation, variant), last_modified)
+
+    if_none_match = request.headers.get("if-none-match")
+    if_modified_since = request.headers.get("if-modified-since")
+
+    if if_none_match is not None:
+        not_modified = _etag_matches(if_none_match, headers["ETag"])
+    elif if_modified_since is not None:
+        not_modified = _not_modified_since(if_modified_since, last_modified)
+    else:
+        not_modified = False
+
+    return headers, not_modified
+
+
+def json_bytes_response(body: bytes, headers: dict, gzipped: bool = False) -> Response:
+    """직렬화된 JSON 바이트를 그대로 응답 (response_model 재검증/재직렬화 없음)"""
+    if gzipped:
+        headers = {**headers, "Content-Encoding": "gzip"}
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def check_not_modified(
+    request: Request,
+    response: Response,
+    version: Optional[Tuple[int, datetime]] = None,
+) -> Optional[Response]:
+    """조건부 요청 검사
+
+    검증자가 일치하면 304 응답을 반환한다. 그렇지 않으면 response에 캐시 헤더를
+    설정하고 None을 반환하므로 호출자는 정상적으로 본문을 만들면 된다.
+
+    Args:
+        version: get_data_version() 결과. 응답 캐시 키와 같은 세대를 쓰도록
+            호출자가 한 번 조회해 넘긴다. 비동기 엔드포인트는
+            get_data_version_async() 결과를 넘긴다 (생략 시 동기로 직접 조회).
+    """
+    headers, not_modified = evaluate_conditional(request, version or get_data_version())
+
+    if not_modified:
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return None
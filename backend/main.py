@@ -1,15 +1,38 @@
+import gzip
 import logging
-from fastapi import FastAPI, Depends, Query, Request
-from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
+import struct
+import time
+
+import anyio
+from fastapi import FastAPI, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy import text
-from . import crud, models, database
-from .config import settings
-from .database import get_db
-from .schemas import ArticleResponse, ApiResponse, PaginatedResponse
-from .utils.cache import get_cache, invalidate_cache
+from . import crud, database, similarity
+from .export import EXPORT_FORMATS, stream_articles
+from .config import BACKEND_DIR, settings
+from .database import get_async_db
+from .http_cache import (
+    accepts_gzip,
+    check_not_modified,
+    evaluate_conditional,
+    json_bytes_response,
+)
+from .schemas import (
+    ArticleListItem,
+    ArticleResponse,
+    ApiResponse,
+    PaginatedResponse,
+    RelatedArticle,
+    RelatedResponse,
+    SourceResponse,
+)
+from .data_version import get_data_version, get_data_version_async
+from .utils.cache import configure_cache, generation_key, get_cache, set_generation_provider
+from .utils.singleflight import SingleFlight
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List, Optional
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Any, Awaitable, Callable, List, Optional
 
 logging.basicConfig(
     level=logging.INFO,
@@ -17,7 +40,32 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-models.Base.metadata.create_all(bind=database.engine)
+# 이보다 작은 응답은 gzip 이득이 적어 원본으로 전송
+GZIP_MIN_SIZE = 1024
+
+# 캐시 miss 요청 병합 (키당 DB 조회 1회)
+_single_flight = SingleFlight()
+
+# 캐시 항목: 신선도 만료 시각(float64) + 본문 바이트 (공유 백엔드에 bytes 그대로 저장)
+_ENTRY_HEADER = struct.Struct("<d")
+
+# 응답 본문 생성 함수: 세션을 받아 응답 모델(PaginatedResponse 등) 반환
+BuildFn = Callable[[Any], Awaitable[BaseModel]]
+
+# 스키마 생성/변경은 명시적 마이그레이션 단계(python -m backend.migrate)에서 수행한다.
+# 개발 환경에서는 DB_AUTO_MIGRATE=true로 앱 시작 시 실행할 수 있다.
+
+# 응답 캐시 키에 데이터 세대 포함 → 수집 후 이전 세대 항목은 자동으로 무효
+set_generation_provider(lambda: get_data_version()[0])
+configure_cache(
+    backend=settings.CACHE_BACKEND,
+    url=settings.CACHE_URL or (
+        str(BACKEND_DIR / "response_cache.db") if settings.CACHE_BACKEND == "sqlite" else None
+    ),
+    max_entries=settings.CACHE_MAX_ENTRIES,
+    max_bytes=settings.CACHE_MAX_BYTES,
+    sweep_interval=settings.CACHE_SWEEP_INTERVAL,
+)
 
 app = FastAPI(title="MDinfo API", version="1.0.0")
 
@@ -44,51 +92,369 @@ async def global_exception_handler(request: Request, exc: Exception):
         ).model_dump(),
     )
 
+def _parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """fields 쿼리 파라미터 → 로드할 컬럼 목록 (id는 항상 포함)
+
+    'compact'는 목록 화면용 ArticleListItem 필드 묶음이다.
+    """
+    if not fields:
+        return None
+    if fields == "compact":
+        return list(ArticleListItem.model_fields)
+
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in ArticleResponse.model_fields]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"알 수 없는 필드: {', '.join(unknown)}")
+    return ["id", *(name for name in requested if name != "id")]
+
+
+def _to_items(articles: list, fields: Optional[List[str]]) -> list:
+    """프로젝션 시 로드된 컬럼만 담은 응답 항목 생성 (지연 로드 방지)"""
+    if not fields:
+        return articles
+    return [
+        ArticleResponse.model_validate({name: getattr(article, name) for name in fields})
+        for article in articles
+    ]
+
+
+async def _cache_call(method: Callable, *args, **kwargs) -> Any:
+    """캐시 호출 (파일/네트워크 백엔드는 이벤트 루프를 막지 않도록 스레드에서 실행)"""
+    if settings.CACHE_BACKEND == "memory":
+        return method(*args, **kwargs)
+    return await anyio.to_thread.run_sync(lambda: method(*args, **kwargs))
+
+
+async def _store_json(cache, key: str, body: bytes, fresh_until: Optional[float] = None) -> None:
+    # (신선도 만료 시각, 본문) 저장. 실제 TTL은 stale 허용 구간까지 포함
+    if fresh_until is None:
+        fresh_until = time.time() + settings.ARTICLES_CACHE_TTL
+    await _cache_call(
+        cache.set,
+        key,
+        _ENTRY_HEADER.pack(fresh_until) + body,
+        ttl=settings.ARTICLES_CACHE_TTL + settings.ARTICLES_CACHE_STALE_SECONDS,
+    )
+
+
+async def _render_json(cache_key: str, use_gzip: bool, build: BuildFn, db) -> tuple:
+    """본문 생성 후 캐시 저장 → (본문, gzip 본문 또는 None)"""
+    cache = get_cache()
+    body = (await build(db)).model_dump_json(exclude_unset=True).encode()
+    # 캐시 저장 (세대가 바뀌면 자동 무효화되므로 TTL을 길게 유지)
+    await _store_json(cache, cache_key, body)
+
+    compressed = None
+    if use_gzip and len(body) >= GZIP_MIN_SIZE:
+        compressed = gzip.compress(body, compresslevel=6)
+        await _store_json(cache, f"{cache_key}:gzip", compressed)
+    return body, compressed
+
+
+def _revalidate(cache_key: str, use_gzip: bool, build: BuildFn) -> None:
+    """만료된 항목을 백그라운드에서 갱신 (키당 하나만 실행)
+
+    요청 세션은 응답 후 닫히므로 별도 읽기 세션을 연다.
+    """
+
+    async def refresh():
+        async with database.async_read_session() as db:
+            return await _render_json(cache_key, use_gzip, build, db)
+
+    _single_flight.spawn(cache_key, refresh)
+
+
+async def _cached_json(cache_key: str, use_gzip: bool, build: BuildFn, db):
+    """직렬화된 JSON 바이트 캐시 조회/생성 → (본문, gzip 여부)
+
+    캐시 적중 시 Pydantic 검증/직렬화 없이 바이트를 그대로 반환한다.
+    gzip 변형은 처음 요청될 때 한 번 압축해 별도 키로 캐시한다.
+
+    miss가 동시에 발생하면 키당 한 요청만 DB를 조회하고 나머지는 그 결과를
+    기다린다. 신선도가 지난 항목은 stale 허용 구간 동안 그대로 응답하고
+    백그라운드에서 한 번만 갱신한다.
+    """
+    cache = get_cache()
+    keys = [(f"{cache_key}:gzip", True)] if use_gzip else []
+    keys.append((cache_key, False))
+
+    for key, gzipped in keys:
+        entry = await _cache_call(cache.get, key)
+        if entry is not None:
+            (fresh_until,) = _ENTRY_HEADER.unpack_from(entry)
+            body = entry[_ENTRY_HEADER.size:]
+            if time.time() > fresh_until:
+                _revalidate(cache_key, use_gzip, build)
+            if use_gzip and not gzipped and len(body) >= GZIP_MIN_SIZE:
+                # 원본만 캐시된 상태 (identity 요청이 먼저 옴) → gzip ETag에 맞게 압축
+                body, gzipped = gzip.compress(body, compresslevel=6), True
+                await _store_json(cache, f"{cache_key}:gzip", body, fresh_until)
+            return body, gzipped
+
+    body, compressed = await _single_flight.do(
+        cache_key, lambda: _render_json(cache_key, use_gzip, build, db)
+    )
+    if compressed is None and use_gzip and len(body) >= GZIP_MIN_SIZE:
+        # 선두 요청이 gzip을 받지 않는 클라이언트였던 경우
+        compressed = gzip.compress(body, compresslevel=6)
+        await _store_json(cache, f"{cache_key}:gzip", compressed)
+
+    if compressed is not None and use_gzip:
+        return compressed, True
+    return body, False
+
+
 @app.get("/")
 def read_root():
     return {"message": "Derma-Insight Backend is running!"}
 
-@app.get("/articles/", response_model=PaginatedResponse[ArticleResponse])
-def read_articles(
+@app.get(
+    "/articles/",
+    response_model=PaginatedResponse[ArticleResponse],
+)
+async def read_articles(
+    request: Request,
     skip: int = Query(default=0, ge=0, description="건너뛸 항목 수"),
     limit: int = Query(default=20, ge=1, le=100, description="반환할 최대 항목 수"),
     category: Optional[str] = Query(default=None, description="카테고리 필터링 ('news', 'paper', 'all')"),
-    source: Optional[str] = Query(default=None, description="소스별 필터링"),
+    source: Optional[str] = Query(default=None, description="소스별 필터링 (부분 일치)"),
+    source_id: Optional[int] = Query(default=None, description="소스 ID 필터링 (/sources의 id, 정확 일치)"),
     search: Optional[str] = Query(default=None, description="제목/요약 검색"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(default=None, description="이전 응답의 next_cursor (지정 시 skip 무시)"),
+    include_total: bool = Query(default=True, description="전체 개수 포함 여부 (false면 has_more만 제공)"),
+    fields: Optional[str] = Query(default=None, description="반환할 필드 (쉼표 구분 또는 'compact')"),
+    db=Depends(get_async_db),
 ):
-    """아티클 목록 조회 (페이지네이션, 카테고리, 필터링, 검색 지원)"""
-    cache = get_cache()
-    cache_key = f"articles:{skip}:{limit}:{category}:{source}:{search}"
+    """아티클 목록 조회 (페이지네이션, 카테고리, 필터링, 검색 지원)
 
-    # 캐시 조회
-    cached_result = cache.get(cache_key)
-    if cached_result is not None:
-        return cached_result
+    깊은 페이지는 skip 대신 응답의 next_cursor를 cursor로 넘기는 키셋
+    페이지네이션을 사용한다. skip은 기존 클라이언트 호환용으로 유지된다.
+    목록 화면은 fields=compact로 요약/초록 없이 가볍게 받고,
+    상세는 /articles/{id}로 조회한다.
+    """
+    version = await get_data_version_async(db)
+    use_gzip = accepts_gzip(request)
+    headers, not_modified = evaluate_conditional(request, version, "gzip" if use_gzip else "")
+    if not_modified:
+        return Response(status_code=304, headers=headers)
 
-    # DB 조회
-    total, articles = crud.get_articles_filtered(
-        db, skip=skip, limit=limit, category=category, source=source, search=search
+    if cursor:
+        skip = 0
+    columns = _parse_fields(fields)
+
+    cache_key = generation_key(
+        f"articles:{skip}:{limit}:{category}:{source}:{source_id}:{search}:{cursor}:"
+        f"{include_total}:{fields}",
+        version[0],
     )
 
-    result = PaginatedResponse(
-        items=articles,
-        total=total,
-        skip=skip,
-        limit=limit,
-        has_more=(skip + limit) < total,
+    async def build(db) -> PaginatedResponse:
+        # DB 조회
+        try:
+            articles, next_cursor = await crud.get_articles_filtered_async(
+                db,
+                skip=skip,
+                limit=limit,
+                category=category,
+                source=source,
+                search=search,
+                cursor=cursor,
+                fields=columns,
+                source_id=source_id,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        total, total_is_estimate = None, False
+        if include_total:
+            total, total_is_estimate = await crud.count_articles_async(
+                db, category=category, source=source, search=search, source_id=source_id
+            )
+
+        return PaginatedResponse[ArticleResponse](
+            items=_to_items(articles, columns),
+            total=total,
+            total_is_estimate=total_is_estimate,
+            skip=skip,
+            limit=limit,
+            has_more=next_cursor is not None,
+            next_cursor=next_cursor,
+        )
+
+    body, gzipped = await _cached_json(cache_key, use_gzip, build, db)
+    return json_bytes_response(body, headers, gzipped)
+
+@app.get(
+    "/articles/search",
+    response_model=PaginatedResponse[ArticleResponse],
+)
+async def search_articles(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200, description="검색어 (한국어/영어)"),
+    skip: int = Query(default=0, ge=0, description="건너뛸 항목 수"),
+    limit: int = Query(default=20, ge=1, le=100, description="반환할 최대 항목 수"),
+    category: Optional[str] = Query(default=None, description="카테고리 필터링 ('news', 'paper', 'all')"),
+    include_total: bool = Query(default=True, description="전체 개수(추정치) 포함 여부"),
+    fields: Optional[str] = Query(default=None, description="반환할 필드 (쉼표 구분 또는 'compact')"),
+    db=Depends(get_async_db),
+):
+    """전문 검색 (제목/한글 제목/요약, 관련도순 정렬)"""
+    version = await get_data_version_async(db)
+    use_gzip = accepts_gzip(request)
+    headers, not_modified = evaluate_conditional(request, version, "gzip" if use_gzip else "")
+    if not_modified:
+        return Response(status_code=304, headers=headers)
+
+    columns = _parse_fields(fields)
+
+    cache_key = generation_key(
+        f"articles:search:{q}:{skip}:{limit}:{category}:{include_total}:{fields}", version[0]
     )
 
-    # 캐시 저장 (5분)
-    cache.set(cache_key, result, ttl=300)
-    return result
+    async def build(db) -> PaginatedResponse:
+        articles, has_more = await crud.search_articles_async(
+            db, q, skip=skip, limit=limit, category=category, fields=columns
+        )
+
+        total, total_is_estimate = None, False
+        if include_total:
+            total, total_is_estimate = await crud.count_articles_async(
+                db, category=category, q=q
+            )
+
+        return PaginatedResponse[ArticleResponse](
+            items=_to_items(articles, columns),
+            total=total,
+            total_is_estimate=total_is_estimate,
+            skip=skip,
+            limit=limit,
+            has_more=has_more,
+            next_cursor=None,
+        )
+
+    body, gzipped = await _cached_json(cache_key, use_gzip, build, db)
+    return json_bytes_response(body, headers, gzipped)
+
+@app.get("/articles/export")
+def export_articles(
+    format: str = Query(default="ndjson", pattern="^(ndjson|csv)$", description="출력 형식 ('ndjson', 'csv')"),
+    category: Optional[str] = Query(default=None, description="카테고리 필터링 ('news', 'paper', 'all')"),
+    source: Optional[str] = Query(default=None, description="소스별 필터링 (부분 일치)"),
+    source_id: Optional[int] = Query(default=None, description="소스 ID 필터링 (정확 일치)"),
+    search: Optional[str] = Query(default=None, description="제목/요약 검색"),
+    since: Optional[datetime] = Query(default=None, description="이 시각 이후 수집된 아티클만 (ISO 8601)"),
+    fields: Optional[str] = Query(default=None, description="내보낼 필드 (쉼표 구분 또는 'compact')"),
+):
+    """필터링된 아티클 전체를 스트리밍으로 내보내기 (분석용 대량 덤프)
+
+    페이지네이션/전체 개수 없이 id 순으로 한 번에 내보낸다.
+    증분 덤프는 마지막 실행 시각을 since로 넘긴다.
+    """
+    columns = _parse_fields(fields) or list(ArticleResponse.model_fields)
+
+    headers = {}
+    if format == "csv":
+        headers["Content-Disposition"] = 'attachment; filename="articles.csv"'
+
+    return StreamingResponse(
+        stream_articles(
+            format,
+            columns,
+            category=category,
+            source=source,
+            search=search,
+            since=since,
+            source_id=source_id,
+        ),
+        media_type=EXPORT_FORMATS[format],
+        headers=headers,
+    )
+
+@app.get("/articles/{article_id}", response_model=ArticleResponse)
+async def read_article(
+    article_id: int,
+    request: Request,
+    response: Response,
+    db=Depends(get_async_db),
+):
+    """아티클 상세 조회 (요약/초록 포함)"""
+    not_modified = check_not_modified(request, response, await get_data_version_async(db))
+    if not_modified is not None:
+        return not_modified
+
+    article = await crud.get_article_async(db, article_id)
+    if article is None:
+        raise HTTPException(status_code=404, detail="아티클을 찾을 수 없습니다.")
+    return article
+
+@app.get("/articles/{article_id}/related", response_model=RelatedResponse)
+async def related_articles(
+    article_id: int,
+    request: Request,
+    k: int = Query(default=10, ge=1, le=50, description="반환할 관련 아티클 수"),
+    db=Depends(get_async_db),
+):
+    """관련 아티클 (TF-IDF 코사인 유사도, 사전 계산된 인덱스 사용)"""
+    version = await get_data_version_async(db)
+    use_gzip = accepts_gzip(request)
+    headers, not_modified = evaluate_conditional(request, version, "gzip" if use_gzip else "")
+    if not_modified:
+        return Response(status_code=304, headers=headers)
+
+    index = similarity.get_index()
+    if index is None:
+        raise HTTPException(status_code=503, detail="관련 아티클 기능을 사용할 수 없습니다.")
+
+    cache_key = generation_key(f"articles:related:{article_id}:{k}", version[0])
+
+    async def build(db) -> RelatedResponse:
+        article = await crud.get_article_async(db, article_id)
+        if article is None:
+            raise HTTPException(status_code=404, detail="아티클을 찾을 수 없습니다.")
+
+        neighbours = await anyio.to_thread.run_sync(index.related, article, k)
+        scores = dict(neighbours)
+        articles = await crud.get_articles_by_ids_async(
+            db, [i for i, _ in neighbours], fields=list(ArticleListItem.model_fields)
+        )
+        return RelatedResponse(
+            article_id=article_id,
+            items=[
+                RelatedArticle.model_validate(
+                    {
+                        **{name: getattr(a, name) for name in ArticleListItem.model_fields},
+                        "score": scores[a.id],
+                    }
+                )
+                for a in articles
+            ],
+        )
+
+    body, gzipped = await _cached_json(cache_key, use_gzip, build, db)
+    return json_bytes_response(body, headers, gzipped)
+
+@app.get("/sources", response_model=List[SourceResponse])
+async def list_sources(request: Request, response: Response, db=Depends(get_async_db)):
+    """소스 목록 (소스별 아티클 수 포함). id는 /articles/?source_id= 필터에 사용"""
+    not_modified = check_not_modified(request, response, await get_data_version_async(db))
+    if not_modified is not None:
+        return not_modified
+
+    return await crud.list_sources_async(db)
 
 @app.get("/health")
-def health_check(db: Session = Depends(get_db)):
-    db.execute(text("SELECT 1"))
+async def health_check(db=Depends(get_async_db)):
+    await crud.run_read(db, lambda session: session.execute(text("SELECT 1")))
     return {"status": "healthy"}
 
 
+@app.get("/cache/stats")
+def cache_stats():
+    """응답 캐시 통계 (hit/miss/eviction, 요청 병합)"""
+    return {**get_cache().stats(), "single_flight": _single_flight.stats()}
+
+
 @app.get("/scheduler/status")
 def scheduler_status():
     """스케줄러 상태 조회"""
@@ -99,7 +465,10 @@ def scheduler_status():
 
 @app.on_event("startup")
 def startup_event():
-    """앱 시작 시 스케줄러 초기화"""
+    """앱 시작 시 (선택) 스키마 마이그레이션 및 스케줄러 초기화"""
+    if settings.DB_AUTO_MIGRATE:
+        database.init_db()
+
     if settings.SCHEDULER_ENABLED:
         from .scheduler import setup_scheduler
 
@@ -0,0 +1,31 @@
+"""스키마 마이그레이션
+
+테이블/인덱스/컬럼 추가, 전문 검색 인덱스, 카운터·소스 테이블 백필을 수행한다.
+API 서버와 수집기는 import 시점에 DDL을 실행하지 않으므로 배포 시 먼저 실행한다.
+
+    python -m backend.migrate
+"""
+
+import logging
+import time
+
+from .database import SQLALCHEMY_DATABASE_URL, init_db
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    )
+    database = SQLALCHEMY_DATABASE_URL.rsplit("@", 1)[-1]  # 접속 정보 제외
+    logger.info(f"스키마 마이그레이션 시작: {database}")
+
+    started = time.perf_counter()
+    init_db()
+    logger.info(f"스키마 마이그레이션 완료 ({time.perf_counter() - started:.2f}초)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,28 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Index
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Index, PrimaryKeyConstraint
 from sqlalchemy.sql import func
 from .database import Base
 
 class Article(Base):
     __tablename__ = "articles"
     __table_args__ = (
-        Index('idx_source_published', 'source', 'published_date'),
+        # (필터, published_date, id): 키셋 페이지네이션이 필터 안에서 바로 범위 스캔
+        Index('idx_source_published_id', 'source', 'published_date', 'id'),
         Index('idx_created_at', 'created_at'),
         Index('idx_category', 'category'),
-        Index('idx_category_published', 'category', 'published_date'),
+        Index('idx_category_published_id', 'category', 'published_date', 'id'),
+        Index('idx_published_id', 'published_date', 'id'),  # 커서 페이지네이션 (필터 없음)
+        Index('idx_source_id_published', 'source_id', 'published_date', 'id'),
     )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, index=True)
     title_ko = Column(String, nullable=True) # Korean translation of the title
     url = Column(String, unique=True, index=True)
+    # 대표 식별자 (doi:… / pmid:… / url:…, utils.canonical). 중복 비교는 article_identities
+    canonical_id = Column(String, nullable=True, index=True)
+    doi = Column(String, nullable=True)  # 수집기가 준 DOI (식별자 재계산용)
     source = Column(String)  # PubMed, RSS, etc.
+    source_id = Column(Integer, ForeignKey('sources.id'), nullable=True)  # 정확 일치 필터용
     category = Column(String, nullable=True, default='paper')  # 'news' or 'paper'
     source_type = Column(String, nullable=True)  # 'RSS', 'PubMed', 'Scholar'
     published_date = Column(DateTime)
@@ -24,3 +31,91 @@ class Article(Base):
     keywords = Column(String, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     is_read = Column(Boolean, default=False)
+
+
+class ArticleIdentity(Base):
+    """아티클의 모든 식별자 (utils.canonical.identity_keys)
+
+    같은 논문이 소스마다 다른 식별자 조합으로 들어오므로(DOI가 있는 PubMed,
+    PubMed 링크만 있는 Scholar, DOI만 있는 저널 RSS) 대표 식별자 하나가 아니라
+    아티클이 가진 식별자를 모두 저장하고, 중복 제거는 이 중 하나라도 겹치면 중복으로 본다.
+    """
+    __tablename__ = "article_identities"
+
+    key = Column(String, primary_key=True)  # doi:… / pmid:… / url:…
+    article_id = Column(Integer, ForeignKey('articles.id'), nullable=False, index=True)
+
+
+class Source(Base):
+    """소스 차원 테이블
+
+    아티클의 source 문자열마다 한 행. 소스 필터는 source_id 정수 비교로
+    idx_source_id_published 인덱스 범위 스캔을 사용한다.
+    category / source_type은 collect_data.categorize_source의 분류 결과다.
+    """
+    __tablename__ = "sources"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False, unique=True)
+    category = Column(String, nullable=True)
+    source_type = Column(String, nullable=True)
+
+
+class FeedState(Base):
+    """RSS 피드별 요청 상태 (조건부 GET / 본문 해시 비교용)
+
+    수집 파이프라인이 끝난 뒤 갱신한다. 다음 실행에서 If-None-Match /
+    If-Modified-Since를 보내고, 304이거나 본문 해시가 같으면 해당 피드의
+    파싱·관련성 필터·중복 제거를 건너뛴다. 본문이 바뀌었으면 수위
+    (high_water_published / seen_links)에 도달한 지점에서 순회를 멈춘다.
+    """
+    __tablename__ = "feed_states"
+
+    url = Column(String, primary_key=True)
+    etag = Column(String, nullable=True)
+    last_modified = Column(String, nullable=True)  # 서버가 보낸 Last-Modified 원문
+    body_hash = Column(String(64), nullable=True)  # 응답 본문 SHA-256
+    content_length = Column(Integer, nullable=True)  # 마지막으로 받은 본문 크기 (절약 바이트 추정)
+    last_run_at = Column(DateTime(timezone=True), nullable=True)
+    # 수위(high-water mark): 처리한 항목 중 가장 최근 발행 시각 + 최근 링크(JSON 배열)
+    high_water_published = Column(DateTime(timezone=True), nullable=True)
+    seen_links = Column(Text, nullable=True)
+
+
+class CollectorCheckpoint(Base):
+    """수집기별 마지막 성공 실행 시각 (증분 수집 기준)
+
+    PubMed는 다음 실행에서 이 날짜 이후 등록된 논문만 검색한다 (esearch mindate).
+    """
+    __tablename__ = "collector_checkpoints"
+
+    name = Column(String, primary_key=True)  # 'pubmed' 등
+    last_success_at = Column(DateTime(timezone=True), nullable=False)
+
+
+class ArticleCount(Base):
+    """(category, source)별 아티클 개수 카운터
+
+    목록 API의 total을 COUNT(*) 없이 제공하기 위해 아티클 저장 시 증분 갱신한다.
+    """
+    __tablename__ = "article_counts"
+    __table_args__ = (
+        PrimaryKeyConstraint('category', 'source'),
+    )
+
+    category = Column(String, nullable=False, default='')
+    source = Column(String, nullable=False, default='')
+    count = Column(Integer, nullable=False, default=0)
+
+
+class DataVersion(Base):
+    """데이터 세대(generation) 카운터 (단일 행)
+
+    수집 파이프라인의 저장 단계가 끝날 때마다 1 증가한다.
+    HTTP ETag/Last-Modified와 응답 캐시 무효화의 기준이 된다.
+    """
+    __tablename__ = "data_version"
+
+    id = Column(Integer, primary_key=True)
+    generation = Column(Integer, nullable=False, default=1)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
@@ -0,0 +1,329 @@
+"""스트리밍 단계 파이프라인
+
+수집 → 중복 제거 → 비율 조정 → 요약 → 저장을 크기 제한 큐로 연결한다.
+각 단계는 전용 스레드에서 앞 단계가 넘긴 항목을 도착하는 대로 처리하므로
+느린 수집기 하나가 다른 소스의 요약/저장을 막지 않고, 중간에 프로세스가
+죽어도 이미 저장된 아티클은 남는다.
+
+큐가 가득 차면 앞 단계의 put()이 대기하므로(backpressure) 메모리에 올라가는
+항목 수는 단계별 큐 상한 합 정도로 제한된다.
+
+    save = Stage("save", save_fn)
+    summarize = Stage("summarize", summarize_fn, workers=5, downstream=save)
+    Pipeline([Producer("rss", iter_rss, summarize, timeout=120)],
+             [summarize, save]).run()
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Iterable, List, Optional
+
+from .article_types import StageStats
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_SIZE = 50
+_PUT_POLL_SECONDS = 0.5
+
+_DONE = object()  # 입력 종료 표시 (워커 수만큼 넣는다)
+
+
+def _describe(item: Any) -> str:
+    if isinstance(item, dict):
+        return str(item.get("title", ""))[:50]
+    return repr(item)[:50]
+
+
+class Stage:
+    """입력 큐 하나를 소비하는 처리 단계
+
+    fn(item)은 다음 단계로 넘길 항목들의 iterable을 반환한다 (없으면 빈 리스트).
+    batch_size > 1이면 큐에 이미 쌓인 항목을 최대 batch_size개까지 모아
+    fn(list)로 한 번에 처리한다 (대기하지 않고 있는 만큼만).
+    finish()는 입력이 모두 끝난 뒤 한 번 호출되며, 남은 항목을 내보낼 수 있다.
+
+    Args:
+        name: 단계 이름 (StageStats.name)
+        fn: 항목 처리 함수
+        workers: 처리 스레드 수
+        maxsize: 입력 큐 상한
+        downstream: 출력을 받을 다음 단계 (None이면 출력 버림)
+        batch_size: 한 번에 처리할 최대 항목 수
+        finish: 입력 종료 후 호출할 함수 (반환값은 다음 단계로 전달)
+        passthrough_on_error: fn 예외 시 입력 항목을 그대로 다음 단계로 넘길지 여부
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fn: Callable[[Any], Iterable[Any]],
+        workers: int = 1,
+        maxsize: int = DEFAULT_QUEUE_SIZE,
+        downstream: Optional["Stage"] = None,
+        batch_size: int = 1,
+        finish: Optional[Callable[[], Iterable[Any]]] = None,
+        passthrough_on_error: bool = False,
+    ):
+        self.name = name
+        self.fn = fn
+        self.workers = max(workers, 1)
+        self.downstream = downstream
+        self.batch_size = max(batch_size, 1)
+        self.finish = finish
+        self.passthrough_on_error = passthrough_on_error
+
+        self.queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self.stats = StageStats(name=name, queue_capacity=maxsize)
+
+        self._lock = threading.Lock()
+        self._open_inputs = 0
+        self._running_workers = 0
+        self._threads: List[threading.Thread] = []
+        self._started_at: Optional[float] = None
+        self._first_item_at: Optional[float] = None
+        self._depth_samples = 0
+        self._depth_total = 0
+
+        if downstream is not None:
+            downstream.open()
+
+    # ── 입력 측 ──────────────────────────────────────────
+
+    def open(self) -> None:
+        """상류 등록 (앞 단계/Producer 생성 시 호출됨)"""
+        with self._lock:
+            self._open_inputs += 1
+
+    def close(self) -> None:
+        """상류 생산자 하나의 종료. 모두 닫히면 워커에 종료 표시를 보낸다."""
+        with self._lock:
+            self._open_inputs -= 1
+            last = self._open_inputs == 0
+        if last:
+            for _ in range(self.workers):
+                self.queue.put(_DONE)
+
+    def put(self, item: Any, cancelled: Optional[threading.Event] = None) -> bool:
+        """항목 추가 (큐가 가득 차면 대기). cancelled가 설정되면 포기하고 False."""
+        while True:
+            if cancelled is not None and cancelled.is_set():
+                return False
+            try:
+                self.queue.put(item, timeout=_PUT_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+
+    # ── 처리 ─────────────────────────────────────────────
+
+    def start(self) -> None:
+        self._started_at = time.time()
+        self._running_workers = self.workers
+        for i in range(self.workers):
+            thread = threading.Thread(
+                target=self._work, name=f"stage-{self.name}-{i}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def join(self) -> None:
+        for thread in self._threads:
+            thread.join()
+
+    def _take(self) -> Optional[List[Any]]:
+        """다음 처리 단위. 종료 표시를 받으면 None."""
+        first = self.queue.get()
+        self._observe_depth()
+        if first is _DONE:
+            return None
+
+        batch = [first]
+        while len(batch) < self.batch_size:
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _DONE:
+                # 다른 워커(또는 다음 _take)가 받도록 되돌려 둔다
+                self.queue.put(_DONE)
+                break
+            batch.append(item)
+        return batch
+
+    def _observe_depth(self) -> None:
+        depth = self.queue.qsize()
+        with self._lock:
+            if self._first_item_at is None:
+                self._first_item_at = time.time()
+            self._depth_samples += 1
+            self._depth_total += depth
+            self.stats.max_queue_depth = max(self.stats.max_queue_depth, depth + 1)
+
+    def _emit(self, outputs: Optional[Iterable[Any]]) -> None:
+        for output in outputs or ():
+            with self._lock:
+                self.stats.emitted += 1
+            if self.downstream is not None:
+                self.downstream.put(output)
+
+    def _work(self) -> None:
+        try:
+            while True:
+                batch = self._take()
+                if batch is None:
+                    break
+                with self._lock:
+                    self.stats.total += len(batch)
+
+                payload = batch if self.batch_size > 1 else batch[0]
+                try:
+                    outputs = list(self.fn(payload) or ())
+                except Exception as e:
+                    logger.error(f"[{self.name}] 처리 실패 ({_describe(batch[0])}): {e}")
+                    with self._lock:
+                        self.stats.failed += len(batch)
+                        self.stats.errors.append({
+                            "title": _describe(batch[0]),
+                            "error": type(e).__name__,
+                        })
+                    if self.passthrough_on_error:
+                        self._emit(batch)
+                    continue
+
+                with self._lock:
+                    self.stats.success += len(batch)
+                self._emit(outputs)
+        finally:
+            self._worker_done()
+
+    def _worker_done(self) -> None:
+        with self._lock:
+            self._running_workers -= 1
+            last = self._running_workers == 0
+        if not last:
+            return
+
+        try:
+            if self.finish is not None:
+                self._emit(self.finish())
+        except Exception as e:
+            logger.error(f"[{self.name}] 종료 처리 실패: {e}")
+            self.stats.errors.append({"title": "", "error": type(e).__name__})
+        finally:
+            self._finalize_stats()
+            if self.downstream is not None:
+                self.downstream.close()
+
+    def _finalize_stats(self) -> None:
+        now = time.time()
+        stats = self.stats
+        stats.duration_seconds = round(now - (self._started_at or now), 3)
+        # 처리량은 첫 항목 도착 이후 구간 기준 (상류를 기다린 시간 제외)
+        active = now - (self._first_item_at or now)
+        processed = stats.success + stats.failed
+        stats.throughput_per_second = round(processed / active, 3) if active > 0 else 0.0
+        if self._depth_samples:
+            stats.avg_queue_depth = round(self._depth_total / self._depth_samples, 2)
+
+
+class Producer:
+    """수집기 하나를 전용 스레드에서 실행해 downstream에 항목을 공급
+
+    iterate()가 yield하는 배치(리스트)를 항목 단위로 풀어 넣는다.
+    timeout이 지나면 더 이상 기다리지 않고 downstream을 대신 닫는다.
+    스레드는 강제로 멈출 수 없으므로 계속 실행될 수 있지만, 이후 결과는 버려진다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        iterate: Callable[[], Iterable[List[Any]]],
+        downstream: Stage,
+        timeout: Optional[float] = None,
+    ):
+        self.name = name
+        self.iterate = iterate
+        self.downstream = downstream
+        self.timeout = timeout
+        self.stats = StageStats(name=name)
+
+        self._cancelled = threading.Event()  # 타임아웃으로 포기됨
+        self._closed = threading.Lock()
+        self._is_closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._started_at: Optional[float] = None
+
+        # 생성 시 등록해야 먼저 끝난 생산자가 downstream을 조기에 닫지 않는다
+        downstream.open()
+
+    def start(self) -> None:
+        self._started_at = time.time()
+        self._thread = threading.Thread(target=self._run, name=f"producer-{self.name}", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            for batch in self.iterate():
+                for item in batch:
+                    if not self.downstream.put(item, cancelled=self._cancelled):
+                        return
+                    self.stats.total += 1
+                    self.stats.success += 1
+        except Exception as e:
+            logger.error(f"{self.name} 수집 실패: {type(e).__name__}")
+            self.stats.failed = 1
+            self.stats.errors.append({"type": type(e).__name__, "message": str(e)})
+        finally:
+            self._finish()
+
+    def _finish(self) -> None:
+        """downstream을 한 번만 닫는다 (정상 종료 / 타임아웃 중 먼저 온 쪽)"""
+        with self._closed:
+            if self._is_closed:
+                return
+            self._is_closed = True
+        elapsed = time.time() - (self._started_at or time.time())
+        self.stats.duration_seconds = round(elapsed, 3)
+        if elapsed > 0:
+            self.stats.throughput_per_second = round(self.stats.success / elapsed, 3)
+        self.downstream.close()
+
+    @property
+    def timed_out(self) -> bool:
+        return self._cancelled.is_set()
+
+    def wait(self, deadline: Optional[float]) -> None:
+        """deadline(time.time() 기준)까지 기다리고, 넘으면 포기"""
+        remaining = None if deadline is None else max(deadline - time.time(), 0)
+        self._thread.join(remaining)
+        if self._thread.is_alive():
+            logger.warning(f"{self.name} 수집 타임아웃 ({self.timeout}초)")
+            self._cancelled.set()
+            self.stats.failed = 1
+            self.stats.errors.append({"type": "TimeoutError", "message": f"{self.timeout}초 타임아웃"})
+            self._finish()
+
+
+class Pipeline:
+    """생산자와 단계들을 시작하고 모두 끝날 때까지 기다린다"""
+
+    def __init__(self, producers: List[Producer], stages: List[Stage]):
+        self.producers = producers
+        self.stages = stages
+
+    def run(self) -> None:
+        for stage in self.stages:
+            stage.start()
+        for producer in self.producers:
+            producer.start()
+
+        started = time.time()
+        for producer in self.producers:
+            deadline = started + producer.timeout if producer.timeout else None
+            producer.wait(deadline)
+
+        # 생산자가 모두 닫히면 종료 표시가 단계를 따라 전파된다
+        for stage in self.stages:
+            stage.join()
@@ -26,6 +26,17 @@ def get_scheduler() -> Optional["BackgroundScheduler"]:
     return _scheduler
 
 
+def _run_collection_job():
+    """수집 작업 실행
+
+    collect_data는 openai/feedparser/pymed/scholarly를 불러오므로 스케줄러 등록
+    시점(API 서버 시작)이 아니라 첫 실행 시점에 임포트한다.
+    """
+    from .collect_data import run_collection
+
+    return run_collection()
+
+
 def setup_scheduler(
     collection_hours: str = "6,18",
     collection_interval_hours: Optional[int] = None,
@@ -54,13 +65,11 @@ def setup_scheduler(
         job_defaults={"coalesce": True, "max_instances": 1},
     )
 
-    # 수집 작업 등록
-    from collect_data import run_collection
-
+    # 수집 작업 등록 (수집 모듈은 작업 실행 시점에 임포트)
     if collection_interval_hours:
         # 주기적 실행
         _scheduler.add_job(
-            run_collection,
+            _run_collection_job,
             trigger=IntervalTrigger(hours=collection_interval_hours),
             id="periodic_collection",
             name="주기적 데이터 수집",
@@ -70,7 +79,7 @@ def setup_scheduler(
     else:
         # Cron 실행
         _scheduler.add_job(
-            run_collection,
+            _run_collection_job,
             trigger=CronTrigger(hour=collection_hours),
             id="daily_collection",
             name="정기 데이터 수집",
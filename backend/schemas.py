@@ -18,21 +18,31 @@ class PaginatedResponse(BaseModel, Generic[T]):
     """페이지네이션 응답 형식"""
 
     items: List[T]
-    total: int
+    total: Optional[int] = None  # include_total=false이면 None
+    total_is_estimate: bool = False  # 검색어 필터 시 추정치
     skip: int
     limit: int
     has_more: bool
+    next_cursor: Optional[str] = None  # 키셋 페이지네이션용 다음 페이지 커서
 
 
-class ArticleResponse(BaseModel):
+class ArticleListItem(BaseModel):
+    """목록 화면용 경량 아티클 (fields=compact)"""
+
     id: int
     title: Optional[str] = None
     title_ko: Optional[str] = None
     url: Optional[str] = None
     source: Optional[str] = None
+    source_id: Optional[int] = None
     category: Optional[str] = None  # 'news' or 'paper'
     source_type: Optional[str] = None  # 'RSS', 'PubMed', 'Scholar'
     published_date: Optional[datetime] = None
+
+    model_config = {"from_attributes": True}
+
+
+class ArticleResponse(ArticleListItem):
     summary: Optional[str] = None
     original_abstract: Optional[str] = None
     keywords: Optional[str] = None
@@ -40,3 +50,28 @@ class ArticleResponse(BaseModel):
     is_read: Optional[bool] = None
 
     model_config = {"from_attributes": True}
+
+
+class SourceResponse(BaseModel):
+    """소스 목록 항목 (/sources)"""
+
+    id: int
+    name: str
+    category: Optional[str] = None
+    source_type: Optional[str] = None
+    article_count: int = 0
+
+    model_config = {"from_attributes": True}
+
+
+class RelatedArticle(ArticleListItem):
+    """관련 아티클 항목 (코사인 유사도 포함)"""
+
+    score: float
+
+
+class RelatedResponse(BaseModel):
+    """/articles/{id}/related 응답"""
+
+    article_id: int
+    items: List[RelatedArticle]
@@ -0,0 +1,221 @@
+"""전문(full-text) 검색 인덱스 모듈
+
+title / title_ko / summary에 대한 검색을 DB 인덱스로 처리한다.
+
+- SQLite: FTS5 외부 콘텐츠 가상 테이블(articles_fts) + 트리거로 동기화
+- PostgreSQL: 생성 컬럼(search_vector tsvector) + GIN 인덱스
+- 그 외 / FTS5 미지원 빌드: 기존 ILIKE 검색으로 폴백
+
+/articles/search(q)만 이 인덱스를 쓰고, 목록 API의 search 파라미터는 기존과 같은
+부분 문자열(ILIKE) 일치를 유지한다 (like_clause).
+
+토큰화:
+- 영어는 porter 스테머(SQLite) / english 사전(PostgreSQL)으로 어형 변화를 흡수
+- 한국어는 공백 단위 토큰에 접두사 매칭을 적용해 조사가 붙은 어절
+  ("보톡스는", "피부과에서")도 어간 검색어로 찾을 수 있게 한다.
+"""
+
+import logging
+import re
+from typing import List, Optional
+
+from sqlalchemy import column, func, literal_column, or_, select, table, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from . import models
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = "articles_fts"
+
+# bm25 컬럼 가중치 (title, title_ko, summary)
+BM25_WEIGHTS = (10.0, 10.0, 1.0)
+
+# 검색어에서 추출할 토큰 (유니코드 단어 문자만 사용 → FTS 쿼리 문법 주입 방지)
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_MAX_TERMS = 8
+
+_SQLITE_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, title_ko, summary,
+        content='articles', content_rowid='id',
+        tokenize='porter unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON articles BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, title_ko, summary)
+        VALUES (new.id, new.title, new.title_ko, new.summary);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON articles BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, title_ko, summary)
+        VALUES ('delete', old.id, old.title, old.title_ko, old.summary);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF title, title_ko, summary
+    ON articles BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, title_ko, summary)
+        VALUES ('delete', old.id, old.title, old.title_ko, old.summary);
+        INSERT INTO {FTS_TABLE}(rowid, title, title_ko, summary)
+        VALUES (new.id, new.title, new.title_ko, new.summary);
+    END
+    """,
+]
+
+_POSTGRES_DDL = [
+    """
+    ALTER TABLE articles ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('simple', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('simple', coalesce(title_ko, '')), 'A')
+        || setweight(to_tsvector('simple', coalesce(summary, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_articles_search_vector ON articles USING GIN (search_vector)",
+]
+
+_fts = table(FTS_TABLE, column("rowid"), column(FTS_TABLE))
+
+# 프로세스별로 한 번만 판별: 'fts5' | 'tsvector' | 'like'
+_backend: Optional[str] = None
+
+
+def setup_search_index(engine: Engine) -> str:
+    """검색 인덱스 생성 (멱등). 사용 가능한 백엔드 이름 반환."""
+    global _backend
+
+    dialect = engine.dialect.name
+    try:
+        if dialect == "sqlite":
+            with engine.begin() as conn:
+                exists = conn.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE name = :name"),
+                    {"name": FTS_TABLE},
+                ).first()
+                for ddl in _SQLITE_DDL:
+                    conn.execute(text(ddl))
+                if not exists:
+                    # 기존 아티클로 인덱스 채우기 (최초 1회)
+                    conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+                    logger.info("FTS5 검색 인덱스 생성 완료")
+            _backend = "fts5"
+        elif dialect == "postgresql":
+            with engine.begin() as conn:
+                for ddl in _POSTGRES_DDL:
+                    conn.execute(text(ddl))
+            _backend = "tsvector"
+        else:
+            _backend = "like"
+    except Exception as e:
+        logger.warning(f"검색 인덱스를 사용할 수 없어 ILIKE 검색으로 대체합니다: {e}")
+        _backend = "like"
+
+    return _backend
+
+
+def get_backend(db: Session) -> str:
+    """현재 DB에서 사용할 검색 백엔드 반환"""
+    global _backend
+
+    if _backend is None:
+        dialect = db.get_bind().dialect.name
+        if dialect == "sqlite":
+            exists = db.execute(
+                text("SELECT 1 FROM sqlite_master WHERE name = :name"), {"name": FTS_TABLE}
+            ).first()
+            _backend = "fts5" if exists else "like"
+        elif dialect == "postgresql":
+            exists = db.execute(
+                text(
+                    "SELECT 1 FROM information_schema.columns "
+                    "WHERE table_name = 'articles' AND column_name = 'search_vector'"
+                )
+            ).first()
+            _backend = "tsvector" if exists else "like"
+        else:
+            _backend = "like"
+
+    return _backend
+
+
+def tokenize_query(query: str) -> List[str]:
+    """사용자 검색어를 인덱스 검색용 토큰으로 분리"""
+    return _TOKEN_RE.findall(query.lower())[:_MAX_TERMS]
+
+
+def _fts5_query(terms: List[str]) -> str:
+    # 각 토큰을 접두사 검색으로, 토큰 간은 AND
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def _tsquery(terms: List[str]):
+    # 토큰별로 (english 어간 OR 원형) 접두사 매칭, 토큰 간은 AND
+    query = None
+    for term in terms:
+        part = func.to_tsquery("english", f"{term}:*").op("||")(
+            func.to_tsquery("simple", f"{term}:*")
+        )
+        query = part if query is None else query.op("&&")(part)
+    return query
+
+
+def like_clause(query: str):
+    """부분 문자열 검색 조건 (ILIKE). 단어 중간 일치도 찾는다 ("톡신" → "보툴리눔톡신")."""
+    search_term = f"%{query}%"
+    return or_(
+        models.Article.title.ilike(search_term),
+        models.Article.title_ko.ilike(search_term),
+        models.Article.summary.ilike(search_term),
+    )
+
+
+def match_clause(db: Session, query: str):
+    """Article 쿼리에 적용할 검색 필터 조건 반환"""
+    backend = get_backend(db)
+    terms = tokenize_query(query)
+
+    if backend == "like" or not terms:
+        return like_clause(query)
+
+    if backend == "fts5":
+        matched_ids = select(_fts.c.rowid).where(_fts.c[FTS_TABLE].match(_fts5_query(terms)))
+        return models.Article.id.in_(matched_ids)
+
+    search_vector = literal_column("articles.search_vector")
+    return search_vector.op("@@")(_tsquery(terms))
+
+
+def ranked_query(db: Session, query: str):
+    """관련도 순으로 정렬된 Article 쿼리 반환 (폴백 시 최신순)"""
+    backend = get_backend(db)
+    terms = tokenize_query(query)
+
+    if backend == "fts5" and terms:
+        rank = func.bm25(literal_column(FTS_TABLE), *BM25_WEIGHTS)
+        return (
+            db.query(models.Article)
+            .join(_fts, _fts.c.rowid == models.Article.id)
+            .filter(_fts.c[FTS_TABLE].match(_fts5_query(terms)))
+            .order_by(rank, models.Article.id.desc())
+        )
+
+    if backend == "tsvector" and terms:
+        search_vector = literal_column("articles.search_vector")
+        tsquery = _tsquery(terms)
+        return (
+            db.query(models.Article)
+            .filter(search_vector.op("@@")(tsquery))
+            .order_by(func.ts_rank_cd(search_vector, tsquery).desc(), models.Article.id.desc())
+        )
+
+    return (
+        db.query(models.Article)
+        .filter(like_clause(query))
+        .order_by(models.Article.published_date.desc().nulls_last(), models.Article.id.desc())
+    )
@@ -0,0 +1,481 @@
+"""관련 아티클(more like this) 유사도 엔진
+
+title / summary / original_abstract를 TF-IDF 희소 벡터로 만들고 코사인 유사도로
+이웃을 찾는다. 외부 서비스 없이 API 프로세스 안에서 계산한다.
+
+저장 형식:
+- 단어는 crc32 해시로 N_FEATURES 차원에 매핑한다 (어휘 사전 없이 증분 추가 가능).
+- 행렬은 단어 우선(term-major) CSR, 즉 역색인 형태로 저장한다. 질의 단어의
+  포스팅만 읽으므로 질의 비용은 전체 아티클 수가 아니라 포스팅 길이에 비례한다.
+- 값은 원시 TF(1 + log tf)이고 IDF는 df(포스팅 길이)로 로드 시 계산한다.
+- base 세그먼트는 .npy 파일로 저장해 mmap으로 연다. 파이프라인이 저장한 새
+  아티클은 작은 delta 세그먼트(delta.npz)에 쌓이고, 일정 크기를 넘으면 base로
+  병합(compaction)된다. 병합 전까지 base 문서의 노름은 빌드 시점 IDF 기준이다.
+
+    python -m backend.similarity rebuild   # DB 전체로 인덱스 재생성
+"""
+
+import json
+import logging
+import os
+import re
+import shutil
+import sys
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Tuple
+
+from .config import BACKEND_DIR, settings
+
+logger = logging.getLogger(__name__)
+
+# numpy / scipy는 선택적 의존성
+try:
+    import numpy as np
+    from scipy import sparse
+
+    SIMILARITY_AVAILABLE = True
+except ImportError:
+    SIMILARITY_AVAILABLE = False
+    logger.warning("numpy/scipy가 설치되지 않았습니다. 관련 아티클 기능이 비활성화됩니다.")
+
+N_FEATURES = 1 << 20
+TITLE_WEIGHT = 2  # 제목 단어는 본문보다 2배 가중
+MAX_QUERY_TERMS = 32  # 질의에 사용할 최대 단어 수 (TF-IDF 가중치 상위)
+
+CURRENT_FILE = "CURRENT"
+DELTA_FILE = "delta.npz"
+SEGMENTS_DIR = "segments"
+LOAD_ATTEMPTS = 3  # 읽는 중 base가 교체되면 CURRENT를 다시 읽는 횟수
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+TEXT_FIELDS = ("id", "title", "summary", "original_abstract")
+
+
+def _field(article: Any, name: str):
+    if isinstance(article, dict):
+        return article.get(name)
+    return getattr(article, name, None)
+
+
+def term_frequencies(article: Any) -> Tuple["np.ndarray", "np.ndarray"]:
+    """아티클 → (해시 단어 인덱스, 1 + log(tf)) 정렬된 배열"""
+    counts: dict = {}
+    for name, weight in (("title", TITLE_WEIGHT), ("summary", 1), ("original_abstract", 1)):
+        text = _field(article, name)
+        if not text:
+            continue
+        for token in _TOKEN_RE.findall(text.lower()):
+            if len(token) < 2 or token.isdigit():
+                continue
+            term = zlib.crc32(token.encode()) & (N_FEATURES - 1)
+            counts[term] = counts.get(term, 0) + weight
+
+    terms = np.fromiter(counts.keys(), dtype=np.int32, count=len(counts))
+    tf = 1 + np.log(np.fromiter(counts.values(), dtype=np.float32, count=len(counts)))
+    order = np.argsort(terms)
+    return terms[order], tf[order].astype(np.float32)
+
+
+def _doc_rows(articles: Iterable[Any]) -> Tuple["sparse.csr_matrix", "np.ndarray"]:
+    """아티클 목록 → (문서 × 단어 CSR, 아티클 ID 배열)"""
+    ids, indptr, indices, data = [], [0], [], []
+    for article in articles:
+        terms, tf = term_frequencies(article)
+        ids.append(_field(article, "id"))
+        indices.append(terms)
+        data.append(tf)
+        indptr.append(indptr[-1] + len(terms))
+
+    rows = sparse.csr_matrix(
+        (
+            np.concatenate(data) if data else np.zeros(0, np.float32),
+            np.concatenate(indices) if indices else np.zeros(0, np.int32),
+            np.asarray(indptr, dtype=np.int64),
+        ),
+        shape=(len(ids), N_FEATURES),
+    )
+    return rows, np.asarray(ids, dtype=np.int64)
+
+
+def _idf(df: "np.ndarray", n_docs: int) -> "np.ndarray":
+    return (np.log((1 + n_docs) / (1 + df)) + 1).astype(np.float32)
+
+
+def _norms(postings: "sparse.csr_matrix", idf: "np.ndarray") -> "np.ndarray":
+    # 문서별 ||tf * idf||, postings는 단어 × 문서
+    squared = postings.power(2).T @ (idf * idf)
+    norms = np.sqrt(np.asarray(squared, dtype=np.float32)).ravel()
+    norms[norms == 0] = 1.0
+    return norms
+
+
+class _Segment:
+    """단어 × 문서 역색인 세그먼트"""
+
+    def __init__(self, postings, doc_ids, norms=None):
+        self.postings = postings
+        self.doc_ids = doc_ids
+        self.norms = norms
+
+    @property
+    def size(self) -> int:
+        return len(self.doc_ids)
+
+    def df(self) -> "np.ndarray":
+        return np.diff(self.postings.indptr)
+
+
+class SimilarityIndex:
+    """디스크의 유사도 인덱스 (읽기: API, 쓰기: 수집 파이프라인)
+
+    읽기 측은 reload_seconds마다 CURRENT / delta 파일 변경을 확인해 다시 연다.
+    """
+
+    def __init__(self, directory: Path, reload_seconds: float = 30):
+        self._dir = Path(directory)
+        self._reload_seconds = reload_seconds
+        self._lock = threading.Lock()
+        self._checked_at = 0.0
+        self._signature = None
+
+        self._base: Optional[_Segment] = None
+        self._delta: Optional[_Segment] = None
+        self._base_name: Optional[str] = None
+        self._idf = None
+
+    # ── 로드 ─────────────────────────────────────────────
+
+    def _file_signature(self):
+        signature = []
+        for name in (CURRENT_FILE, DELTA_FILE):
+            try:
+                stat = (self._dir / name).stat()
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                signature.append(None)
+        return tuple(signature)
+
+    def _load_base(self, name: str) -> _Segment:
+        path = self._dir / SEGMENTS_DIR / name
+        meta = json.loads((path / "meta.json").read_text())
+        postings = sparse.csr_matrix(
+            (
+                np.load(path / "data.npy", mmap_mode="r"),
+                np.load(path / "indices.npy", mmap_mode="r"),
+                np.load(path / "indptr.npy", mmap_mode="r"),
+            ),
+            shape=(N_FEATURES, meta["n_docs"]),
+        )
+        return _Segment(
+            postings,
+            np.load(path / "doc_ids.npy", mmap_mode="r"),
+            np.load(path / "norms.npy", mmap_mode="r"),
+        )
+
+    def _load_delta(self) -> Optional[_Segment]:
+        try:
+            with np.load(self._dir / DELTA_FILE) as archive:
+                if str(archive["base"]) != (self._base_name or ""):
+                    return None  # 병합 직후 남은 이전 base용 delta
+                rows = sparse.csr_matrix(
+                    (archive["data"], archive["indices"], archive["indptr"]),
+                    shape=(len(archive["doc_ids"]), N_FEATURES),
+                )
+                return _Segment(rows.T.tocsr(), archive["doc_ids"])
+        except FileNotFoundError:
+            return None
+
+    def _load(self) -> bool:
+        """CURRENT가 가리키는 base와 delta를 연다. base를 열지 못해 이전 상태를 유지하면 False.
+
+        writer는 CURRENT를 교체한 직후 이전 세그먼트를 지우므로, CURRENT를 읽은 뒤
+        세그먼트 파일이 사라졌으면 CURRENT를 다시 읽어 새 base를 연다.
+        """
+        for _ in range(LOAD_ATTEMPTS):
+            try:
+                name = (self._dir / CURRENT_FILE).read_text().strip()
+            except FileNotFoundError:
+                self._base_name, self._base = None, None  # 아직 인덱스 없음
+                break
+            try:
+                self._base = self._load_base(name)
+                self._base_name = name
+                break
+            except FileNotFoundError:
+                logger.debug(f"유사도 인덱스 세그먼트 교체 중 ({name}), 다시 읽음")
+        else:
+            logger.warning("유사도 인덱스 base를 열 수 없어 이전 세그먼트를 유지합니다.")
+            return False
+        self._delta = self._load_delta()
+
+        segments = [s for s in (self._base, self._delta) if s is not None]
+        n_docs = sum(s.size for s in segments)
+        df = np.zeros(N_FEATURES, dtype=np.int64)
+        for segment in segments:
+            df += segment.df()
+        self._idf = _idf(df, n_docs)
+        if self._delta is not None:
+            self._delta.norms = _norms(self._delta.postings, self._idf)
+        return True
+
+    def _refresh(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - self._checked_at < self._reload_seconds:
+            return
+        self._checked_at = now
+        signature = self._file_signature()
+        if force or signature != self._signature:
+            if self._load():
+                self._signature = signature  # 실패하면 다음 확인 때 다시 시도
+
+    def size(self) -> int:
+        """색인된 아티클 수"""
+        with self._lock:
+            self._refresh()
+            return sum(s.size for s in (self._base, self._delta) if s is not None)
+
+    def _unindexed(self, articles: List[Any]) -> List[Any]:
+        """아직 색인되지 않은 아티클만 (입력 내 중복 제거)"""
+        known = [s.doc_ids for s in (self._base, self._delta) if s is not None]
+        ids = np.asarray([_field(a, "id") for a in articles], dtype=np.int64)
+        indexed = np.isin(ids, np.concatenate(known)) if known else np.zeros(len(ids), bool)
+
+        seen = set()
+        new = []
+        for article, article_id, is_indexed in zip(articles, ids.tolist(), indexed):
+            if is_indexed or article_id in seen:
+                continue
+            seen.add(article_id)
+            new.append(article)
+        return new
+
+    # ── 질의 ─────────────────────────────────────────────
+
+    @staticmethod
+    def _query_matrix(articles: List[Any], idf: "np.ndarray") -> "sparse.csr_matrix":
+        """질의 행렬: 행마다 (tf * idf) / ||tf * idf|| * idf
+
+        원시 TF 역색인과 곱한 뒤 문서 노름으로 나누면 코사인 유사도가 된다.
+        가중치 상위 MAX_QUERY_TERMS개 단어만 사용해 긴 초록의 흔한 단어가
+        긴 포스팅을 읽지 않도록 한다.
+        """
+        indptr, indices, data = [0], [], []
+        for article in articles:
+            terms, tf = term_frequencies(article)
+            weights = tf * idf[terms]
+            norm = float(np.sqrt(np.dot(weights, weights))) or 1.0
+            if len(terms) > MAX_QUERY_TERMS:
+                top = np.argpartition(-weights, MAX_QUERY_TERMS)[:MAX_QUERY_TERMS]
+                terms, weights = terms[top], weights[top]
+            indices.append(terms)
+            data.append(weights / norm * idf[terms])
+            indptr.append(indptr[-1] + len(terms))
+
+        return sparse.csr_matrix(
+            (np.concatenate(data), np.concatenate(indices), np.asarray(indptr, dtype=np.int64)),
+            shape=(len(articles), N_FEATURES),
+        )
+
+    def related_many(
+        self, articles: List[Any], k: int = 10
+    ) -> List[List[Tuple[int, float]]]:
+        """여러 아티클의 관련 아티클 (질의 행렬 × 역색인 한 번의 곱)
+
+        Returns:
+            아티클별 [(article_id, 코사인 유사도), ...] (유사도 내림차순, 자기 자신 제외)
+        """
+        with self._lock:
+            self._refresh()
+            base, delta, idf = self._base, self._delta, self._idf
+
+        segments = [s for s in (base, delta) if s is not None and s.size]
+        if not segments or not articles:
+            return [[] for _ in articles]
+
+        queries = self._query_matrix(articles, idf)
+        candidates = [[] for _ in articles]
+        for segment in segments:
+            scores = (queries @ segment.postings).tocsr()
+            for i in range(len(articles)):
+                start, end = scores.indptr[i], scores.indptr[i + 1]
+                if start == end:
+                    continue
+                columns = scores.indices[start:end]
+                values = scores.data[start:end] / segment.norms[columns]
+                candidates[i].append((segment.doc_ids[columns], values))
+
+        results = []
+        for article, parts in zip(articles, candidates):
+            if not parts:
+                results.append([])
+                continue
+            ids = np.concatenate([p[0] for p in parts])
+            values = np.concatenate([p[1] for p in parts])
+            mask = ids != _field(article, "id")
+            ids, values = ids[mask], values[mask]
+            if len(ids) > k:
+                top = np.argpartition(-values, k)[:k]
+                ids, values = ids[top], values[top]
+            order = np.argsort(-values, kind="stable")
+            results.append(
+                [(int(ids[j]), round(float(min(values[j], 1.0)), 4)) for j in order]
+            )
+        return results
+
+    def related(self, article: Any, k: int = 10) -> List[Tuple[int, float]]:
+        """한 아티클의 관련 아티클 [(article_id, 유사도), ...]"""
+        return self.related_many([article], k)[0]
+
+    # ── 쓰기 (수집 파이프라인) ─────────────────────────────
+
+    def _write_base(self, postings, doc_ids, idf) -> str:
+        name = f"base-{time.time_ns()}"
+        path = self._dir / SEGMENTS_DIR / name
+        path.mkdir(parents=True)
+
+        postings.sort_indices()
+        index_dtype = np.int32 if postings.nnz < np.iinfo(np.int32).max else np.int64
+        np.save(path / "data.npy", postings.data.astype(np.float32))
+        np.save(path / "indices.npy", postings.indices.astype(index_dtype))
+        np.save(path / "indptr.npy", postings.indptr.astype(index_dtype))
+        np.save(path / "doc_ids.npy", np.asarray(doc_ids, dtype=np.int64))
+        np.save(path / "norms.npy", _norms(postings, idf))
+        (path / "meta.json").write_text(
+            json.dumps({"n_docs": len(doc_ids), "nnz": int(postings.nnz), "created_at": time.time()})
+        )
+
+        tmp = self._dir / f"{CURRENT_FILE}.tmp"
+        tmp.write_text(name)
+        os.replace(tmp, self._dir / CURRENT_FILE)
+        try:
+            (self._dir / DELTA_FILE).unlink()
+        except FileNotFoundError:
+            pass
+
+        # 이전 세그먼트 정리 (열려 있는 mmap은 파일 삭제 후에도 유효)
+        for old in (self._dir / SEGMENTS_DIR).iterdir():
+            if old.name != name:
+                shutil.rmtree(old, ignore_errors=True)
+        return name
+
+    def _write_delta(self, rows, doc_ids) -> None:
+        tmp = self._dir / f"{DELTA_FILE}.tmp.npz"
+        np.savez(
+            tmp,
+            base=np.asarray(self._base_name or ""),
+            data=rows.data.astype(np.float32),
+            indices=rows.indices.astype(np.int32),
+            indptr=rows.indptr.astype(np.int64),
+            doc_ids=np.asarray(doc_ids, dtype=np.int64),
+        )
+        os.replace(tmp, self._dir / DELTA_FILE)
+
+    def rebuild(self, articles: Iterable[Any]) -> int:
+        """전체 재생성, 색인된 아티클 수 반환"""
+        rows, doc_ids = _doc_rows(articles)
+        postings = rows.T.tocsr()
+        idf = _idf(np.diff(postings.indptr), len(doc_ids))
+        with self._lock:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            self._write_base(postings, doc_ids, idf)
+            self._refresh(force=True)
+        logger.info(f"유사도 인덱스 생성: {len(doc_ids)}건")
+        return len(doc_ids)
+
+    def add_articles(self, articles: Iterable[Any], compact_ratio: float = 0.1) -> int:
+        """새 아티클을 delta 세그먼트에 추가, 추가된 수 반환
+
+        delta가 base의 compact_ratio배(최소 1000건)를 넘으면 base로 병합한다.
+        """
+        with self._lock:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            self._refresh(force=True)
+
+            new = self._unindexed(list(articles))
+            if not new:
+                return 0
+
+            rows, doc_ids = _doc_rows(new)
+            if self._delta is not None:
+                rows = sparse.vstack([self._delta.postings.T.tocsr(), rows]).tocsr()
+                doc_ids = np.concatenate([self._delta.doc_ids, doc_ids])
+
+            base_size = self._base.size if self._base is not None else 0
+            if self._base is None or len(doc_ids) > max(1000, base_size * compact_ratio):
+                postings = rows.T.tocsr()
+                if self._base is not None:
+                    postings = sparse.hstack([self._base.postings, postings]).tocsr()
+                    doc_ids = np.concatenate([self._base.doc_ids, doc_ids])
+                idf = _idf(np.diff(postings.indptr), len(doc_ids))
+                self._write_base(postings, doc_ids, idf)
+                logger.info(f"유사도 인덱스 병합: {len(doc_ids)}건")
+            else:
+                self._write_delta(rows, doc_ids)
+
+            self._refresh(force=True)
+            return len(new)
+
+
+_index: Optional[SimilarityIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_index() -> Optional[SimilarityIndex]:
+    """전역 유사도 인덱스 (numpy/scipy 미설치 시 None)"""
+    global _index
+
+    if not SIMILARITY_AVAILABLE:
+        return None
+    with _index_lock:
+        if _index is None:
+            directory = settings.SIMILARITY_INDEX_DIR or BACKEND_DIR / "similarity_index"
+            _index = SimilarityIndex(directory, reload_seconds=settings.SIMILARITY_RELOAD_SECONDS)
+        return _index
+
+
+def index_saved_articles(articles: Iterable[Any]) -> int:
+    """파이프라인에서 저장한 아티클을 인덱스에 추가 (실패해도 수집은 계속)"""
+    index = get_index()
+    if index is None:
+        return 0
+    try:
+        return index.add_articles(articles, compact_ratio=settings.SIMILARITY_COMPACT_RATIO)
+    except Exception as e:
+        logger.warning(f"유사도 인덱스 갱신 실패: {e}")
+        return 0
+
+
+def rebuild_from_db() -> int:
+    """DB의 전체 아티클로 인덱스 재생성"""
+    from . import crud
+    from .database import ReadSessionLocal
+
+    index = get_index()
+    if index is None:
+        raise RuntimeError("numpy/scipy가 설치되지 않아 유사도 인덱스를 만들 수 없습니다.")
+
+    db = ReadSessionLocal()
+    try:
+        rows = (
+            dict(zip(TEXT_FIELDS, row))
+            for batch in crud.iter_articles_for_export(db, list(TEXT_FIELDS))
+            for row in batch
+        )
+        return index.rebuild(rows)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    )
+    if sys.argv[1:] != ["rebuild"]:
+        print("사용법: python -m backend.similarity rebuild")
+        sys.exit(2)
+    rebuild_from_db()
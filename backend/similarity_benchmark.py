@@ -0,0 +1,113 @@
+"""관련 아티클 질의 시간 벤치마크
+
+고정 시드로 만든 합성 코퍼스(Zipf 분포 어휘, 제목 + 초록)로 임시 디렉터리에
+유사도 인덱스를 만들고, base 세그먼트(mmap) + delta 세그먼트 상태에서
+SimilarityIndex.related() 지연 시간을 측정한다. p95가 예산
+(SIMILARITY_QUERY_BUDGET_MS)을 넘으면 종료 코드 1을 반환한다. CI에서 그대로 실행할 수 있다.
+
+    python -m backend.similarity_benchmark
+    python -m backend.similarity_benchmark --articles 100000 --queries 500 --budget-ms 10
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from typing import Dict, Iterator, List
+
+from .config import settings
+from .similarity import SIMILARITY_AVAILABLE, SimilarityIndex
+
+SEED = 20240601
+VOCABULARY_SIZE = 30_000
+TITLE_WORDS = 10
+ABSTRACT_WORDS = 120
+DELTA_ARTICLES = 500  # 수집 파이프라인이 병합 전까지 쌓는 정도의 delta
+
+
+def synthetic_articles(count: int, start_id: int = 1, seed: int = SEED) -> Iterator[Dict]:
+    """재현 가능한 합성 아티클 (같은 인자면 같은 코퍼스)"""
+    import numpy as np
+
+    rng = np.random.default_rng(seed + start_id)
+    vocabulary = np.array([f"w{i:05d}" for i in range(VOCABULARY_SIZE)])
+    # 실제 초록처럼 소수의 흔한 단어와 긴 꼬리 (Zipf)
+    ranks = np.arange(1, VOCABULARY_SIZE + 1)
+    weights = 1 / ranks ** 1.07
+    weights /= weights.sum()
+
+    words = rng.choice(VOCABULARY_SIZE, size=(count, TITLE_WORDS + ABSTRACT_WORDS), p=weights)
+    for offset, row in enumerate(words):
+        yield {
+            "id": start_id + offset,
+            "title": " ".join(vocabulary[row[:TITLE_WORDS]]),
+            "summary": None,
+            "original_abstract": " ".join(vocabulary[row[TITLE_WORDS:]]),
+        }
+
+
+def measure(index: SimilarityIndex, queries: List[Dict], k: int) -> List[float]:
+    """질의별 related() 시간 (ms)"""
+    index.related(queries[0], k)  # mmap 페이지 / IDF 준비
+    timings = []
+    for article in queries:
+        started = time.perf_counter()
+        index.related(article, k)
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="관련 아티클 질의 시간 벤치마크")
+    parser.add_argument("--articles", type=int, default=100_000, help="base 세그먼트 아티클 수")
+    parser.add_argument("--queries", type=int, default=300, help="측정할 질의 수")
+    parser.add_argument("-k", type=int, default=10, help="반환할 관련 아티클 수")
+    parser.add_argument(
+        "--budget-ms", type=float, default=settings.SIMILARITY_QUERY_BUDGET_MS, help="p95 허용 시간 (ms)"
+    )
+    args = parser.parse_args(argv)
+
+    if not SIMILARITY_AVAILABLE:
+        print("실패: numpy/scipy가 설치되지 않았습니다.")
+        return 1
+
+    step = max(args.articles // args.queries, 1)
+    queries: List[Dict] = []
+
+    def sampled(articles: Iterator[Dict]) -> Iterator[Dict]:
+        # 코퍼스를 한 번만 만들면서 질의용 아티클을 고르게 뽑음
+        for article in articles:
+            if article["id"] % step == 0 and len(queries) < args.queries:
+                queries.append(article)
+            yield article
+
+    with tempfile.TemporaryDirectory(prefix="similarity-bench-") as directory:
+        writer = SimilarityIndex(directory)
+        started = time.perf_counter()
+        writer.rebuild(sampled(synthetic_articles(args.articles)))
+        delta = list(synthetic_articles(DELTA_ARTICLES, start_id=args.articles + 1))
+        writer.add_articles(delta, compact_ratio=1.0)  # 병합하지 않고 delta로 유지
+        build_s = time.perf_counter() - started
+        queries.extend(delta[::max(len(delta) // 20, 1)])  # 새로 추가된 아티클 질의
+
+        # API 프로세스처럼 디스크에서 새로 연 인덱스로 측정
+        reader = SimilarityIndex(directory)
+        timings = measure(reader, queries, args.k)
+        size = reader.size()
+
+    timings.sort()
+    median_ms = statistics.median(timings)
+    p95_ms = timings[min(int(len(timings) * 0.95), len(timings) - 1)]
+    print(f"인덱스: {size:,}건 (base {args.articles:,} + delta {DELTA_ARTICLES}), 생성 {build_s:.1f}초")
+    print(f"related(k={args.k}): 중앙값 {median_ms:.2f} ms, p95 {p95_ms:.2f} ms, "
+          f"최대 {timings[-1]:.2f} ms ({len(timings)}회) / 예산 {args.budget_ms:g} ms")
+
+    if p95_ms > args.budget_ms:
+        print(f"실패: 예산 초과 (p95 {p95_ms:.2f} ms > {args.budget_ms:g} ms)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""API 시작 시간 벤치마크 (python -X importtime 기반)
+
+새 프로세스에서 `import backend.main`을 실행해 누적 import 시간을 측정하고,
+예산(STARTUP_IMPORT_BUDGET_MS)을 넘거나 API 서버가 불러오면 안 되는 수집 전용
+의존성(openai, feedparser, pymed, scholarly, apscheduler)이 로드되면 종료 코드 1을 반환한다.
+CI에서 그대로 실행할 수 있다.
+
+    python -m backend.startup_benchmark
+    python -m backend.startup_benchmark --budget-ms 1200 --runs 5 --top 15
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+from .config import PROJECT_ROOT, settings
+
+TARGET_MODULE = "backend.main"
+
+# API 시작 경로에서 로드되면 안 되는 모듈 (수집 파이프라인 전용)
+FORBIDDEN_MODULES = ("openai", "feedparser", "pymed", "scholarly", "apscheduler")
+
+
+@dataclass
+class ImportProfile:
+    """import 1회 측정 결과 (시간 단위: 마이크로초)"""
+
+    target_us: int
+    modules: Dict[str, Tuple[int, int]]  # 모듈명 → (self, cumulative)
+
+    def top_level(self, count: int) -> List[Tuple[str, int]]:
+        """최상위 패키지별 누적 시간 상위 count개"""
+        packages: Dict[str, int] = {}
+        for name, (_, cumulative) in self.modules.items():
+            if "." in name:
+                continue
+            packages[name] = max(packages.get(name, 0), cumulative)
+        return sorted(packages.items(), key=lambda item: item[1], reverse=True)[:count]
+
+    def forbidden(self) -> List[str]:
+        return sorted(name for name in self.modules if name in FORBIDDEN_MODULES)
+
+
+def _parse_importtime(stderr: str) -> Dict[str, Tuple[int, int]]:
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            modules[name.strip()] = (int(self_us), int(cumulative_us))
+        except ValueError:
+            continue
+    return modules
+
+
+def measure(module: str = TARGET_MODULE) -> ImportProfile:
+    """새 인터프리터에서 module을 import하고 -X importtime 결과를 파싱"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        env={**os.environ, "SCHEDULER_ENABLED": "false", "DB_AUTO_MIGRATE": "false"},
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{module} import 실패:\n{result.stderr[-2000:]}")
+
+    modules = _parse_importtime(result.stderr)
+    if module not in modules:
+        raise RuntimeError(f"importtime 출력에서 {module}을 찾을 수 없습니다.")
+    return ImportProfile(target_us=modules[module][1], modules=modules)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="API 시작(import) 시간 벤치마크")
+    parser.add_argument("--module", default=TARGET_MODULE, help="측정할 모듈")
+    parser.add_argument(
+        "--budget-ms", type=float, default=settings.STARTUP_IMPORT_BUDGET_MS, help="허용 시간 (ms)"
+    )
+    parser.add_argument("--runs", type=int, default=3, help="측정 횟수 (중앙값 사용)")
+    parser.add_argument("--top", type=int, default=10, help="출력할 상위 패키지 수")
+    args = parser.parse_args(argv)
+
+    # 첫 실행은 .pyc 생성 비용이 섞이므로 버림
+    measure(args.module)
+    profiles = [measure(args.module) for _ in range(max(args.runs, 1))]
+    median_ms = statistics.median(p.target_us for p in profiles) / 1000
+    profile = min(profiles, key=lambda p: abs(p.target_us / 1000 - median_ms))
+
+    print(f"{args.module} import: {median_ms:.1f} ms (중앙값, {len(profiles)}회) / 예산 {args.budget_ms:.0f} ms")
+    print("상위 패키지 (누적 ms):")
+    for name, cumulative in profile.top_level(args.top):
+        print(f"  {cumulative / 1000:8.1f}  {name}")
+
+    failed = False
+    forbidden = profile.forbidden()
+    if forbidden:
+        print(f"실패: API 시작 경로에서 수집 전용 모듈이 로드됨: {', '.join(forbidden)}")
+        failed = True
+    if median_ms > args.budget_ms:
+        print(f"실패: 예산 초과 ({median_ms:.1f} ms > {args.budget_ms:.0f} ms)")
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
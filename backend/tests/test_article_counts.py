@@ -0,0 +1,50 @@
+"""(category, source) 아티클 카운터 테스트 (임시 SQLite DB)"""
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend import crud, models  # noqa: E402
+from backend.database import Base  # noqa: E402
+
+
+def _counts(db):
+    return {(row.category, row.source): row.count for row in db.query(models.ArticleCount)}
+
+
+def test_concurrent_first_articles_of_a_key_are_all_counted(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'articles.db'}", connect_args={"timeout": 30}
+    )
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+
+    def save(i):
+        db = Session()
+        try:
+            article = crud.create_article(db, {
+                "title": f"t{i}", "link": f"https://example.com/{i}",
+                "category": "news", "source": "Derm" if i % 2 else None,
+            })
+            return article is not None
+        finally:
+            db.close()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        saved = list(pool.map(save, range(40)))
+
+    db = Session()
+    assert all(saved)  # 카운터 충돌로 버려진 아티클 없음
+    assert _counts(db) == {("news", "Derm"): 20, ("news", ""): 20}
+
+    assert crud.create_article(db, {"title": "dup", "link": "https://example.com/1"}) is None
+    assert _counts(db) == {("news", "Derm"): 20, ("news", ""): 20}  # 중복은 세지 않음
+
+    crud.rebuild_article_counts(db)
+    assert _counts(db) == {("news", "Derm"): 20, ("news", ""): 20}
+    db.close()
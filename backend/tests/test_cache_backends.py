@@ -0,0 +1,118 @@
+"""공유 캐시 백엔드 테스트 (SQLiteCache: 임시 파일, RedisCache: fakeredis)"""
+
+import os
+import pickle
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from utils.cache import generation_key  # noqa: E402
+from utils.cache_backends import RedisCache, SQLiteCache  # noqa: E402
+
+
+class _Exploit:
+    """역직렬화되면 표시를 남기는 pickle 페이로드"""
+
+    triggered = []
+
+    def __reduce__(self):
+        return (_Exploit.triggered.append, ("pickle.loads 실행됨",))
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    return now
+
+
+def test_sqlite_cache_is_shared_across_processes(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = SQLiteCache(path)
+    cache.set("articles:a", b"\x00body")
+
+    child = (
+        "from utils.cache_backends import SQLiteCache\n"
+        f"cache = SQLiteCache({path!r})\n"
+        "assert cache.get('articles:a') == b'\\x00body'\n"
+        "cache.set('scholar:k', [{'title': 't', 'published': None}])\n"
+    )
+    subprocess.run([sys.executable, "-c", child], cwd=BACKEND_DIR, check=True)
+
+    assert cache.get("scholar:k") == [{"title": "t", "published": None}]
+
+
+def test_sqlite_cache_ttl(tmp_path, clock):
+    cache = SQLiteCache(str(tmp_path / "cache.db"), default_ttl=60)
+    cache.set("short", b"x", ttl=5)
+    cache.set("long", b"y")
+
+    clock[0] += 10
+    assert cache.get("short") is None
+    assert cache.get("long") == b"y"
+
+    clock[0] += 60
+    assert cache.cleanup() == 1
+    assert cache.stats()["entries"] == 0
+
+
+def test_sqlite_cache_generation_keys(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.db"))
+    cache.set(generation_key("articles:0:20", 1), b"old")
+
+    assert cache.get(generation_key("articles:0:20", 2)) is None  # 새 세대는 miss
+    assert cache.get(generation_key("articles:0:20", 1)) == b"old"
+    assert cache.delete_prefix("articles:") == 1  # 접두사 무효화는 세대와 무관
+
+
+def test_sqlite_cache_roundtrips_json_values(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.db"))
+    value = [{"title": "보톡스", "published": datetime(2024, 11, 5, 9, 30)}]
+    cache.set("scholar:k", value)
+
+    assert cache.get("scholar:k") == value
+    cache.set("unsupported", object())  # 직렬화할 수 없는 값은 저장하지 않음
+    assert cache.get("unsupported") is None
+
+
+@pytest.fixture
+def redis_client():
+    fakeredis = pytest.importorskip("fakeredis")
+    return fakeredis.FakeRedis()
+
+
+def test_redis_cache_stores_bytes_without_pickle(redis_client):
+    cache = RedisCache(client=redis_client, default_ttl=30)
+    cache.set("articles:a", b"{\"items\":[]}")
+    cache.set("scholar:k", {"published": datetime(2024, 11, 5)})
+
+    assert cache.get("articles:a") == b"{\"items\":[]}"
+    assert cache.get("scholar:k") == {"published": datetime(2024, 11, 5)}
+    assert redis_client.get("mdinfo:cache:articles:a") == b"b{\"items\":[]}"
+    assert 0 < redis_client.ttl("mdinfo:cache:articles:a") <= 30
+
+
+def test_redis_cache_never_unpickles(redis_client):
+    _Exploit.triggered.clear()
+    redis_client.set("mdinfo:cache:articles:a", pickle.dumps(_Exploit()))
+    cache = RedisCache(client=redis_client)
+
+    assert cache.get("articles:a") is None  # 모르는 형식은 miss
+    assert _Exploit.triggered == []
+    assert cache.stats()["misses"] == 1
+
+
+def test_redis_cache_delete_prefix(redis_client):
+    cache = RedisCache(client=redis_client)
+    for i in range(3):
+        cache.set(generation_key(f"articles:{i}", 1), b"x")
+    cache.set("related:1", b"x")
+
+    assert cache.delete_prefix("articles:") == 3
+    assert cache.get("related:1") == b"x"
@@ -0,0 +1,80 @@
+"""아티클 정규 식별자 테스트"""
+
+import os
+import sys
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.dirname(BACKEND_DIR))
+
+from backend import crud, models  # noqa: E402
+from backend.database import Base  # noqa: E402
+from utils.canonical import canonical_id, identity_keys, normalize_url  # noqa: E402
+
+
+def test_same_paper_from_pubmed_scholar_and_rss_shares_doi():
+    pubmed = identity_keys("https://pubmed.ncbi.nlm.nih.gov/39512345/", "10.1111/JOCD.16650")
+    scholar = identity_keys("https://onlinelibrary.wiley.com/doi/full/10.1111/jocd.16650")
+    rss = identity_keys("https://onlinelibrary.wiley.com/doi/10.1111/jocd.16650?af=R")
+
+    assert pubmed[:2] == ["doi:10.1111/jocd.16650", "pmid:39512345"]
+    assert scholar[0] == rss[0] == pubmed[0]
+
+
+def test_pmid_and_url_fallbacks():
+    assert canonical_id("http://www.ncbi.nlm.nih.gov/pubmed/39512345?dopt=Abstract") == "pmid:39512345"
+    assert canonical_id("https://news.example.com/a/") == "url:news.example.com/a"
+    assert canonical_id("") is None
+
+
+def test_normalize_url_drops_tracking_and_sorts_query():
+    assert normalize_url("HTTP://WWW.Example.com:80//news/a/?utm_medium=x&b=2&fbclid=1&a=1#top") == (
+        "example.com/news/a?a=1&b=2"
+    )
+    assert normalize_url("https://example.com:8443/x") == "example.com:8443/x"
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def test_scholar_pubmed_link_matches_stored_pubmed_paper_with_doi(db):
+    crud.create_article(db, {
+        "title": "Botulinum toxin", "link": "https://pubmed.ncbi.nlm.nih.gov/123/",
+        "doi": "10.1000/abc", "source_type": "PubMed",
+    })
+    # 대표 식별자는 DOI지만 PMID / URL도 함께 저장됨
+    assert db.query(models.Article.canonical_id).scalar() == "doi:10.1000/abc"
+
+    scholar = identity_keys("https://pubmed.ncbi.nlm.nih.gov/123")  # 슬래시 없음, DOI 없음
+    rss = identity_keys("https://journal.example.com/article/7", "10.1000/ABC")
+
+    assert scholar == ["pmid:123", "url:pubmed.ncbi.nlm.nih.gov/123"]
+    assert crud.get_existing_identity_keys(db, scholar) == set(scholar)
+    assert crud.get_existing_identity_keys(db, rss) == {"doi:10.1000/abc"}
+
+
+def test_backfill_stores_all_keys_of_existing_articles(db):
+    db.add_all([
+        models.Article(title="a", url="https://pubmed.ncbi.nlm.nih.gov/456/", doi="10.1000/xyz"),
+        models.Article(title="b", url=None),
+    ])
+    db.commit()
+
+    assert crud.backfill_article_identities(db, batch_size=1) == 2
+    assert crud.get_existing_identity_keys(
+        db, ["doi:10.1000/xyz", "pmid:456", "url:pubmed.ncbi.nlm.nih.gov/456"]
+    ) == {"doi:10.1000/xyz", "pmid:456", "url:pubmed.ncbi.nlm.nih.gov/456"}
+    assert [a.canonical_id for a in db.query(models.Article).order_by(models.Article.id)] == [
+        "doi:10.1000/xyz", "",
+    ]
+    assert crud.backfill_article_identities(db) == 1  # URL 없는 아티클만 다시 확인
@@ -0,0 +1,80 @@
+"""키셋(커서) 페이지네이션 테스트 (임시 SQLite DB)"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend import crud, models  # noqa: E402
+from backend.database import Base  # noqa: E402
+
+START = datetime(2024, 1, 1)
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'articles.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    for i in range(240):
+        published = None if i % 17 == 0 else START + timedelta(days=i // 3)  # 같은 날짜 3건씩
+        session.add(models.Article(
+            title=f"t{i}", url=f"https://example.com/{i}", published_date=published,
+            category="news" if i % 2 else "paper", source=f"S{i % 4}",
+        ))
+    session.commit()
+    yield session
+    session.close()
+
+
+def _expected(db, category=None):
+    query = db.query(models.Article)
+    if category:
+        query = query.filter(models.Article.category == category)
+    rows = query.all()
+    dated = sorted((a for a in rows if a.published_date), key=lambda a: (a.published_date, a.id), reverse=True)
+    undated = sorted((a for a in rows if not a.published_date), key=lambda a: a.id, reverse=True)
+    return [a.id for a in dated + undated]
+
+
+@pytest.mark.parametrize("category", [None, "news"])
+def test_cursor_walk_matches_full_ordering(db, category):
+    ids, cursor = [], None
+    while True:
+        page, cursor = crud.get_articles_filtered(db, limit=7, category=category, cursor=cursor)
+        ids.extend(article.id for article in page)
+        if cursor is None:
+            break
+
+    assert ids == _expected(db, category)  # 날짜 없는 꼬리까지 빠짐/중복 없이
+
+
+def test_cursor_pages_use_index_without_sort(db):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "articles" in statement:
+            statements.append((statement, parameters))
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        first, cursor = crud.get_articles_filtered(db, limit=5, category="news")
+        for _ in range(10):  # 깊은 페이지
+            _, cursor = crud.get_articles_filtered(db, limit=5, category="news", cursor=cursor)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert cursor is not None
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            plan = " | ".join(
+                row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            )
+            assert "TEMP B-TREE" not in plan, plan
+            assert "idx_category_published_id" in plan, plan
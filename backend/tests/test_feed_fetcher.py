@@ -0,0 +1,45 @@
+"""비동기 피드 요청기 테스트 (MockTransport, 네트워크 없음)"""
+
+import os
+import sys
+
+import httpx
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from collector import feed_fetcher  # noqa: E402
+from collector.feed_fetcher import FeedFetcher  # noqa: E402
+
+
+def _serve(monkeypatch, handler):
+    """FeedFetcher가 만드는 AsyncClient가 handler로 응답하도록"""
+    client_class = httpx.AsyncClient
+
+    def client(**kwargs):
+        return client_class(transport=httpx.MockTransport(handler), **kwargs)
+
+    monkeypatch.setattr(feed_fetcher.httpx, "AsyncClient", client)
+
+
+def test_deadline_excludes_host_rate_limit_wait(monkeypatch):
+    _serve(monkeypatch, lambda request: httpx.Response(200, content=b"<rss/>"))
+    urls = [f"https://slow-host.example.com/feed{i}.xml" for i in range(3)]
+    # 같은 호스트 초당 2회(버스트 2) → 세 번째 피드는 ~0.5초 기다린 뒤 요청, 마감 0.3초
+    fetcher = FeedFetcher(max_concurrency=1, per_host_rate=2, feed_deadline=0.3)
+
+    responses = list(fetcher.iter_completed(urls))
+
+    assert sorted(r.url for r in responses) == urls
+    assert all(r.ok and r.attempts == 1 for r in responses), [r.error for r in responses]
+
+
+def test_deadline_stops_retries(monkeypatch):
+    monkeypatch.setattr(feed_fetcher, "RETRY_BACKOFF_MIN", 0.05)
+    _serve(monkeypatch, lambda request: httpx.Response(503))
+    fetcher = FeedFetcher(per_host_rate=1000, feed_deadline=0.3)
+
+    [response] = fetcher.iter_completed(["https://down.example.com/feed.xml"])
+
+    assert not response.ok
+    assert "마감 시간 초과" in response.error
+    assert 2 <= response.attempts <= 4
@@ -0,0 +1,96 @@
+"""조건부 요청(ETag / Last-Modified / 304) API 테스트 (임시 SQLite DB, TestClient)"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+from email.utils import format_datetime, parsedate_to_datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend import data_version, main, models  # noqa: E402
+from backend.database import Base, get_async_db  # noqa: E402
+
+IDENTITY = {"Accept-Encoding": "identity"}
+GZIP = {"Accept-Encoding": "gzip"}
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'articles.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    data_version.ensure_data_version(session)
+    for i in range(30):
+        session.add(models.Article(
+            title=f"보툴리눔 톡신 연구 {i}", url=f"https://example.com/{i}",
+            published_date=datetime(2024, 1, 1) + timedelta(days=i), category="paper", source="PubMed",
+        ))
+    session.commit()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def client(db, monkeypatch):
+    async def override():
+        yield db
+
+    # 다른 테스트의 세대 값/응답 캐시를 쓰지 않도록 초기화
+    monkeypatch.setattr(data_version, "_current", None)
+    main.get_cache().clear()
+    main.app.dependency_overrides[get_async_db] = override
+    yield TestClient(main.app)
+    main.app.dependency_overrides.pop(get_async_db, None)
+    main.get_cache().clear()
+
+
+def test_repeated_get_with_etag_returns_304_without_body(client):
+    first = client.get("/articles/?limit=20", headers=IDENTITY)
+    assert first.status_code == 200
+    assert len(first.json()["items"]) == 20
+    etag = first.headers["ETag"]
+
+    again = client.get("/articles/?limit=20", headers={**IDENTITY, "If-None-Match": etag})
+
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["ETag"] == etag
+    assert client.get("/articles/?limit=10", headers={**IDENTITY, "If-None-Match": etag}).status_code == 200
+
+
+def test_etag_changes_after_data_version_bump(client, db):
+    etag = client.get("/articles/", headers=IDENTITY).headers["ETag"]
+
+    data_version.bump_data_version(db)
+    changed = client.get("/articles/", headers={**IDENTITY, "If-None-Match": etag})
+
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert changed.json()["items"]
+
+
+def test_gzip_and_identity_responses_have_different_etags(client):
+    plain = client.get("/articles/?limit=50", headers=IDENTITY)
+    gzipped = client.get("/articles/?limit=50", headers=GZIP)
+
+    assert "content-encoding" not in plain.headers
+    assert gzipped.headers["Content-Encoding"] == "gzip"
+    assert plain.headers["ETag"] != gzipped.headers["ETag"]
+    assert gzipped.json() == plain.json()  # 같은 내용, 다른 표현
+    # 한 표현의 ETag로 다른 표현을 304 받지 않음
+    crossed = client.get("/articles/?limit=50", headers={**GZIP, "If-None-Match": plain.headers["ETag"]})
+    assert crossed.status_code == 200
+
+
+def test_if_modified_since_is_honoured(client):
+    last_modified = client.get("/articles/", headers=IDENTITY).headers["Last-Modified"]
+    earlier = format_datetime(parsedate_to_datetime(last_modified) - timedelta(hours=1), usegmt=True)
+
+    assert client.get("/articles/", headers={**IDENTITY, "If-Modified-Since": last_modified}).status_code == 304
+    assert client.get("/articles/", headers={**IDENTITY, "If-Modified-Since": earlier}).status_code == 200
+    assert client.get("/sources", headers={"If-Modified-Since": last_modified}).status_code == 304
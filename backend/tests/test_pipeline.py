@@ -0,0 +1,127 @@
+"""스트리밍 파이프라인 테스트: 단계 연결, 생산자 타임아웃/취소, backpressure"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.pipeline import Pipeline, Producer, Stage  # noqa: E402
+
+
+def _collect(results, lock):
+    def save(item):
+        with lock:
+            results.append(item)
+        return []
+    return save
+
+
+def test_items_flow_through_stages_and_failures_pass_through():
+    results, lock = [], threading.Lock()
+    save = Stage("save", _collect(results, lock))
+
+    def double(item):
+        if item == 3:
+            raise ValueError("bad item")
+        return [item * 2]
+
+    work = Stage("double", double, workers=3, downstream=save, passthrough_on_error=True)
+    producers = [
+        Producer("a", lambda: [[1, 2], [3]], work),
+        Producer("b", lambda: iter([[10], [20, 30]]), work),
+    ]
+    Pipeline(producers, [work, save]).run()
+
+    assert sorted(results) == [2, 3, 4, 20, 40, 60]  # 실패한 3은 그대로 전달
+    assert (work.stats.total, work.stats.success, work.stats.failed) == (6, 5, 1)
+    assert work.stats.errors[0]["error"] == "ValueError"
+    assert save.stats.total == 6
+
+
+def test_batch_stage_and_finish_emit_remaining():
+    results, lock = [], threading.Lock()
+    save = Stage("save", _collect(results, lock))
+    batches = []
+
+    def buffer(items):
+        batches.append(list(items))
+        return []
+
+    batcher = Stage("batch", buffer, batch_size=4, downstream=save, finish=lambda: ["flushed"])
+    Pipeline([Producer("p", lambda: [list(range(10))], batcher)], [batcher, save]).run()
+
+    assert sorted(item for batch in batches for item in batch) == list(range(10))
+    assert all(len(batch) <= 4 for batch in batches)
+    assert results == ["flushed"]
+
+
+def test_producer_timeout_closes_downstream_and_keeps_earlier_items():
+    results, lock = [], threading.Lock()
+    save = Stage("save", _collect(results, lock))
+    never = threading.Event()
+
+    def hanging():
+        yield ["first", "second"]
+        never.wait()  # 응답 없는 수집기
+        yield ["late"]
+
+    slow = Producer("slow", hanging, save, timeout=0.3)
+    fast = Producer("fast", lambda: [["other"]], save)
+
+    started = time.monotonic()
+    Pipeline([slow, fast], [save]).run()
+
+    assert time.monotonic() - started < 2
+    assert slow.timed_out and not fast.timed_out
+    assert slow.stats.errors[0]["type"] == "TimeoutError"
+    assert sorted(results) == ["first", "other", "second"]
+
+    never.set()  # 포기된 스레드가 뒤늦게 내놓은 결과는 버려짐
+    slow._thread.join(2)
+    assert not slow._thread.is_alive()
+    assert "late" not in results
+
+
+def test_cancelled_producer_stops_waiting_on_full_queue():
+    release = threading.Event()
+    processed = []
+
+    def blocked(item):
+        release.wait()
+        processed.append(item)
+        return []
+
+    stage = Stage("blocked", blocked, maxsize=1)
+    producer = Producer("flood", lambda: [list(range(100))], stage, timeout=0.2)
+    threading.Timer(0.8, release.set).start()  # 타임아웃 뒤에 단계가 다시 진행
+
+    Pipeline([producer], [stage]).run()
+    producer._thread.join(2)
+
+    assert producer.timed_out
+    assert not producer._thread.is_alive()  # put 대기 중 취소를 보고 종료
+    assert producer.stats.success < 100
+    assert processed == list(range(producer.stats.success))  # 넣은 항목은 모두 처리
+
+
+def test_bounded_queue_applies_backpressure():
+    release = threading.Event()
+    stage = Stage("slow", lambda item: release.wait() and [], maxsize=2)
+    producer = Producer("fast", lambda: [list(range(50))], stage)
+    pipeline = Pipeline([producer], [stage])
+
+    runner = threading.Thread(target=pipeline.run)
+    runner.start()
+    time.sleep(0.3)
+    # 처리 중 1건 + 큐 2건까지만 받아들이고 생산자는 put에서 대기
+    assert producer.stats.success <= 3
+    assert stage.queue.qsize() <= 2
+
+    release.set()
+    runner.join(10)
+
+    assert not runner.is_alive()
+    assert stage.stats.total == 50
+    assert stage.stats.max_queue_depth <= 2
@@ -0,0 +1,193 @@
+"""PubMed E-utilities 클라이언트 테스트 (fixtures/pubmed의 응답 사용, 네트워크 없음)"""
+
+import io
+import os
+import sys
+from datetime import datetime
+from urllib.parse import parse_qs
+
+import httpx
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from collector import pubmed_eutils  # noqa: E402
+from collector.pubmed_eutils import (  # noqa: E402
+    EUtilsClient,
+    _iter_stream_records,
+    parse_efetch_xml,
+)
+from utils.rate_limit import TokenBucket  # noqa: E402
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "pubmed")
+
+
+def _fixture(name: str) -> bytes:
+    with open(os.path.join(FIXTURES, name), "rb") as f:
+        return f.read()
+
+
+class RecordedEUtils:
+    """fixtures의 응답을 돌려주고 요청을 기록하는 MockTransport 핸들러"""
+
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.url.path.endswith("/esearch.fcgi"):
+            term = request.url.params["term"].replace(" ", "_")
+            return httpx.Response(200, content=_fixture(f"esearch_{term}.json"))
+        if request.url.path.endswith("/efetch.fcgi"):
+            return httpx.Response(200, content=_fixture("efetch.xml"))
+        return httpx.Response(404)
+
+    def efetch_ids(self):
+        return [
+            parse_qs(request.content.decode())["id"][0].split(",")
+            for request in self.requests
+            if request.url.path.endswith("/efetch.fcgi")
+        ]
+
+
+def _client(handler) -> EUtilsClient:
+    return EUtilsClient(
+        email="test@example.com",
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        limiter=TokenBucket(rate=1000),
+    )
+
+
+def test_parse_efetch_xml():
+    records = list(parse_efetch_xml(io.BytesIO(_fixture("efetch.xml"))))
+
+    assert [r.pmid for r in records] == ["39512345", "39501122"]
+    first, second = records
+    assert first.title == (
+        "Long-term efficacy of botulinum toxin type A for glabellar lines: a 24-month follow-up."
+    )
+    assert first.abstract.splitlines() == [
+        "Botulinum toxin type A is widely used for glabellar lines.",
+        "We followed 120 patients for 24 months.",
+        "Improvement persisted in 78% of patients (p < 0.01).",
+    ]
+    assert first.journal == "Journal of cosmetic dermatology"
+    assert first.doi == "10.1111/jocd.16650"
+    assert first.published == datetime(2024, 11, 9)  # PubStatus=pubmed 우선
+
+    assert second.abstract == ""
+    assert second.doi == ""
+    assert second.published == datetime(2024, 10, 30)  # 저널 발행일 (월 이름)
+
+
+def test_stream_parser_handles_small_chunks():
+    body = _fixture("efetch.xml")
+    chunks = [body[i:i + 7] for i in range(0, len(body), 7)]
+
+    streamed = list(_iter_stream_records(chunks))
+
+    assert streamed == list(parse_efetch_xml(io.BytesIO(body)))
+
+
+def test_search_new_dedups_across_queries_and_db():
+    handler = RecordedEUtils()
+    client = _client(handler)
+    excluded = []
+
+    def exclude(pmids):
+        excluded.append(list(pmids))
+        return {"39498877", "39487001"}
+
+    records = list(
+        client.search_new(["botulinum toxin", "filler", "exosome"], retmax=3, exclude=exclude)
+    )
+
+    # 쿼리 3개의 PMID 6건 → 고유 4건을 한 번에 DB와 대조
+    assert excluded == [["39512345", "39498877", "39487001", "39501122"]]
+    # 신규 PMID만 efetch 한 번
+    assert handler.efetch_ids() == [["39512345", "39501122"]]
+    assert [r.pmid for r in records] == ["39512345", "39501122"]
+    assert records[0].queries == ["botulinum toxin", "filler"]
+    assert records[1].queries == ["filler"]
+
+
+def test_search_new_since_sends_mindate():
+    handler = RecordedEUtils()
+    client = _client(handler)
+
+    list(client.search_new(["exosome"], retmax=3, since=datetime(2024, 11, 1, 9, 30)))
+
+    params = handler.requests[0].url.params
+    assert params["datetype"] == "edat"
+    assert params["mindate"] == "2024/11/01"
+    assert params["maxdate"] == "3000/12/31"
+
+
+def test_search_new_skips_efetch_when_nothing_new():
+    handler = RecordedEUtils()
+    client = _client(handler)
+
+    records = list(client.search_new(["exosome"], retmax=3))
+
+    assert records == []
+    assert handler.efetch_ids() == []
+
+
+class WindowEUtils(RecordedEUtils):
+    """since 창의 PMID 목록을 retstart/retmax만큼 잘라 돌려주는 핸들러"""
+
+    def __init__(self, window):
+        super().__init__()
+        self.window = window
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if not request.url.path.endswith("/esearch.fcgi"):
+            return super().__call__(request)
+        self.requests.append(request)
+        start = int(request.url.params["retstart"])
+        ids = self.window[start:start + int(request.url.params["retmax"])]
+        return httpx.Response(200, json={"esearchresult": {"count": str(len(self.window)), "idlist": ids}})
+
+
+def test_search_new_pages_past_stored_pmids_in_since_window():
+    window = [str(pmid) for pmid in range(100, 107)]
+    handler = WindowEUtils(window)
+    client = _client(handler)
+    stored = set(window[:3])
+
+    list(client.search_new(["exosome"], retmax=2, exclude=lambda pmids: stored & set(pmids),
+                           since=datetime(2024, 11, 1)))
+
+    # 앞쪽 2건은 이미 저장됨 → retstart=2부터 이어 읽어 새 PMID 2건
+    assert handler.efetch_ids() == [["103", "104"]]
+    assert client.truncated_queries == ["exosome"]  # 105, 106은 다음 실행에서
+
+    stored.update(["103", "104"])
+    handler.requests.clear()
+    list(client.search_new(["exosome"], retmax=2, exclude=lambda pmids: stored & set(pmids),
+                           since=datetime(2024, 11, 1)))
+
+    assert handler.efetch_ids() == [["105", "106"]]
+    assert client.truncated_queries == []  # 창을 끝까지 확인
+
+
+def test_transient_errors_are_retried(monkeypatch):
+    monkeypatch.setattr(pubmed_eutils, "RETRY_BACKOFF_MIN", 0.0)
+    recorded = RecordedEUtils()
+    failures = {"/esearch.fcgi": 1, "/efetch.fcgi": 1}
+
+    def handler(request):
+        endpoint = "/" + request.url.path.rsplit("/", 1)[-1]
+        if failures.get(endpoint):
+            failures[endpoint] -= 1
+            recorded.requests.append(request)
+            return httpx.Response(503)
+        return recorded(request)
+
+    client = _client(handler)
+    records = list(client.search_new(["filler"], retmax=3))
+
+    assert client.failed_queries == []
+    assert [r.pmid for r in records] == ["39512345", "39501122"]
+    assert [request.url.path.rsplit("/", 1)[-1] for request in recorded.requests] == [
+        "esearch.fcgi", "esearch.fcgi", "efetch.fcgi", "efetch.fcgi",
+    ]
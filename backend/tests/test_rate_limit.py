@@ -0,0 +1,65 @@
+"""토큰 버킷 속도 제한 테스트"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.dirname(BACKEND_DIR))
+
+from backend.collect_data import _rate_limit_stats  # noqa: E402
+from backend.utils import rate_limit as package_rate_limit  # noqa: E402
+from utils.rate_limit import TokenBucket, get_rate_limiter  # noqa: E402
+
+
+def test_burst_then_rate():
+    bucket = TokenBucket(rate=20, burst=5)
+
+    started = time.monotonic()
+    for _ in range(15):
+        bucket.acquire()
+    elapsed = time.monotonic() - started
+
+    # 5개는 즉시, 나머지 10개는 초당 20개 → 약 0.5초
+    assert 0.4 <= elapsed < 0.8
+
+
+def test_shared_across_threads_and_event_loop():
+    bucket = TokenBucket(rate=50, burst=1)
+
+    def worker():
+        for _ in range(5):
+            bucket.acquire()
+
+    async def async_worker():
+        for _ in range(5):
+            await bucket.acquire_async()
+
+    started = time.monotonic()
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    asyncio.run(async_worker())
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - started
+
+    # 20회 요청, 첫 1회 이후 초당 50회 → 약 0.38초
+    assert 0.3 <= elapsed < 0.7
+    assert bucket.stats()["acquired"] == 20
+
+
+def test_registry_returns_same_bucket_per_upstream():
+    assert get_rate_limiter("test:a", rate=3) is get_rate_limiter("test:a", rate=10)
+    assert get_rate_limiter("test:a", rate=3) is not get_rate_limiter("test:b", rate=3)
+
+
+def test_pipeline_report_reads_collector_registry():
+    get_rate_limiter("test:collector", 5).acquire()  # 수집기와 같은 utils.rate_limit
+
+    stats = _rate_limit_stats()
+    assert stats["test:collector"]["acquired"] == 1
+    assert "test:collector" not in package_rate_limit.rate_limiter_stats()  # 별개 레지스트리
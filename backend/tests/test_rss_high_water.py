@@ -0,0 +1,65 @@
+"""RSS 피드 수위(high-water mark) 테스트: 처리되지 않은 항목은 다음 실행에서 다시 수집"""
+
+import os
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.dirname(BACKEND_DIR))
+
+from backend.collect_data import _RatioBalancer, _categorize  # noqa: E402
+from collector import rss_collector  # noqa: E402
+from collector.feed_fetcher import FeedResponse  # noqa: E402
+
+FEED_URL = "https://feeds.example.com/derm.xml"
+FEED = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Dermatology Times</title>
+<item><title>Newer story</title><link>https://example.com/news/2</link>
+<pubDate>Tue, 05 Nov 2024 09:00:00 GMT</pubDate></item>
+<item><title>Older story</title><link>https://example.com/news/1</link>
+<pubDate>Mon, 04 Nov 2024 09:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+
+class LocalFetcher:
+    """네트워크 대신 FEED를 돌려주는 FeedFetcher"""
+
+    def __init__(self, **kwargs):
+        pass
+
+    def iter_completed(self, urls, validators=None):
+        for url in urls:
+            yield FeedResponse(url=url, content=FEED, status_code=200)
+
+
+def _collect(feed_states):
+    collector = rss_collector.RSSCollector(feed_states=feed_states)
+    collector.sources = [{"url": FEED_URL, "name": "Derm", "category": "News"}]
+    items = [item for batch in collector.iter_feeds() for item in _categorize(batch, "RSS")]
+    return collector, items
+
+
+def test_item_dropped_by_balancer_is_collected_next_run(monkeypatch):
+    monkeypatch.setattr(rss_collector, "FeedFetcher", LocalFetcher)
+    feed_states = {}
+
+    # 1회차: 논문 1건 → 뉴스 한도 1건, 오래된 뉴스는 finish()에서 버려짐
+    collector, items = _collect(feed_states)
+    assert [item["link"] for item in items] == ["https://example.com/news/2", "https://example.com/news/1"]
+    balancer = _RatioBalancer({"target_news_ratio": 0.5, "target_academic_ratio": 0.5})
+    released = []
+    for item in items + [{"category": "paper", "title": "paper"}]:
+        released.extend(balancer.add(item))
+    released.extend(balancer.finish())
+    for item in released:
+        if item.get("feed_url"):
+            collector.settle(item["feed_url"], item["link"])  # 저장됨
+    collector.finalize()
+
+    assert [item["link"] for item in released if item.get("feed_url")] == ["https://example.com/news/2"]
+    assert feed_states[FEED_URL]["seen_links"] == ["https://example.com/news/2"]
+    assert feed_states[FEED_URL]["body_hash"] is None  # 본문이 같아도 다시 파싱
+
+    # 2회차: 저장된 뉴스는 건너뛰고 버려졌던 뉴스만 다시 수집
+    collector, items = _collect(feed_states)
+    assert [item["link"] for item in items] == ["https://example.com/news/1"]
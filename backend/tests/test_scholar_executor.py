@@ -0,0 +1,85 @@
+"""Google Scholar 워커 프로세스 마감 / 키워드 캐시 테스트"""
+
+import os
+import sys
+import time
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from collector import scholar_collector  # noqa: E402
+from collector.scholar_collector import GoogleScholarCollector, ScholarProcessExecutor  # noqa: E402
+from utils.rate_limit import TokenBucket  # noqa: E402
+
+
+def _search_or_hang(keyword, max_results):
+    """워커에서 실행: 'captcha'는 CAPTCHA에 걸린 scholarly처럼 응답 없이 멈춤"""
+    if keyword == "captcha":
+        time.sleep(3600)
+    return [{"title": f"{keyword} {i}", "link": f"https://example.com/{keyword}/{i}"} for i in range(max_results)]
+
+
+def test_hanging_search_kills_worker_and_next_search_respawns():
+    with ScholarProcessExecutor(search_fn=_search_or_hang) as executor:
+        assert executor.search("botox", 2, timeout=30)[0]["title"] == "botox 0"
+        hung = executor._process
+        hung_pid = hung.pid
+
+        started = time.monotonic()
+        with pytest.raises(TimeoutError):
+            executor.search("captcha", 2, timeout=1)
+        elapsed = time.monotonic() - started
+
+        assert 1 <= elapsed < 3  # 마감 + 종료(terminate) 시간
+        assert executor.killed == 1
+        assert executor._process is None
+        with pytest.raises(ProcessLookupError):  # 종료되고 회수됨 (좀비로 남지 않음)
+            os.kill(hung_pid, 0)
+
+        assert executor.search("filler", 1, timeout=30) == [
+            {"title": "filler 0", "link": "https://example.com/filler/0"}
+        ]
+        assert executor._process is not hung and executor._process.is_alive()
+        assert executor.killed == 1
+
+
+class _CountingExecutor:
+    """워커 대신 프로세스 안에서 검색 횟수만 세는 실행기"""
+
+    searches = []
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def search(self, keyword, max_results, timeout):
+        self.searches.append(keyword)
+        return [] if keyword == "empty" else [{"title": keyword, "link": f"https://example.com/{keyword}"}]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+def test_cached_keyword_is_not_requeried_within_ttl(tmp_path, monkeypatch):
+    monkeypatch.setattr(scholar_collector.settings, "SCHOLAR_CACHE_PATH", str(tmp_path / "scholar.db"))
+    monkeypatch.setattr(scholar_collector.settings, "SCHOLAR_CACHE_TTL", 3600)
+    monkeypatch.setattr(scholar_collector, "ScholarProcessExecutor", _CountingExecutor)
+    monkeypatch.setattr(scholar_collector, "get_rate_limiter", lambda name, rate: TokenBucket(float("inf")))
+    _CountingExecutor.searches = []
+
+    collector = GoogleScholarCollector()
+    collector.keywords = ["botox", "empty"]
+
+    first = collector.search_articles(max_results=1)
+    second = collector.search_articles(max_results=1)
+
+    assert _CountingExecutor.searches == ["botox", "empty"]  # 두 번째 실행은 모두 캐시 (빈 결과 포함)
+    assert second == first == [{"title": "botox", "link": "https://example.com/botox"}]
+    assert collector.cache_hits == 2
+
+    collector.search_articles(max_results=2)  # max_results가 다르면 다른 키
+    assert _CountingExecutor.searches == ["botox", "empty", "botox", "empty"]
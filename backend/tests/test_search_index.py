@@ -0,0 +1,94 @@
+"""전문 검색 인덱스(FTS5 트리거)와 검색 API 테스트 (임시 SQLite DB, TestClient)"""
+
+import os
+import sys
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend import data_version, main, models, search_index  # noqa: E402
+from backend.database import Base, get_async_db  # noqa: E402
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'articles.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    monkeypatch.setattr(search_index, "_backend", None)  # 프로세스 전역 판별값 격리
+    if search_index.setup_search_index(engine) != "fts5":
+        pytest.skip("SQLite FTS5 미지원 빌드")
+    session = sessionmaker(bind=engine)()
+    data_version.ensure_data_version(session)
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def client(db, monkeypatch):
+    async def override():
+        yield db
+
+    monkeypatch.setattr(data_version, "_current", None)
+    main.get_cache().clear()
+    main.app.dependency_overrides[get_async_db] = override
+    yield TestClient(main.app)
+    main.app.dependency_overrides.pop(get_async_db, None)
+    main.get_cache().clear()
+
+
+def _add(db, title, title_ko=None, summary=None):
+    article = models.Article(
+        title=title, title_ko=title_ko, summary=summary, url=f"https://example.com/{title}",
+        published_date=datetime(2024, 5, 1), category="paper", source="PubMed",
+    )
+    db.add(article)
+    db.commit()
+    data_version.bump_data_version(db)  # 응답 캐시를 새 세대로
+    return article
+
+
+def _search(client, q):
+    response = client.get("/articles/search", params={"q": q, "include_total": "false"})
+    assert response.status_code == 200
+    return [item["title"] for item in response.json()["items"]]
+
+
+def test_search_follows_insert_update_delete(client, db):
+    article = _add(db, "Botulinum toxin for glabellar lines", title_ko="보톡스는 미간 주름에 효과")
+    _add(db, "Hyaluronic acid filler volume")
+
+    assert _search(client, "botulinum") == ["Botulinum toxin for glabellar lines"]
+    assert _search(client, "보톡스") == ["Botulinum toxin for glabellar lines"]  # 조사 붙은 어절 접두사 일치
+
+    article.title = "Fractional laser resurfacing"
+    db.commit()
+    data_version.bump_data_version(db)
+    assert _search(client, "botulinum") == []
+    assert _search(client, "laser") == ["Fractional laser resurfacing"]
+    assert _search(client, "보톡스") == ["Fractional laser resurfacing"]  # 바뀌지 않은 컬럼은 유지
+
+    db.delete(article)
+    db.commit()
+    data_version.bump_data_version(db)
+    assert _search(client, "laser") == []
+    assert _search(client, "filler") == ["Hyaluronic acid filler volume"]
+
+
+def test_legacy_search_keeps_substring_matching(client, db):
+    _add(db, "Neurotoxin dosing in aesthetic practice", title_ko="보툴리눔톡신 시술 용량")
+    _add(db, "Hyaluronic acid filler volume")
+
+    def legacy(search):
+        response = client.get("/articles/", params={"search": search})
+        assert response.status_code == 200
+        return [item["title"] for item in response.json()["items"]]
+
+    # 목록 API의 search는 단어 중간 일치도 찾는다 (토큰 접두사 전문 검색과 다름)
+    assert legacy("톡신") == ["Neurotoxin dosing in aesthetic practice"]
+    assert legacy("toxin") == ["Neurotoxin dosing in aesthetic practice"]
+    assert legacy("ACID FILL") == ["Hyaluronic acid filler volume"]
@@ -0,0 +1,166 @@
+"""관련 아티클 유사도 인덱스 테스트 (임시 디렉터리)"""
+
+import os
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.similarity import N_FEATURES, SimilarityIndex, _idf, term_frequencies  # noqa: E402
+from backend.similarity_benchmark import synthetic_articles  # noqa: E402
+
+TOPICS = (
+    "botulinum toxin glabellar lines injection dose",
+    "hyaluronic acid filler nasolabial folds volume",
+    "fractional laser resurfacing acne scars erythema",
+)
+
+
+def _articles(count, start_id=1):
+    # 주제별 어휘 (id 순서대로 TOPICS를 돌아가며) + 문서마다 다른 단어로 순위가 갈리도록
+    return [
+        {
+            "id": start_id + i,
+            "title": f"{TOPICS[i % 3].split()[0]} study {i}",
+            "summary": None,
+            "original_abstract": f"{TOPICS[i % 3]} patients{i} cohort{i % 7}",
+        }
+        for i in range(count)
+    ]
+
+
+def _brute_force(corpus, article, k):
+    """같은 TF-IDF 정의로 모든 문서와 직접 계산한 코사인 유사도 상위 k"""
+    vectors = []
+    df = np.zeros(N_FEATURES, dtype=np.int64)
+    for doc in corpus:
+        terms, tf = term_frequencies(doc)
+        vectors.append((doc["id"], terms, tf))
+        df[terms] += 1
+    idf = _idf(df, len(corpus))
+
+    def dense(terms, tf):
+        vector = np.zeros(N_FEATURES, dtype=np.float64)
+        vector[terms] = tf * idf[terms]
+        return vector / (np.linalg.norm(vector) or 1.0)
+
+    query = dense(*term_frequencies(article))
+    scores = [
+        (doc_id, float(dense(terms, tf) @ query))
+        for doc_id, terms, tf in vectors
+        if doc_id != article["id"]
+    ]
+    scores = [item for item in scores if item[1] > 0]
+    return sorted(scores, key=lambda item: -item[1])[:k]
+
+
+def test_rebuild_topk_matches_brute_force(tmp_path):
+    corpus = list(synthetic_articles(300))
+    for doc in corpus:  # 질의 단어 상한(MAX_QUERY_TERMS) 밖으로 나가지 않도록 짧게
+        doc["original_abstract"] = " ".join(doc["original_abstract"].split()[:12])
+    index = SimilarityIndex(tmp_path)
+    assert index.rebuild(corpus) == 300
+
+    for article in corpus[::37]:
+        got = index.related(article, k=5)
+        expected = _brute_force(corpus, article, 5)
+        assert [doc_id for doc_id, _ in got] == [doc_id for doc_id, _ in expected]
+        assert [score for _, score in got] == pytest.approx([s for _, s in expected], abs=1e-4)
+
+
+def test_related_finds_same_topic(tmp_path):
+    index = SimilarityIndex(tmp_path)
+    corpus = _articles(30)
+    index.rebuild(corpus)
+
+    related = index.related(corpus[0], k=5)
+
+    assert len(related) == 5
+    assert all((doc_id - 1) % 3 == 0 for doc_id, _ in related)  # 모두 botox 주제
+    assert corpus[0]["id"] not in [doc_id for doc_id, _ in related]
+    assert [score for _, score in related] == sorted((s for _, s in related), reverse=True)
+
+
+def test_add_articles_goes_to_delta_then_compacts(tmp_path):
+    index = SimilarityIndex(tmp_path)
+    index.rebuild(_articles(30))
+
+    new = _articles(3, start_id=100)
+    assert index.add_articles(new + new[:1]) == 3  # 입력 내 중복 무시
+    assert (tmp_path / "delta.npz").exists()
+    assert index.add_articles(new) == 0  # 이미 색인됨
+    assert index.size() == 33
+    assert 100 in [doc_id for doc_id, _ in index.related(_articles(1)[0], k=20)]
+
+    # delta가 max(1000, base × ratio)를 넘으면 base로 병합
+    current = (tmp_path / "CURRENT").read_text()
+    assert index.add_articles(_articles(1001, start_id=1000)) == 1001
+    assert not (tmp_path / "delta.npz").exists()
+    assert (tmp_path / "CURRENT").read_text() != current
+    assert index.size() == 1034
+    assert len(list((tmp_path / "segments").iterdir())) == 1  # 이전 세그먼트 정리
+
+
+def _mapped(array):
+    """array가 (복사 없이) np.memmap 위의 뷰인지"""
+    while array is not None and not isinstance(array, np.memmap):
+        array = getattr(array, "base", None)
+    return array is not None
+
+
+def test_reader_reloads_mmap_base_and_delta(tmp_path):
+    writer = SimilarityIndex(tmp_path)
+    writer.rebuild(_articles(30))
+    reader = SimilarityIndex(tmp_path, reload_seconds=0)
+
+    assert reader.size() == 30
+    assert all(_mapped(getattr(reader._base.postings, name)) for name in ("data", "indices", "indptr"))
+
+    writer.add_articles(_articles(2, start_id=200))
+    assert reader.size() == 32  # 파일 변경을 보고 다시 로드
+    related = [doc_id for doc_id, _ in reader.related(_articles(2)[1], k=30)]
+    assert 201 in related  # delta 문서도 검색됨 (filler 주제)
+
+    writer.rebuild(_articles(30))
+    assert reader.size() == 30  # 새 base로 교체, 이전 delta는 버림
+
+
+def test_reader_rereads_current_when_segment_is_replaced_during_load(tmp_path, monkeypatch):
+    writer = SimilarityIndex(tmp_path)
+    writer.rebuild(_articles(30))
+    reader = SimilarityIndex(tmp_path, reload_seconds=0)
+    load_base = reader._load_base
+    opened = []
+
+    def racing(name):
+        opened.append(name)
+        if len(opened) == 1:
+            writer.rebuild(_articles(40))  # CURRENT를 읽은 직후 병합 → 이전 세그먼트 삭제
+        return load_base(name)
+
+    monkeypatch.setattr(reader, "_load_base", racing)
+
+    assert reader.size() == 40  # 빈 결과가 아니라 새 base
+    assert len(opened) == 2 and opened[0] != opened[1]
+    assert reader.related(_articles(1)[0], k=3)
+
+
+def test_reader_keeps_previous_base_when_segment_cannot_be_opened(tmp_path, monkeypatch):
+    writer = SimilarityIndex(tmp_path)
+    writer.rebuild(_articles(30))
+    reader = SimilarityIndex(tmp_path, reload_seconds=0)
+    assert reader.size() == 30
+
+    def missing(name):
+        raise FileNotFoundError(name)
+
+    writer.rebuild(_articles(40))
+    monkeypatch.setattr(reader, "_load_base", missing)
+    assert reader.size() == 30  # 이전 mmap 세그먼트로 계속 응답
+
+    monkeypatch.undo()
+    assert reader.size() == 40  # 다음 확인 때 다시 시도
@@ -0,0 +1,142 @@
+"""단일 비행(single-flight) 요청 병합과 stale-while-revalidate 테스트"""
+
+import asyncio
+import contextlib
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend import main  # noqa: E402
+from backend.utils.singleflight import SingleFlight  # noqa: E402
+
+
+def test_concurrent_do_runs_fn_once():
+    async def scenario():
+        flight = SingleFlight()
+        release = asyncio.Event()
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            await release.wait()
+            return {"items": [1, 2]}
+
+        waiters = [asyncio.create_task(flight.do("articles", fn)) for _ in range(10)]
+        await asyncio.sleep(0)
+        assert flight.in_flight("articles")
+        release.set()
+        results = await asyncio.gather(*waiters)
+        return flight, calls, results
+
+    flight, calls, results = asyncio.run(scenario())
+
+    assert calls == [1]
+    assert all(result == {"items": [1, 2]} for result in results)
+    assert not flight.in_flight("articles")
+    assert flight.stats()["leaders"] == 1
+    assert flight.stats()["coalesced"] == 9
+
+
+def test_exception_reaches_every_waiter_and_clears_key():
+    async def scenario():
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def failing():
+            await release.wait()
+            raise RuntimeError("db down")
+
+        waiters = [asyncio.create_task(flight.do("articles", failing)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+
+        assert not flight.in_flight("articles")
+
+        async def ok():
+            return "fresh"
+
+        return results, await flight.do("articles", ok)  # 다음 호출은 새로 계산
+
+    results, retried = asyncio.run(scenario())
+
+    assert len(results) == 5
+    assert all(isinstance(r, RuntimeError) and str(r) == "db down" for r in results)
+    assert retried == "fresh"
+
+
+def test_spawn_is_noop_while_key_in_flight():
+    async def scenario():
+        flight = SingleFlight()
+        release = asyncio.Event()
+        calls = []
+
+        async def refresh():
+            calls.append(1)
+            await release.wait()
+
+        assert flight.spawn("articles", refresh) is True
+        assert flight.spawn("articles", refresh) is False  # 이미 갱신 중
+        leader = asyncio.create_task(flight.do("articles", refresh))  # 진행 중인 갱신에 합류
+        await asyncio.sleep(0)
+        release.set()
+        await leader
+        await asyncio.sleep(0)
+        return flight, calls
+
+    flight, calls = asyncio.run(scenario())
+
+    assert calls == [1]
+    assert flight.stats()["background_refreshes"] == 1
+    assert not flight.in_flight("articles")
+
+
+@pytest.fixture
+def memory_cache():
+    if main.settings.CACHE_BACKEND != "memory":
+        pytest.skip("메모리 캐시 백엔드 기준 테스트")
+    return main.get_cache()
+
+
+class _Model:
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def model_dump_json(self, **kwargs) -> str:
+        return self.body.decode()
+
+
+def test_stale_entry_is_served_while_one_refresh_runs(monkeypatch, memory_cache):
+    @contextlib.asynccontextmanager
+    async def session():
+        yield None
+
+    monkeypatch.setattr(main.database, "async_read_session", session)
+    key = f"test:stale:{time.time_ns()}"
+    memory_cache.set(key, main._ENTRY_HEADER.pack(time.time() - 1) + b'"stale"', ttl=60)
+
+    async def scenario():
+        release = asyncio.Event()
+        builds = []
+
+        async def build(db):
+            builds.append(1)
+            await release.wait()
+            return _Model(b'"fresh"')
+
+        served = await asyncio.gather(*(main._cached_json(key, False, build, None) for _ in range(5)))
+        assert builds == [1]  # 요청 5개, 백그라운드 갱신 1번
+        release.set()
+        while main._single_flight.in_flight(key):
+            await asyncio.sleep(0.01)
+        return served, builds, await main._cached_json(key, False, build, None)
+
+    served, builds, after = asyncio.run(scenario())
+
+    assert served == [(b'"stale"', False)] * 5  # 갱신을 기다리지 않고 stale 응답
+    assert builds == [1]
+    assert after == (b'"fresh"', False)
@@ -0,0 +1,58 @@
+"""URL-seen Bloom 필터 테스트 (임시 SQLite DB)"""
+
+import os
+import sys
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend import models  # noqa: E402
+from backend.database import Base  # noqa: E402
+from backend.url_index import UrlSeenIndex  # noqa: E402
+
+
+def _session(tmp_path, urls):
+    engine = create_engine(f"sqlite:///{tmp_path / 'articles.db'}")
+    Base.metadata.create_all(engine, tables=[models.Article.__table__, models.ArticleCount.__table__])
+    db = sessionmaker(bind=engine)()
+    db.add_all(models.Article(title=url, url=url) for url in urls)
+    db.commit()
+    return db
+
+
+def test_sync_builds_filter_and_catches_up_from_file(tmp_path):
+    db = _session(tmp_path, [f"https://example.com/a/{i}" for i in range(500)])
+    path = tmp_path / "urls.bloom"
+
+    UrlSeenIndex(path).sync(db)  # 파일이 없으므로 DB 전체로 생성
+    db.add(models.Article(title="new", url="https://example.com/new"))
+    db.commit()
+
+    index = UrlSeenIndex(path)
+    index.sync(db)  # 파일 로드 후 새 아티클만 추가
+
+    assert index.count == 501
+    known = [f"https://example.com/a/{i}" for i in range(500)] + ["https://example.com/new"]
+    assert index.maybe_seen(known) == known  # 거짓 음성 없음
+    unknown = [f"https://other.org/{i}" for i in range(5000)]
+    assert len(index.maybe_seen(unknown)) < 25  # 목표 오탐률 0.1%보다 훨씬 낮음 (용량 대비 적은 항목)
+
+
+def test_added_urls_persist_and_missing_filter_defers_to_db(tmp_path):
+    db = _session(tmp_path, ["https://example.com/1"])
+    path = tmp_path / "urls.bloom"
+
+    empty = UrlSeenIndex(path)
+    assert empty.might_contain("https://anything.example/")  # 로드 전에는 모두 DB로 확인
+
+    index = UrlSeenIndex(path)
+    index.sync(db)
+    index.add("https://example.com/2", article_id=2)
+    index.save()
+
+    reloaded = UrlSeenIndex(path)
+    assert reloaded._load()
+    assert reloaded.might_contain("https://example.com/2")
+    assert reloaded.max_article_id == 2
@@ -0,0 +1,247 @@
+"""수집한 URL의 Bloom 필터 (URL-seen 인덱스)
+
+수집기는 항목마다 관련성 필터(LLM)나 efetch 같은 비싼 작업을 하기 전에 이미
+저장된 URL인지 알아야 한다. 매번 DB에 큰 IN (...) 쿼리를 보내는 대신 articles.url
+전체를 담은 Bloom 필터로 먼저 거른다.
+
+- 필터에 없으면 확실히 새 URL이다 (DB 조회 없음).
+- 필터에 있으면 오탐(URL_INDEX_FP_RATE)일 수 있으므로 DB로 확인한다 (DB가 기준).
+
+파일은 헤더 + 비트 배열이며 통째로 읽으므로 수십만 건이어도 로드는 수 ms다.
+헤더의 max_article_id 이후 아티클은 sync()가 DB에서 추가하고, 용량을 넘거나
+DB가 바뀌면(최대 ID 감소) 다시 만든다. 삭제된 아티클은 오탐으로만 남는다.
+
+    python -m backend.url_index rebuild   # DB 전체로 필터 재생성
+"""
+
+import hashlib
+import logging
+import math
+import os
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+from .config import BACKEND_DIR, settings
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"URLBLOOM"
+FORMAT_VERSION = 1
+# magic, version, 비트 수, 해시 수, 용량, 항목 수, 마지막 아티클 ID
+_HEADER = struct.Struct("<8sIQIQQQ")
+MIN_CAPACITY = 100_000
+GROWTH = 2  # 재생성 시 용량 = 현재 항목 수 × GROWTH
+
+
+def _optimal_size(capacity: int, fp_rate: float) -> Tuple[int, int]:
+    """(비트 수, 해시 함수 수)"""
+    bits = math.ceil(-capacity * math.log(fp_rate) / (math.log(2) ** 2))
+    bits = (bits + 7) // 8 * 8
+    hashes = max(1, round(bits / capacity * math.log(2)))
+    return bits, hashes
+
+
+class UrlSeenIndex:
+    """articles.url의 Bloom 필터
+
+    Args:
+        path: 필터 파일 경로
+        fp_rate: 용량까지 채웠을 때의 목표 오탐률
+    """
+
+    def __init__(self, path, fp_rate: float = 0.001):
+        self.path = Path(path)
+        self.fp_rate = fp_rate
+        self._lock = threading.Lock()
+        self._bits: Optional[bytearray] = None
+        self._n_bits = 0
+        self._n_hashes = 0
+        self.capacity = 0
+        self.count = 0
+        self.max_article_id = 0
+        self._dirty = False
+
+    # ── 조회 / 추가 ────────────────────────────────────────
+
+    def _positions(self, url: str) -> Iterable[int]:
+        digest = hashlib.blake2b(url.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self._n_bits for i in range(self._n_hashes))
+
+    def might_contain(self, url: str) -> bool:
+        """False면 확실히 저장되지 않은 URL (필터가 없으면 항상 True)"""
+        bits = self._bits
+        if bits is None:
+            return True
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in self._positions(url))
+
+    def maybe_seen(self, urls: Iterable[str]) -> List[str]:
+        """DB 확인이 필요한 URL (필터에 있는 것)만 반환"""
+        return [url for url in urls if self.might_contain(url)]
+
+    def _add(self, url: str) -> None:
+        bits = self._bits
+        for p in self._positions(url):
+            bits[p >> 3] |= 1 << (p & 7)
+        self.count += 1
+
+    def add(self, url: str, article_id: Optional[int] = None) -> None:
+        """저장된 URL 추가 (필터가 아직 없으면 무시 — 다음 sync에서 DB로부터 반영)"""
+        if not url:
+            return
+        with self._lock:
+            if self._bits is None:
+                return
+            self._add(url)
+            if article_id is not None:
+                self.max_article_id = max(self.max_article_id, article_id)
+            self._dirty = True
+
+    # ── 생성 / 동기화 ──────────────────────────────────────
+
+    def _reset(self, capacity: int) -> None:
+        self.capacity = max(capacity, MIN_CAPACITY)
+        self._n_bits, self._n_hashes = _optimal_size(self.capacity, self.fp_rate)
+        self._bits = bytearray(self._n_bits // 8)
+        self.count = 0
+        self.max_article_id = 0
+
+    def _extend(self, batches: Iterable[List[tuple]]) -> int:
+        added = 0
+        for batch in batches:
+            for article_id, url in batch:
+                if url:
+                    self._add(url)
+                    added += 1
+                self.max_article_id = max(self.max_article_id, article_id)
+        return added
+
+    def rebuild(self, db) -> int:
+        """DB의 전체 URL로 재생성하고 저장, 항목 수 반환"""
+        from . import crud
+
+        with self._lock:
+            try:
+                self._reset(crud.get_articles_count(db) * GROWTH)
+                self._extend(crud.iter_article_urls(db))
+            except BaseException:
+                self._bits = None  # 일부만 채운 필터는 새 URL을 놓치므로 사용하지 않음
+                raise
+            self._save()
+        logger.info(
+            f"URL 인덱스 생성: {self.count}건 (용량 {self.capacity}, "
+            f"{self._n_bits // 8 / 1024:.0f}KB, 해시 {self._n_hashes}개)"
+        )
+        return self.count
+
+    def sync(self, db) -> None:
+        """파일을 로드하고 이후 저장된 아티클을 DB에서 반영 (필요하면 재생성)"""
+        from . import crud
+
+        with self._lock:
+            if self._bits is None:
+                self._load()
+            stale = self._bits is None or crud.get_max_article_id(db) < self.max_article_id
+            if not stale:
+                try:
+                    added = self._extend(crud.iter_article_urls(db, after_id=self.max_article_id))
+                except BaseException:
+                    self._bits = None
+                    raise
+                if added:
+                    logger.info(f"URL 인덱스 동기화: {added}건 추가")
+                    self._dirty = True
+                stale = self.count > self.capacity
+            if not stale:
+                self._save_if_dirty()
+                return
+        self.rebuild(db)
+
+    # ── 파일 ────────────────────────────────────────────────
+
+    def _load(self) -> bool:
+        started = time.perf_counter()
+        try:
+            data = self.path.read_bytes()
+        except FileNotFoundError:
+            return False
+        try:
+            magic, version, n_bits, n_hashes, capacity, count, max_id = _HEADER.unpack_from(data)
+        except struct.error:
+            magic, version = b"", 0
+        if magic != MAGIC or version != FORMAT_VERSION or len(data) != _HEADER.size + n_bits // 8:
+            logger.warning(f"URL 인덱스 파일 형식 불일치, 재생성합니다: {self.path}")
+            return False
+
+        self._bits = bytearray(data[_HEADER.size:])
+        self._n_bits, self._n_hashes = n_bits, n_hashes
+        self.capacity, self.count, self.max_article_id = capacity, count, max_id
+        self._dirty = False
+        logger.info(
+            f"URL 인덱스 로드: {count}건 ({(time.perf_counter() - started) * 1000:.1f}ms)"
+        )
+        return True
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        header = _HEADER.pack(
+            MAGIC, FORMAT_VERSION, self._n_bits, self._n_hashes,
+            self.capacity, self.count, self.max_article_id,
+        )
+        tmp = self.path.with_name(f"{self.path.name}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(header)
+            f.write(self._bits)
+        os.replace(tmp, self.path)
+        self._dirty = False
+
+    def _save_if_dirty(self) -> None:
+        if self._dirty and self._bits is not None:
+            self._save()
+
+    def save(self) -> None:
+        """추가된 URL이 있으면 파일에 기록"""
+        with self._lock:
+            self._save_if_dirty()
+
+
+_index: Optional[UrlSeenIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_url_index() -> UrlSeenIndex:
+    """전역 URL 인덱스 (로드는 sync()에서)"""
+    global _index
+
+    with _index_lock:
+        if _index is None:
+            path = settings.URL_INDEX_PATH or BACKEND_DIR / "url_index.bloom"
+            _index = UrlSeenIndex(path, fp_rate=settings.URL_INDEX_FP_RATE)
+        return _index
+
+
+def rebuild_from_db() -> int:
+    """DB의 전체 URL로 필터 재생성"""
+    from .database import ReadSessionLocal
+
+    db = ReadSessionLocal()
+    try:
+        return get_url_index().rebuild(db)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    )
+    if sys.argv[1:] != ["rebuild"]:
+        print("사용법: python -m backend.url_index rebuild")
+        sys.exit(2)
+    rebuild_from_db()
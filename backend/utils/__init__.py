@@ -1,7 +1,21 @@
-"""유틸리티 모듈"""
+"""유틸리티 모듈
 
-from .retry import fetch_with_retry, RETRY_CONFIG, OPENAI_RETRY_CONFIG
-from .cache import get_cache, cached, invalidate_cache, TTLCache
+retry는 requests/tenacity를 불러오므로 처음 접근할 때 임포트한다
+(API 서버는 캐시 유틸리티만 사용).
+"""
+
+from .cache import (
+    get_cache,
+    cached,
+    configure_cache,
+    invalidate_cache,
+    generation_key,
+    set_generation_provider,
+    TTLCache,
+)
+from .singleflight import SingleFlight
+from .rate_limit import TokenBucket, get_rate_limiter, rate_limiter_stats
+from .canonical import canonical_id, identity_keys, normalize_doi, normalize_url
 
 __all__ = [
     "fetch_with_retry",
@@ -9,6 +23,27 @@ __all__ = [
     "OPENAI_RETRY_CONFIG",
     "get_cache",
     "cached",
+    "configure_cache",
     "invalidate_cache",
+    "generation_key",
+    "set_generation_provider",
     "TTLCache",
+    "SingleFlight",
+    "TokenBucket",
+    "get_rate_limiter",
+    "rate_limiter_stats",
+    "canonical_id",
+    "identity_keys",
+    "normalize_doi",
+    "normalize_url",
 ]
+
+_LAZY_RETRY_EXPORTS = {"fetch_with_retry", "RETRY_CONFIG", "OPENAI_RETRY_CONFIG"}
+
+
+def __getattr__(name):
+    if name in _LAZY_RETRY_EXPORTS:
+        from . import retry
+
+        return getattr(retry, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,79 +1,255 @@
-"""간단한 TTL 캐시 유틸리티"""
+"""TTL 캐시 유틸리티
 
+항목 수 / 바이트 상한이 있는 LRU + TTL 인메모리 캐시. FastAPI 스레드풀에서
+동시에 호출되므로 모든 연산은 락으로 보호된다.
+
+멀티 프로세스 배포에서는 configure_cache(backend="sqlite" | "redis")로
+워커 간 공유 백엔드(cache_backends)를 사용할 수 있다.
+"""
+
+import sys
 import time
+import pickle
 import hashlib
 import logging
+import threading
+from collections import OrderedDict
 from functools import wraps
-from typing import Dict, Any, Callable, Optional
+from typing import Any, Callable, Dict, Optional
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # 64MB
+DEFAULT_SWEEP_INTERVAL = 60  # 초
+
+
+def _make_key(*args, **kwargs) -> str:
+    """인자들로부터 캐시 키 생성"""
+    key_data = str(args) + str(sorted(kwargs.items()))
+    return hashlib.md5(key_data.encode()).hexdigest()
+
+
+def _estimate_size(value: Any) -> int:
+    """캐시 값의 대략적인 메모리 크기 (바이트)"""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode())
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "size")
+
+    def __init__(self, value: Any, expires_at: float, size: int):
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+
 
 class TTLCache:
-    """TTL(Time-To-Live) 기반 인메모리 캐시"""
+    """TTL(Time-To-Live) 기반 인메모리 LRU 캐시
+
+    - max_entries / max_bytes를 넘으면 가장 오래 사용되지 않은 항목부터 제거 (O(1))
+    - 만료 항목은 조회 시 제거되고, sweep_interval마다 저장 시점에 일괄 정리
+    - hit/miss/eviction/expiration 카운터는 stats()로 조회
+    """
 
-    def __init__(self, default_ttl: int = 300):
+    def __init__(
+        self,
+        default_ttl: int = 300,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        sweep_interval: float = DEFAULT_SWEEP_INTERVAL,
+    ):
         """
         Args:
             default_ttl: 기본 캐시 유효 시간 (초), 기본값 5분
+            max_entries: 최대 항목 수
+            max_bytes: 최대 바이트 (값 크기 추정치 합계)
+            sweep_interval: 만료 항목 일괄 정리 주기 (초)
         """
-        self._cache: Dict[str, Dict[str, Any]] = {}
+        self._cache: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.RLock()
         self._default_ttl = default_ttl
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._sweep_interval = sweep_interval
+        self._bytes = 0
+        self._last_sweep = time.monotonic()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
 
     def _make_key(self, *args, **kwargs) -> str:
         """인자들로부터 캐시 키 생성"""
-        key_data = str(args) + str(sorted(kwargs.items()))
-        return hashlib.md5(key_data.encode()).hexdigest()
+        return _make_key(*args, **kwargs)
+
+    def _remove(self, key: str) -> None:
+        entry = self._cache.pop(key)
+        self._bytes -= entry.size
+
+    def _evict_overflow(self) -> None:
+        while self._cache and (
+            len(self._cache) > self._max_entries or self._bytes > self._max_bytes
+        ):
+            key = next(iter(self._cache))
+            self._remove(key)
+            self._evictions += 1
+
+    def _sweep(self, now: float) -> int:
+        expired_keys = [k for k, v in self._cache.items() if now > v.expires_at]
+        for key in expired_keys:
+            self._remove(key)
+        self._expirations += len(expired_keys)
+        self._last_sweep = now
+        return len(expired_keys)
+
+    def configure(
+        self,
+        default_ttl: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        sweep_interval: Optional[float] = None,
+    ) -> None:
+        """상한/주기 변경 (초과분은 즉시 제거)"""
+        with self._lock:
+            if default_ttl is not None:
+                self._default_ttl = default_ttl
+            if max_entries is not None:
+                self._max_entries = max_entries
+            if max_bytes is not None:
+                self._max_bytes = max_bytes
+            if sweep_interval is not None:
+                self._sweep_interval = sweep_interval
+            self._evict_overflow()
 
     def get(self, key: str) -> Optional[Any]:
         """캐시에서 값 조회"""
-        if key not in self._cache:
-            return None
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
 
-        entry = self._cache[key]
-        if time.time() > entry["expires_at"]:
-            del self._cache[key]
-            return None
+            if time.monotonic() > entry.expires_at:
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return None
 
-        return entry["value"]
+            self._cache.move_to_end(key)
+            self._hits += 1
+            return entry.value
 
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
-        """캐시에 값 저장"""
+        """캐시에 값 저장 (max_bytes보다 큰 값은 저장하지 않음)"""
         ttl = ttl or self._default_ttl
-        self._cache[key] = {
-            "value": value,
-            "expires_at": time.time() + ttl,
-        }
+        size = _estimate_size(value)
+
+        with self._lock:
+            now = time.monotonic()
+            if key in self._cache:
+                self._remove(key)
+            if size > self._max_bytes:
+                logger.debug(f"Cache skip (too large: {size} bytes): {key}")
+                return
+
+            self._cache[key] = _Entry(value, now + ttl, size)
+            self._bytes += size
+
+            if now - self._last_sweep > self._sweep_interval:
+                self._sweep(now)
+            self._evict_overflow()
 
     def delete(self, key: str) -> None:
         """캐시에서 값 삭제"""
-        self._cache.pop(key, None)
+        with self._lock:
+            if key in self._cache:
+                self._remove(key)
+
+    def delete_prefix(self, prefix: str) -> int:
+        """접두사가 일치하는 항목 삭제, 삭제된 항목 수 반환"""
+        with self._lock:
+            keys = [k for k in self._cache if k.startswith(prefix)]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
 
     def clear(self) -> None:
         """전체 캐시 초기화"""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
+            self._bytes = 0
 
     def cleanup(self) -> int:
         """만료된 항목 정리, 삭제된 항목 수 반환"""
-        now = time.time()
-        expired_keys = [
-            k for k, v in self._cache.items() if now > v["expires_at"]
-        ]
-        for key in expired_keys:
-            del self._cache[key]
-        return len(expired_keys)
+        with self._lock:
+            return self._sweep(time.monotonic())
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "backend": "memory",
+                "entries": len(self._cache),
+                "bytes": self._bytes,
+                "max_entries": self._max_entries,
+                "max_bytes": self._max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
 
 
 # 전역 캐시 인스턴스
 _cache = TTLCache(default_ttl=300)
 
+# 데이터 세대 조회 함수 (set_generation_provider로 등록)
+_generation_provider: Optional[Callable[[], int]] = None
+
+
+def set_generation_provider(provider: Optional[Callable[[], int]]) -> None:
+    """캐시 키에 붙일 데이터 세대 조회 함수 등록"""
+    global _generation_provider
+    _generation_provider = provider
+
+
+def current_generation() -> int:
+    """현재 데이터 세대 (등록된 조회 함수가 없으면 0)"""
+    return _generation_provider() if _generation_provider else 0
+
+
+def generation_key(key: str, generation: Optional[int] = None) -> str:
+    """세대가 포함된 캐시 키 생성
+
+    세대가 바뀌면 이전 세대의 항목은 더 이상 조회되지 않고 TTL 만료 시 정리된다.
+    세대는 키 뒤에 붙이므로 invalidate_cache의 접두사 무효화도 그대로 동작한다.
+    """
+    if generation is None:
+        generation = current_generation()
+    return f"{key}@g{generation}"
+
 
-def cached(ttl: int = 300, key_prefix: str = ""):
+def cached(ttl: int = 300, key_prefix: str = "", versioned: bool = False):
     """함수 결과를 캐싱하는 데코레이터
 
     Args:
         ttl: 캐시 유효 시간 (초)
         key_prefix: 캐시 키 접두사
+        versioned: True면 키에 데이터 세대를 포함 (데이터 변경 시 자동 무효화)
 
     Example:
         @cached(ttl=60, key_prefix="articles")
@@ -85,7 +261,9 @@ def cached(ttl: int = 300, key_prefix: str = ""):
         @wraps(func)
         def wrapper(*args, **kwargs):
             # 캐시 키 생성
-            key = f"{key_prefix}:{func.__name__}:{_cache._make_key(*args, **kwargs)}"
+            key = f"{key_prefix}:{func.__name__}:{_make_key(*args, **kwargs)}"
+            if versioned:
+                key = generation_key(key)
 
             # 캐시 조회
             result = _cache.get(key)
@@ -110,11 +288,42 @@ def invalidate_cache(key_prefix: str = "") -> None:
         _cache.clear()
         return
 
-    keys_to_delete = [k for k in _cache._cache.keys() if k.startswith(key_prefix)]
-    for key in keys_to_delete:
-        _cache.delete(key)
+    _cache.delete_prefix(key_prefix)
+
+
+def configure_cache(backend: str = "memory", url: Optional[str] = None, **options) -> None:
+    """전역 캐시 백엔드 및 상한 설정
+
+    Args:
+        backend: 'memory' (프로세스별 TTLCache), 'sqlite' (호스트 내 워커 공유 파일),
+            'redis' (Redis 프로토콜 서버 공유)
+        url: sqlite는 캐시 파일 경로, redis는 접속 URL
+        **options: default_ttl, max_entries, max_bytes, sweep_interval
+            (redis는 default_ttl만 사용, 용량은 서버 maxmemory 정책을 따름)
+    """
+    global _cache
+
+    if backend == "memory":
+        if isinstance(_cache, TTLCache):
+            _cache.configure(**options)
+        else:
+            _cache = TTLCache(**options)
+    elif backend == "sqlite":
+        from .cache_backends import SQLiteCache
+
+        if not url:
+            raise ValueError("sqlite 캐시 백엔드에는 파일 경로(url)가 필요합니다.")
+        _cache = SQLiteCache(url, **options)
+    elif backend == "redis":
+        from .cache_backends import RedisCache
+
+        _cache = RedisCache(url=url, default_ttl=options.get("default_ttl", 300))
+    else:
+        raise ValueError(f"지원하지 않는 캐시 백엔드: {backend}")
+
+    logger.info(f"응답 캐시 백엔드: {backend}")
 
 
-def get_cache() -> TTLCache:
-    """전역 캐시 인스턴스 반환"""
+def get_cache():
+    """전역 캐시 인스턴스 반환 (TTLCache 또는 공유 백엔드)"""
     return _cache
@@ -0,0 +1,383 @@
+"""프로세스 간 공유 캐시 백엔드
+
+uvicorn/gunicorn 워커가 여러 개면 인메모리 TTLCache는 워커마다 따로 존재해
+적중률이 워커 수만큼 떨어진다. 아래 백엔드는 TTLCache와 같은 인터페이스
+(get/set/delete/delete_prefix/clear/cleanup/stats)로 항목을 공유한다.
+
+- SQLiteCache: 같은 호스트의 워커끼리 공유하는 파일 캐시 (WAL)
+- RedisCache: Redis 프로토콜 서버 공유 캐시 (redis 패키지 필요)
+
+값은 pickle 없이 저장한다 — bytes는 그대로, 그 외는 JSON(datetime 포함)으로.
+공유 저장소의 데이터를 역직렬화해도 코드가 실행되지 않으며, 형식을 모르는
+항목(이전 pickle 항목 등)은 miss로 처리한다. 캐시 키에 데이터 세대가 포함되므로(generation_key)
+세대 무효화는 백엔드와 관계없이 모든 워커에서 동일하게 동작한다.
+캐시 장애는 요청을 실패시키지 않고 miss로 처리한다.
+"""
+
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Redis는 선택적 의존성
+try:
+    import redis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+
+# 저장 형식 태그 (값 앞 1바이트)
+_BYTES = b"b"
+_JSON = b"j"
+_DATETIME_KEY = "__datetime__"
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {_DATETIME_KEY: value.isoformat()}
+    raise TypeError(f"캐시에 저장할 수 없는 타입: {type(value).__name__}")
+
+
+def _json_object(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 1 and _DATETIME_KEY in obj:
+        return datetime.fromisoformat(obj[_DATETIME_KEY])
+    return obj
+
+
+def encode_value(value: Any) -> bytes:
+    """캐시 값 → 저장 바이트 (bytes는 그대로, 그 외는 JSON). 저장할 수 없으면 TypeError"""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return _BYTES + bytes(value)
+    return _JSON + json.dumps(value, default=_json_default, ensure_ascii=False).encode()
+
+
+def decode_value(raw: bytes) -> Optional[Any]:
+    """저장 바이트 → 캐시 값 (형식을 모르면 None)"""
+    raw = bytes(raw)
+    tag, payload = raw[:1], raw[1:]
+    if tag == _BYTES:
+        return payload
+    if tag == _JSON:
+        try:
+            return json.loads(payload, object_hook=_json_object)
+        except ValueError:
+            return None
+    return None
+
+
+class SQLiteCache:
+    """SQLite 파일 기반 공유 캐시
+
+    TTL은 벽시계 시간(time.time) 기준이라 프로세스 간에 일관된다.
+    LRU는 accessed_at 기준 근사치이며, 읽기마다 쓰기가 발생하지 않도록
+    touch_interval이 지난 항목만 갱신한다.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        default_ttl: int = 300,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        sweep_interval: float = 60,
+        touch_interval: float = 30,
+    ):
+        self._path = path
+        self._default_ttl = default_ttl
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._sweep_interval = sweep_interval
+        self._touch_interval = touch_interval
+        self._last_sweep = 0.0
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._errors = 0
+
+        self._conn = sqlite3.connect(
+            path, timeout=5, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cache_accessed ON cache_entries (accessed_at)"
+        )
+
+    def _on_error(self, op: str, e: Exception) -> None:
+        self._errors += 1
+        logger.warning(f"SQLite 캐시 {op} 실패: {e}")
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시에서 값 조회"""
+        now = time.time()
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT value, expires_at, accessed_at FROM cache_entries WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    self._misses += 1
+                    return None
+
+                value, expires_at, accessed_at = row
+                if now > expires_at:
+                    self._conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+                    self._expirations += 1
+                    self._misses += 1
+                    return None
+
+                if now - accessed_at > self._touch_interval:
+                    self._conn.execute(
+                        "UPDATE cache_entries SET accessed_at = ? WHERE key = ?", (now, key)
+                    )
+                self._hits += 1
+            except sqlite3.Error as e:
+                self._on_error("조회", e)
+                self._misses += 1
+                return None
+
+        return decode_value(value)
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """캐시에 값 저장"""
+        ttl = ttl or self._default_ttl
+        try:
+            blob = encode_value(value)
+        except (TypeError, ValueError) as e:
+            self._on_error("직렬화", e)
+            return
+        if len(blob) > self._max_bytes:
+            return
+
+        now = time.time()
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache_entries "
+                    "(key, value, expires_at, accessed_at, size) VALUES (?, ?, ?, ?, ?)",
+                    (key, blob, now + ttl, now, len(blob)),
+                )
+                if now - self._last_sweep > self._sweep_interval:
+                    self._sweep(now)
+                self._evict_overflow()
+            except sqlite3.Error as e:
+                self._on_error("저장", e)
+
+    def _sweep(self, now: float) -> int:
+        deleted = self._conn.execute(
+            "DELETE FROM cache_entries WHERE expires_at < ?", (now,)
+        ).rowcount
+        self._expirations += deleted
+        self._last_sweep = now
+        return deleted
+
+    def _evict_overflow(self) -> None:
+        count, total_bytes = self._conn.execute(
+            "SELECT count(*), total(size) FROM cache_entries"
+        ).fetchone()
+        if count <= self._max_entries and total_bytes <= self._max_bytes:
+            return
+
+        victims = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM cache_entries ORDER BY accessed_at"
+        ):
+            if count <= self._max_entries and total_bytes <= self._max_bytes:
+                break
+            victims.append((key,))
+            count -= 1
+            total_bytes -= size
+
+        self._conn.executemany("DELETE FROM cache_entries WHERE key = ?", victims)
+        self._evictions += len(victims)
+
+    def delete(self, key: str) -> None:
+        """캐시에서 값 삭제"""
+        with self._lock:
+            try:
+                self._conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+            except sqlite3.Error as e:
+                self._on_error("삭제", e)
+
+    def delete_prefix(self, prefix: str) -> int:
+        """접두사가 일치하는 항목 삭제, 삭제된 항목 수 반환"""
+        with self._lock:
+            try:
+                return self._conn.execute(
+                    "DELETE FROM cache_entries WHERE substr(key, 1, ?) = ?",
+                    (len(prefix), prefix),
+                ).rowcount
+            except sqlite3.Error as e:
+                self._on_error("삭제", e)
+                return 0
+
+    def clear(self) -> None:
+        """전체 캐시 초기화"""
+        with self._lock:
+            try:
+                self._conn.execute("DELETE FROM cache_entries")
+            except sqlite3.Error as e:
+                self._on_error("초기화", e)
+
+    def cleanup(self) -> int:
+        """만료된 항목 정리, 삭제된 항목 수 반환"""
+        with self._lock:
+            try:
+                return self._sweep(time.time())
+            except sqlite3.Error as e:
+                self._on_error("정리", e)
+                return 0
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계 (hit/miss 등은 현재 프로세스 기준)"""
+        with self._lock:
+            try:
+                entries, total_bytes = self._conn.execute(
+                    "SELECT count(*), total(size) FROM cache_entries"
+                ).fetchone()
+            except sqlite3.Error:
+                entries, total_bytes = None, None
+            lookups = self._hits + self._misses
+            return {
+                "backend": "sqlite",
+                "path": self._path,
+                "entries": entries,
+                "bytes": int(total_bytes) if total_bytes is not None else None,
+                "max_entries": self._max_entries,
+                "max_bytes": self._max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "errors": self._errors,
+            }
+
+
+class RedisCache:
+    """Redis 프로토콜 공유 캐시
+
+    TTL은 Redis의 키 만료(EX)를 사용하고, 용량 제한은 서버의
+    maxmemory / maxmemory-policy(allkeys-lru 권장)에 맡긴다.
+    테스트에서는 client에 로컬 대체 서버(fakeredis 등) 클라이언트를 넘길 수 있다.
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        client: Any = None,
+        default_ttl: int = 300,
+        namespace: str = "mdinfo:cache:",
+    ):
+        if client is None:
+            if not REDIS_AVAILABLE:
+                raise ImportError("redis 패키지가 설치되지 않았습니다. (pip install redis)")
+            client = redis.Redis.from_url(url or "redis://localhost:6379/0")
+
+        self._client = client
+        self._default_ttl = default_ttl
+        self._namespace = namespace
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._errors = 0
+
+    def _count(self, attr: str) -> None:
+        with self._lock:
+            setattr(self, attr, getattr(self, attr) + 1)
+
+    def _on_error(self, op: str, e: Exception) -> None:
+        self._count("_errors")
+        logger.warning(f"Redis 캐시 {op} 실패: {e}")
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시에서 값 조회"""
+        try:
+            raw = self._client.get(self._namespace + key)
+        except Exception as e:
+            self._on_error("조회", e)
+            raw = None
+
+        if raw is None:
+            self._count("_misses")
+            return None
+
+        value = decode_value(raw)
+        self._count("_hits" if value is not None else "_misses")
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """캐시에 값 저장"""
+        ttl = ttl or self._default_ttl
+        try:
+            self._client.set(self._namespace + key, encode_value(value), ex=ttl)
+        except Exception as e:
+            self._on_error("저장", e)
+
+    def delete(self, key: str) -> None:
+        """캐시에서 값 삭제"""
+        try:
+            self._client.delete(self._namespace + key)
+        except Exception as e:
+            self._on_error("삭제", e)
+
+    def delete_prefix(self, prefix: str) -> int:
+        """접두사가 일치하는 항목 삭제 (SCAN), 삭제된 항목 수 반환"""
+        pattern = re.sub(r"([*?\[\]\\])", r"\\\1", self._namespace + prefix) + "*"
+        deleted = 0
+        try:
+            batch = []
+            for key in self._client.scan_iter(match=pattern, count=500):
+                batch.append(key)
+                if len(batch) >= 500:
+                    deleted += self._client.delete(*batch)
+                    batch = []
+            if batch:
+                deleted += self._client.delete(*batch)
+        except Exception as e:
+            self._on_error("삭제", e)
+        return deleted
+
+    def clear(self) -> None:
+        """네임스페이스 내 전체 항목 삭제"""
+        self.delete_prefix("")
+
+    def cleanup(self) -> int:
+        """Redis가 만료를 직접 처리하므로 정리할 항목 없음"""
+        return 0
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계 (hit/miss는 현재 프로세스 기준)"""
+        lookups = self._hits + self._misses
+        return {
+            "backend": "redis",
+            "namespace": self._namespace,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            "errors": self._errors,
+        }
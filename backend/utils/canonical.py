@@ -0,0 +1,107 @@
+"""아티클 정규 식별자 (canonical identity)
+
+같은 논문이 PubMed(pubmed.ncbi.nlm.nih.gov/<pmid>/), Google Scholar(출판사
+pub_url / eprint_url), 저널 RSS로 각각 다른 링크를 달고 들어온다. url unique로는
+잡히지 않으므로 링크와 DOI에서 식별자를 뽑아 비교한다.
+
+식별자는 우선순위 순서로
+1. doi:<소문자 DOI>   — 수집기가 준 DOI, 없으면 URL에 들어 있는 DOI
+2. pmid:<PMID>        — PubMed URL
+3. url:<정규화 URL>   — 스킴 무시, 호스트 소문자/www 제거, 추적 파라미터·fragment 제거
+
+identity_keys()는 아이템이 가진 식별자를 모두, canonical_id()는 첫 번째를 반환한다.
+"""
+
+import re
+from typing import List, Optional
+from urllib.parse import parse_qsl, unquote, urlencode, urlsplit
+
+# 추적/유입 경로 파라미터 (값과 관계없이 같은 문서)
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid", "mkt_tok",
+    "ref", "ref_src", "referrer", "af", "rss", "dgcid", "cmpid", "wt.mc_id", "spm",
+}
+TRACKING_PREFIXES = ("utm_", "mc_", "_hs", "hsa_", "pk_", "piwik_")
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+_DOI_RE = re.compile(r"\b(10\.\d{4,9}/[^\s?#&\"'<>]+)", re.IGNORECASE)
+# 출판사 URL에서 DOI 뒤에 붙는 보기 방식 경로
+_DOI_SUFFIXES = ("/full", "/abstract", "/pdf", "/epdf", "/fulltext", "/html", "/meta", ".pdf")
+_PMID_RES = (
+    re.compile(r"^pubmed\.ncbi\.nlm\.nih\.gov/(\d+)(?:[/?]|$)"),
+    re.compile(r"^ncbi\.nlm\.nih\.gov/pubmed/(\d+)(?:[/?]|$)"),
+)
+
+
+def _is_tracking(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def normalize_url(url: str) -> str:
+    """스킴을 뺀 정규화 URL (host/path?query), 해석할 수 없으면 공백 제거한 원문"""
+    url = (url or "").strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+    if not parts.hostname:
+        return url
+
+    host = parts.hostname.rstrip(".")
+    if host.startswith("www."):
+        host = host[4:]
+    if port and port != DEFAULT_PORTS.get(parts.scheme.lower()):
+        host = f"{host}:{port}"
+
+    path = re.sub(r"/{2,}", "/", parts.path).rstrip("/")
+    query = urlencode(sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking(name)
+    ))
+    return f"{host}{path}?{query}" if query else f"{host}{path}"
+
+
+def normalize_doi(doi: str) -> str:
+    """DOI 정규화 (소문자, doi.org / doi: 접두어와 보기 방식 경로 제거). DOI가 아니면 ''"""
+    match = _DOI_RE.search(unquote(doi or ""))
+    if not match:
+        return ""
+    doi = match.group(1).lower().rstrip(".,;)")
+    for suffix in _DOI_SUFFIXES:
+        if doi.endswith(suffix):
+            doi = doi[:-len(suffix)]
+    return doi
+
+
+def extract_pmid(url: str) -> str:
+    """PubMed URL의 PMID (없으면 '')"""
+    normalized = normalize_url(url)
+    for pattern in _PMID_RES:
+        match = pattern.match(normalized)
+        if match:
+            return match.group(1)
+    return ""
+
+
+def identity_keys(link: str, doi: Optional[str] = None) -> List[str]:
+    """아이템의 식별자 목록 (우선순위 순서, 중복 없음)"""
+    keys = []
+    doi = normalize_doi(doi or "") or normalize_doi(link or "")
+    if doi:
+        keys.append(f"doi:{doi}")
+    pmid = extract_pmid(link)
+    if pmid:
+        keys.append(f"pmid:{pmid}")
+    url = normalize_url(link)
+    if url:
+        keys.append(f"url:{url}")
+    return keys
+
+
+def canonical_id(link: str, doi: Optional[str] = None) -> Optional[str]:
+    """대표 식별자 (articles.canonical_id), 링크도 DOI도 없으면 None"""
+    keys = identity_keys(link, doi)
+    return keys[0] if keys else None
@@ -0,0 +1,100 @@
+"""토큰 버킷 요청 속도 제한
+
+외부 서비스(upstream)마다 허용 속도가 다르다 — NCBI는 API 키 없이 초당 3회,
+키가 있으면 10회, Google Scholar는 차단을 피하려면 훨씬 느리게, RSS는 호스트마다.
+고정 sleep 대신 upstream 이름별 토큰 버킷을 공유해 허용 속도까지는 동시에
+요청하고, 넘는 요청만 필요한 만큼 기다리게 한다.
+
+    limiter = get_rate_limiter("ncbi", rate=3)
+    limiter.acquire()            # 스레드
+    await limiter.acquire_async()  # asyncio
+
+버킷은 프로세스 단위이며 스레드와 이벤트 루프에서 함께 사용할 수 있다.
+"""
+
+import asyncio
+import math
+import threading
+import time
+from typing import Dict, Optional
+
+
+class TokenBucket:
+    """초당 rate개 토큰이 채워지고 최대 burst개까지 쌓이는 버킷
+
+    Args:
+        rate: 초당 허용 요청 수 (inf면 제한 없음)
+        burst: 한 번에 연속으로 보낼 수 있는 최대 요청 수 (기본: max(1, rate))
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate if math.isfinite(rate) else 1.0)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+        self._acquired = 0
+        self._waited = 0.0
+
+    def _reserve(self, tokens: float) -> float:
+        """토큰을 예약하고 기다려야 할 시간(초)을 반환 (토큰이 음수가 될 수 있음)"""
+        if not math.isfinite(self.rate):
+            self._acquired += 1
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self._acquired += 1
+            self._waited += wait
+            return wait
+
+    def acquire(self, tokens: float = 1) -> float:
+        """토큰을 받을 때까지 대기 (스레드). 기다린 시간 반환."""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: float = 1) -> float:
+        """토큰을 받을 때까지 대기 (asyncio). 기다린 시간 반환."""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "acquired": self._acquired,
+            "waited_seconds": round(self._waited, 3),
+        }
+
+
+_registry: Dict[str, TokenBucket] = {}
+_registry_lock = threading.Lock()
+
+
+def get_rate_limiter(name: str, rate: float, burst: Optional[float] = None) -> TokenBucket:
+    """upstream 이름별 공유 버킷 (처음 호출할 때의 rate/burst로 생성)
+
+    이름 예: "ncbi", "scholar", "rss:www.jaad.org"
+    """
+    with _registry_lock:
+        bucket = _registry.get(name)
+        if bucket is None:
+            bucket = _registry[name] = TokenBucket(rate, burst)
+        return bucket
+
+
+def rate_limiter_stats() -> Dict[str, Dict[str, float]]:
+    """upstream별 버킷 통계"""
+    with _registry_lock:
+        return {name: bucket.stats() for name, bucket in _registry.items()}
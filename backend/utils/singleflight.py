@@ -0,0 +1,108 @@
+"""단일 비행(single-flight) 요청 병합
+
+캐시 항목이 만료되거나 새 데이터 세대로 바뀐 직후에는 같은 키를 요청하는
+동시 요청이 모두 miss가 되어 DB로 몰린다 (thundering herd).
+SingleFlight는 키마다 진행 중인 계산을 하나만 두고, 나머지 호출자는
+그 결과를 기다렸다가 함께 받는다.
+
+병합 범위는 이벤트 루프(프로세스) 단위다. 워커가 N개면 키당 최대 N번 계산된다.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Set
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """키별 비동기 계산 병합기
+
+    - do(): 진행 중인 계산이 있으면 합류, 없으면 직접 계산 (선두 호출자)
+    - spawn(): 응답을 기다리지 않는 백그라운드 계산 (stale-while-revalidate 갱신용)
+
+    선두 호출자가 취소되면(클라이언트 연결 종료 등) 대기 중이던 호출자 중
+    하나가 다시 선두가 되어 계산한다. 계산 중 예외는 대기자 모두에게 전달된다.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Future] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+        self._leaders = 0
+        self._coalesced = 0
+        self._background = 0
+        self._background_errors = 0
+
+    def _start(self, key: str) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        self._leaders += 1
+        return future
+
+    async def _lead(self, key: str, future: asyncio.Future, fn: Callable[[], Awaitable[Any]]):
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # 대기자가 없어도 "never retrieved" 경고가 나지 않도록
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """key에 대한 계산 결과 반환 (동시 호출은 한 번만 계산)"""
+        while True:
+            future = self._calls.get(key)
+            if future is None:
+                return await self._lead(key, self._start(key), fn)
+
+            self._coalesced += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # 선두가 취소된 경우에만 재시도, 자신이 취소된 경우는 전파
+                if future.cancelled():
+                    continue
+                raise
+
+    def in_flight(self, key: str) -> bool:
+        """key에 대한 계산이 진행 중인지 여부"""
+        return key in self._calls
+
+    def spawn(self, key: str, fn: Callable[[], Awaitable[Any]]) -> bool:
+        """백그라운드로 계산 시작. 이미 진행 중이면 False (중복 갱신 방지)"""
+        if key in self._calls:
+            return False
+
+        task = asyncio.get_running_loop().create_task(self._lead(key, self._start(key), fn))
+        self._tasks.add(task)
+        task.add_done_callback(self._on_background_done)
+        self._background += 1
+        return True
+
+    def _on_background_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            self._background_errors += 1
+            logger.warning(f"백그라운드 캐시 갱신 실패: {type(error).__name__}: {error}")
+
+    def stats(self) -> Dict[str, int]:
+        """병합 통계 (선두 계산 수, 합류한 호출 수, 백그라운드 갱신 수)"""
+        return {
+            "in_flight": len(self._calls),
+            "leaders": self._leaders,
+            "coalesced": self._coalesced,
+            "background_refreshes": self._background,
+            "background_errors": self._background_errors,
+        }